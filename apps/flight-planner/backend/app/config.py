@@ -1,14 +1,38 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import AliasChoices, Field, field_validator
+from pydantic import AliasChoices, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Map API key fields to the keystore secrets that can provide them
+_KEYSTORE_KEYS: Dict[str, List[str]] = {
+    'openweather_api_key': ['OPENWEATHERMAP_API_KEY', 'OPENWEATHER_API_KEY'],
+    'opentopography_api_key': ['OPENTOPOGRAPHY_API_KEY'],
+    'openaip_api_key': ['OPENAIP_API_KEY'],
+}
+
+_PREFETCHED: Optional[Dict[str, Optional[str]]] = None
+
+
+def _prefetched_secrets() -> Dict[str, Optional[str]]:
+    """
+    Fetch every API key secret in one keystore call, on first use.
+
+    The result is kept for the life of the process, missing keys included, so
+    a secret added afterwards needs a restart.
+    """
+    global _PREFETCHED
+    if _PREFETCHED is None:
+        from .secrets import get_secrets
+
+        _PREFETCHED = get_secrets([key for keys in _KEYSTORE_KEYS.values() for key in keys])
+    return _PREFETCHED
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -45,34 +69,42 @@ class Settings(BaseSettings):
         description="Airport cache file path",
     )
     
-    @field_validator('openweather_api_key', 'opentopography_api_key', 'openaip_api_key', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def load_from_keystore(cls, v: Optional[str], info) -> Optional[str]:
-        """Load API keys from keystore if not in environment."""
-        if v is not None:
-            return v
-        
-        # Try to load from keystore
+    def load_from_keystore(cls, data: Any) -> Any:
+        """Fill API keys missing from the environment from the keystore, in one call."""
+        if not isinstance(data, dict):
+            return data
+
+        provided = {str(key).lower() for key, value in data.items() if value is not None}
+        missing = [
+            field
+            for field, keys in _KEYSTORE_KEYS.items()
+            if not provided.intersection([field, *(key.lower() for key in keys)])
+        ]
+        if not missing:
+            return data
+
         try:
-            from .secrets import get_secret
-            field_name = info.field_name
-            
-            # Map field names to potential secret keys
-            key_mapping = {
-                'openweather_api_key': ['OPENWEATHERMAP_API_KEY', 'OPENWEATHER_API_KEY'],
-                'opentopography_api_key': ['OPENTOPOGRAPHY_API_KEY'],
-                'openaip_api_key': ['OPENAIP_API_KEY'],
-            }
-            
-            if field_name in key_mapping:
-                for key in key_mapping[field_name]:
-                    value = get_secret(key)
-                    if value:
-                        return value
+            prefetched = _prefetched_secrets()
         except Exception:
-            pass  # Keystore not available, continue with None
-        
-        return v
+            return data  # Keystore not available, continue with None
+
+        data = dict(data)
+        for field in missing:
+            for key in _KEYSTORE_KEYS[field]:
+                if prefetched.get(key):
+                    data[_input_key(cls, field)] = prefetched[key]
+                    break
+        return data
+
+
+def _input_key(model: type[BaseSettings], field: str) -> str:
+    """Name under which a field is read from input data (its first alias, if any)."""
+    alias = model.model_fields[field].validation_alias
+    if isinstance(alias, AliasChoices):
+        return str(alias.choices[0])
+    return alias or field
 
 
 settings = Settings()
@@ -1,24 +1,72 @@
 from __future__ import annotations
 
+import functools
+import os
+
 from app.utils.paths import add_package_path
 
 add_package_path("shared-sdk/python")
 
-from aviation import haversine_distance, load_airport_cache as _load_airport_cache
-from aviation.airports import AirportDatabase
+from aviation import haversine_distance
+from aviation import load_airport_cache as _load_airport_cache
+from aviation.airports import AirportDatabase, get_airport_database
 
 
 def load_airport_cache():
     return _load_airport_cache()
 
 
-def _database_from_cache() -> AirportDatabase:
-    database = AirportDatabase()
-    database.airports = load_airport_cache()
-    database.loaded = True
+# The stock loader, whose records live in the SDK's default database
+_SDK_LOADER = load_airport_cache
+
+
+def _cache_token() -> tuple:
+    """Identify the current airport data so the parsed database can be reused.
+
+    The loader itself is part of the token so swapping `load_airport_cache`
+    (e.g. in tests) also invalidates the memoized database. A new mtime of
+    the airport file rebuilds it too, reloading the SDK's default database.
+    """
+    path = str(get_airport_database().data_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return (load_airport_cache, path, mtime_ns)
+
+
+# mtime_ns of the airport file the SDK's default database was last loaded
+# from here (None until the first build)
+_sdk_loaded_mtime_ns: int | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_database(token: tuple) -> AirportDatabase:
+    global _sdk_loaded_mtime_ns
+    loader, _, mtime_ns = token
+    if loader is not _SDK_LOADER:
+        database = AirportDatabase()
+        database.airports = loader()
+        database.loaded = True
+        return database
+
+    # Share the SDK's default database (records, code, text and spatial
+    # indexes, also used by the `aviation` helpers in other routers) rather
+    # than indexing a copy of its list.
+    database = get_airport_database()
+    if _sdk_loaded_mtime_ns is not None and mtime_ns != _sdk_loaded_mtime_ns:
+        # The file changed since it was loaded: the SDK database would
+        # otherwise keep serving the old records
+        database.loaded = False
+    database._load_airports()
+    _sdk_loaded_mtime_ns = mtime_ns
     return database
 
 
+def _database_from_cache() -> AirportDatabase:
+    return _build_database(_cache_token())
+
+
 def search_airports_advanced(
     *,
     query: str | None = None,
@@ -37,14 +85,12 @@ def search_airports_advanced(
 
 
 def get_airport_by_code(code: str):
-    return _database_from_cache().get_airport_coordinates(code)
-
-
-def get_airport(code: str):
-    if not code or not str(code).strip():
+    if not code:
         return None
-    return get_airport_by_code(code)
+    code = str(code)
+    if not code.strip():
+        return None
+    return _database_from_cache().get_airport_coordinates(code)
 
 
-def get_airport_coordinates(code: str):
-    return get_airport_by_code(code)
+get_airport = get_airport_coordinates = get_airport_by_code
@@ -4,7 +4,8 @@ Secrets management for Flight Planner.
 This module provides centralized secret loading using the Aviation keystore.
 """
 
-from typing import Optional
+import os
+from typing import Dict, List, Optional
 
 from app.utils.paths import add_package_path
 
@@ -22,7 +23,7 @@ except Exception as e:
     KEYSTORE_AVAILABLE = False
 
 
-def get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
+def _keystore_get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
     """
     Get a secret value from keystore or environment.
     
@@ -37,14 +38,6 @@ def get_secret(key: str, default: Optional[str] = None, required: bool = False)
     Raises:
         SecretNotFoundError: If required=True and secret not found
     """
-    if not KEYSTORE_AVAILABLE:
-        # Fallback to environment variables
-        import os
-        value = os.getenv(key, default)
-        if required and value is None:
-            raise ValueError(f"Required secret not found: {key}")
-        return value
-    
     if required:
         return _secrets.get_required(key)
     elif default is not None:
@@ -53,6 +46,30 @@ def get_secret(key: str, default: Optional[str] = None, required: bool = False)
         return _secrets.get(key)
 
 
+def _env_get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
+    """get_secret when the keystore client is missing: environment variables only."""
+    value = os.getenv(key, default)
+    if required and value is None:
+        raise ValueError(f"Required secret not found: {key}")
+    return value
+
+
+def _env_get_secrets(keys: List[str]) -> Dict[str, Optional[str]]:
+    """get_secrets when the keystore client is missing."""
+    return {key: os.getenv(key) for key in keys}
+
+
+# Pick the backend once at import rather than branching on every lookup.
+# get_secrets(keys) returns each key's value (None if not found) with a
+# single keystore read.
+if KEYSTORE_AVAILABLE:
+    get_secret = _keystore_get_secret
+    get_secrets = _secrets.get_many
+else:
+    get_secret = _env_get_secret
+    get_secrets = _env_get_secrets
+
+
 # Weather API keys
 def get_openweather_api_key() -> Optional[str]:
     """Get OpenWeatherMap API key."""
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
+# Package paths already registered on sys.path by add_package_path
+_added: set[str] = set()
 
+
+@functools.lru_cache(maxsize=1)
 def resolve_packages_root() -> Path:
     for parent in Path(__file__).resolve().parents:
         candidate = parent / "packages"
@@ -15,6 +20,12 @@ def resolve_packages_root() -> Path:
 def add_package_path(relative_path: str) -> Path:
     packages_root = resolve_packages_root()
     package_path = packages_root / relative_path
-    if str(package_path) not in sys.path:
-        sys.path.insert(0, str(package_path))
+    path_str = str(package_path)
+    if path_str in _added:
+        return package_path
+    _added.add(path_str)
+    # Insert at the front so the monorepo packages shadow any same-named
+    # distributions (e.g. a PyPI "keystore") installed in the environment.
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
     return package_path
@@ -80,3 +80,104 @@ def test_airports_search_and_lookup(monkeypatch) -> None:
     assert resp3.status_code == 200
     airport2 = resp3.json()
     assert airport2["icao"] == "K7S5"
+
+
+def test_airport_database_is_parsed_once(monkeypatch) -> None:
+    import app.models.airport as airport_model
+
+    calls = []
+
+    def fake_loader():
+        calls.append(1)
+        return [
+            {
+                "icao": "KPAO",
+                "iata": "PAO",
+                "name": "Palo Alto Airport",
+                "latitude": 37.4611,
+                "longitude": -122.115,
+            }
+        ]
+
+    monkeypatch.setattr(airport_model, "load_airport_cache", fake_loader)
+
+    assert airport_model.get_airport("KPAO")["icao"] == "KPAO"
+    assert airport_model.get_airport("PAO")["icao"] == "KPAO"
+    assert airport_model.search_airports_advanced(query="palo")
+    assert len(calls) == 1
+
+
+def test_lookups_use_sdk_default_database() -> None:
+    import app.models.airport as airport_model
+    from aviation.airports import get_airport_database
+
+    database = get_airport_database()
+
+    assert airport_model._database_from_cache() is database
+    assert airport_model.get_airport("KPAO") == database.get_airport_coordinates("KPAO")
+    assert airport_model.search_airports_advanced(
+        lat=37.46, lon=-122.11, radius_nm=25, limit=5
+    ) == database.search_airports(latitude=37.46, longitude=-122.11, radius_nm=25, limit=5)
+
+
+def test_text_search_matches_sdk_ranking(monkeypatch) -> None:
+    import app.models.airport as airport_model
+    from aviation.airports import AirportDatabase
+
+    # Mid-word and country matches ("bARbara", "frANce") rank alongside
+    # word-prefix and code matches
+    airports = [
+        {"icao": "KSBA", "iata": "SBA", "name": "Santa Barbara", "city": "Santa Barbara",
+         "country": "US", "latitude": 34.43, "longitude": -119.84},
+        {"icao": "LFPG", "iata": "CDG", "name": "Charles de Gaulle", "city": "Paris",
+         "country": "France", "latitude": 49.01, "longitude": 2.55},
+        {"icao": "KANE", "iata": "ANE", "name": "Anoka County", "city": "Blaine",
+         "country": "US", "latitude": 45.15, "longitude": -93.21},
+        {"icao": "PANC", "iata": "ANC", "name": "Anchorage", "city": "Anchorage",
+         "country": "US", "latitude": 61.17, "longitude": -150.0},
+        {"icao": "KAND", "iata": "AND", "name": "Anderson Regional", "city": "Anderson",
+         "country": "US", "latitude": 34.49, "longitude": -82.71},
+        {"icao": "YSSY", "iata": "SYD", "name": "Sydney Kingsford Smith", "city": "Sydney",
+         "country": "Australia", "latitude": -33.95, "longitude": 151.18},
+        {"icao": "KAWO", "iata": "AWO", "name": "Arlington Municipal", "city": "Arlington",
+         "country": "US", "latitude": 48.16, "longitude": -122.16},
+        {"icao": "KACV", "iata": "ACV", "name": "Arcata", "city": "Arcata",
+         "country": "US", "latitude": 40.98, "longitude": -124.11},
+    ]
+    monkeypatch.setattr(airport_model, "load_airport_cache", lambda: airports)
+    full = AirportDatabase()
+    full.airports = airports
+    full.loaded = True
+
+    for query in ("ar", "an", "ANC", "and", "nta", "ance", "sy"):
+        for limit in (1, 2, 3, 5):
+            expected = full.search_airports(query=query, limit=limit)
+            assert airport_model.search_airports_advanced(query=query, limit=limit) == expected
+
+
+def test_sdk_database_reloaded_when_file_changes(monkeypatch, tmp_path) -> None:
+    import json
+    import os
+
+    import app.models.airport as airport_model
+    from aviation.airports import AirportDatabase
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    data = tmp_path / "airports_cache.json"
+    database = AirportDatabase(str(data))
+    monkeypatch.setattr(airport_model, "get_airport_database", lambda: database)
+    monkeypatch.setattr(airport_model, "_sdk_loaded_mtime_ns", None)
+    airport_model._build_database.cache_clear()
+
+    def write(icao, mtime_s):
+        data.write_text(json.dumps([{"icao": icao, "latitude": 37.0, "longitude": -122.0}]))
+        os.utime(data, (mtime_s, mtime_s))
+
+    write("KAAA", 1_700_000_000)
+    assert airport_model.get_airport("KAAA")["icao"] == "KAAA"
+
+    write("KBBB", 1_700_000_100)
+    assert airport_model.get_airport("KBBB")["icao"] == "KBBB"
+    assert airport_model.get_airport("KAAA") is None
+    assert database.airports[0]["icao"] == "KBBB"
+    airport_model._build_database.cache_clear()
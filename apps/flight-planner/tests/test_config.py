@@ -0,0 +1,44 @@
+def test_settings_fill_missing_api_keys_from_keystore(monkeypatch) -> None:
+    import app.config as config
+
+    for name in (
+        "OPENWEATHERMAP_API_KEY",
+        "OPENWEATHER_API_KEY",
+        "OPENTOPOGRAPHY_API_KEY",
+        "OPENAIP_API_KEY",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OPENAIP_API_KEY", "from-env")
+    monkeypatch.setattr(
+        config,
+        "_PREFETCHED",
+        {
+            "OPENWEATHERMAP_API_KEY": None,
+            "OPENWEATHER_API_KEY": "weather-key",
+            "OPENTOPOGRAPHY_API_KEY": "topo-key",
+            "OPENAIP_API_KEY": "keystore-key",
+        },
+    )
+
+    settings = config.Settings(_env_file=None)
+
+    assert settings.openweather_api_key == "weather-key"
+    assert settings.opentopography_api_key == "topo-key"
+    assert settings.openaip_api_key == "from-env"
+
+
+def test_get_secret_env_fallback_keeps_default_and_rereads_misses(monkeypatch) -> None:
+    import pytest
+
+    import app.secrets as secrets
+
+    monkeypatch.delenv("FLIGHT_PLANNER_TEST_SECRET", raising=False)
+
+    assert secrets._env_get_secret("FLIGHT_PLANNER_TEST_SECRET", default="dflt", required=True) == "dflt"
+    with pytest.raises(ValueError):
+        secrets._env_get_secret("FLIGHT_PLANNER_TEST_SECRET", required=True)
+    assert secrets._env_get_secret("FLIGHT_PLANNER_TEST_SECRET") is None
+
+    monkeypatch.setenv("FLIGHT_PLANNER_TEST_SECRET", "set-later")
+    assert secrets._env_get_secret("FLIGHT_PLANNER_TEST_SECRET") == "set-later"
+    assert secrets._env_get_secrets(["FLIGHT_PLANNER_TEST_SECRET"]) == {"FLIGHT_PLANNER_TEST_SECRET": "set-later"}
@@ -3,11 +3,23 @@ Google Calendar Service using Shared SDK
 Wrapper around @aviation/shared-sdk Google Calendar integration
 """
 
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import functools
 import json
-from typing import Optional
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
 from flask import current_app, session
+from sqlalchemy.orm import joinedload
 from app.models import Booking, User
 from app import db
+from app.utils.datetime_utils import utcnow
 
 # Import shared SDK Google Calendar components
 import sys
@@ -17,14 +29,22 @@ sys.path.insert(
     0, os.path.join(os.path.dirname(__file__), "../../..", "packages/shared-sdk/python")
 )
 
-from aviation.integrations.google import (
-    GoogleCalendarAuth,
-    GoogleCalendarClient,
-    GoogleOAuthConfig,
-    GoogleCredentials,
-    CalendarEvent,
-    CalendarDateTime,
-)
+if TYPE_CHECKING:
+    from aviation.integrations.google import (
+        GoogleCalendarAuth,
+        GoogleCredentials,
+        CalendarEvent,
+    )
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SCOPES = [
@@ -32,6 +52,87 @@ SCOPES = [
     "https://www.googleapis.com/auth/calendar.events",
 ]
 
+# Concurrent Google Calendar requests issued by sync_all_bookings
+SYNC_MAX_WORKERS = 8
+
+# sync_all_bookings skips bookings that started longer ago than this
+SYNC_LOOKBACK = timedelta(days=1)
+
+# OAuth state tokens are drawn from a pool filled by one urandom read
+_STATE_TOKEN_BYTES = 32
+_STATE_POOL_SIZE = 64
+_STATE_POOL = collections.deque()
+
+
+def _refill_state_pool() -> None:
+    buf = os.urandom(_STATE_TOKEN_BYTES * _STATE_POOL_SIZE)
+    for i in range(0, len(buf), _STATE_TOKEN_BYTES):
+        token = base64.urlsafe_b64encode(buf[i : i + _STATE_TOKEN_BYTES])
+        _STATE_POOL.append(token.rstrip(b"=").decode("ascii"))
+
+
+def _new_oauth_state() -> str:
+    """Return a fresh single-use OAuth state token."""
+    if not _STATE_POOL:
+        _refill_state_pool()
+    try:
+        return _STATE_POOL.pop()
+    except IndexError:
+        # Another thread drained the pool between refill and pop
+        return secrets.token_urlsafe(_STATE_TOKEN_BYTES)
+
+
+# A forked worker inherits the parent's pool; drop it so no two processes
+# ever hand out the same state token
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_STATE_POOL.clear)
+
+
+_GOOGLE = None
+
+
+def _google():
+    """
+    Import the shared SDK's Google integration on first use.
+
+    It pulls in google-auth and the Google API client, which most requests
+    (and app startup) never need.
+    """
+    global _GOOGLE
+    if _GOOGLE is None:
+        import aviation.integrations.google as google
+
+        _GOOGLE = google
+    return _GOOGLE
+
+
+@functools.lru_cache(maxsize=1)
+def _cred_decoder():
+    """Decodes stored credentials straight into the dataclass, without a dict step."""
+    # Lax mode accepts e.g. an integral float expiry_date, as from_dict does
+    return msgspec.json.Decoder(_google().GoogleCredentials, strict=False)
+
+
+def load_credentials(data: str) -> GoogleCredentials:
+    """Parse credentials stored on the user row."""
+    if msgspec:
+        try:
+            return _cred_decoder().decode(data)
+        except msgspec.ValidationError:
+            pass  # e.g. a fractional expiry_date or a null token_type
+    creds_data = orjson.loads(data) if orjson else json.loads(data)
+    return _google().GoogleCredentials.from_dict(creds_data)
+
+
+def dump_credentials(credentials: GoogleCredentials) -> str:
+    """Serialize credentials for storage on the user row."""
+    if msgspec:
+        return msgspec.json.encode(credentials).decode()
+    if orjson:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(credentials).decode()
+    return json.dumps(credentials.to_dict())
+
 
 class GoogleCalendarService:
     """
@@ -39,23 +140,26 @@ class GoogleCalendarService:
 
     This replaces the old calendar_service.py with shared SDK implementation.
     Maintains API compatibility with existing code.
+
+    One instance is shared by every request (see get_calendar_service), so it
+    holds only the app's OAuth setup; each API call runs on a client of its
+    own built from the calling user's credentials.
     """
 
     def __init__(self):
         self.auth: Optional[GoogleCalendarAuth] = None
-        self.client: Optional[GoogleCalendarClient] = None
         self._initialize_auth()
 
     def _initialize_auth(self):
         """Initialize Google Calendar auth from Flask config"""
-        config = GoogleOAuthConfig(
+        google = _google()
+        config = google.GoogleOAuthConfig(
             client_id=current_app.config.get("GOOGLE_CLIENT_ID", ""),
             client_secret=current_app.config.get("GOOGLE_CLIENT_SECRET", ""),
             redirect_uri=current_app.config.get("GOOGLE_REDIRECT_URI", ""),
             scopes=SCOPES,
         )
-        self.auth = GoogleCalendarAuth(config)
-        self.client = GoogleCalendarClient(self.auth)
+        self.auth = google.GoogleCalendarAuth(config)
 
     def get_authorization_url(self) -> str:
         """
@@ -68,9 +172,7 @@ class GoogleCalendarService:
             raise Exception("Google Calendar not configured")
 
         # Generate state for CSRF protection
-        import secrets
-
-        state = secrets.token_urlsafe(32)
+        state = _new_oauth_state()
         session["google_oauth_state"] = state
 
         return self.auth.get_authorization_url(state=state)
@@ -95,16 +197,23 @@ class GoogleCalendarService:
         credentials = self.auth.handle_callback(code, state=state)
         return credentials
 
-    def get_bookings_for_user(self, user: User):
-        """Get bookings based on user role."""
-        if user.is_admin:
-            return Booking.query.all()
-        elif user.is_instructor:
-            return Booking.query.filter(
+    def get_bookings_for_user(self, user: User, since: Optional[datetime] = None):
+        """Get bookings based on user role, optionally only those starting after ``since``."""
+        # Event payloads touch all three relationships; load them in the same query
+        query = Booking.query.options(
+            joinedload(Booking.aircraft),
+            joinedload(Booking.student),
+            joinedload(Booking.instructor),
+        )
+        if user.is_instructor and not user.is_admin:
+            query = query.filter(
                 (Booking.instructor_id == user.id) | (Booking.instructor_id.is_(None))
-            ).all()
-        else:
-            return Booking.query.filter_by(student_id=user.id).all()
+            )
+        elif not user.is_admin:
+            query = query.filter(Booking.student_id == user.id)
+        if since is not None:
+            query = query.filter(Booking.start_time >= since)
+        return query.all()
 
     def create_event(self, booking: Booking, user: User) -> Optional[str]:
         """
@@ -118,31 +227,11 @@ class GoogleCalendarService:
             Event ID if successful, None otherwise
         """
         try:
-            self._initialize_client_for_user(user)
-
-            instructor_name = (
-                booking.instructor.full_name if booking.instructor else "Solo"
-            )
+            credentials = self._credentials_for_user(user)
 
-            # Create event using shared SDK types
-            event = CalendarEvent(
-                summary=f"Flight Training - {booking.aircraft.tail_number}",
-                description=(
-                    f"Student: {booking.student.full_name}\n"
-                    f"Instructor: {instructor_name}\n"
-                    f"Status: {booking.status}"
-                ),
-                start=CalendarDateTime(
-                    dateTime=booking.start_time.isoformat(),
-                    timeZone="UTC",
-                ),
-                end=CalendarDateTime(
-                    dateTime=booking.end_time.isoformat(),
-                    timeZone="UTC",
-                ),
-            )
+            event = self._event_from_booking(booking)
 
-            created_event = self.client.create_event(event, calendar_id="primary")
+            created_event = self._call_api(credentials, "create_event", event)
             return created_event.id
 
         except Exception as e:
@@ -164,33 +253,11 @@ class GoogleCalendarService:
             Event ID if successful, None otherwise
         """
         try:
-            self._initialize_client_for_user(user)
+            credentials = self._credentials_for_user(user)
 
-            instructor_name = (
-                booking.instructor.full_name if booking.instructor else "Solo"
-            )
+            event = self._event_from_booking(booking)
 
-            # Update event using shared SDK types
-            event = CalendarEvent(
-                summary=f"Flight Training - {booking.aircraft.tail_number}",
-                description=(
-                    f"Student: {booking.student.full_name}\n"
-                    f"Instructor: {instructor_name}\n"
-                    f"Status: {booking.status}"
-                ),
-                start=CalendarDateTime(
-                    dateTime=booking.start_time.isoformat(),
-                    timeZone="UTC",
-                ),
-                end=CalendarDateTime(
-                    dateTime=booking.end_time.isoformat(),
-                    timeZone="UTC",
-                ),
-            )
-
-            updated_event = self.client.update_event(
-                event_id, event, calendar_id="primary"
-            )
+            updated_event = self._call_api(credentials, "update_event", event_id, event)
             return updated_event.id
 
         except Exception as e:
@@ -209,8 +276,49 @@ class GoogleCalendarService:
             True if successful, False otherwise
         """
         try:
-            self._initialize_client_for_user(user)
-            self.client.delete_event(event_id, calendar_id="primary")
+            credentials = self._credentials_for_user(user)
+            self._call_api(credentials, "delete_event", event_id)
+            return True
+
+        except Exception as e:
+            current_app.logger.error(f"Error deleting Google Calendar event: {str(e)}")
+            return False
+
+    async def create_event_async(self, booking: Booking, user: User) -> Optional[str]:
+        """Async variant of create_event; the API call runs off the event loop."""
+        try:
+            credentials = self._credentials_for_user(user)
+            event = self._event_from_booking(booking)
+            created_event = await asyncio.to_thread(
+                self._call_api, credentials, "create_event", event
+            )
+            return created_event.id
+
+        except Exception as e:
+            current_app.logger.error(f"Error creating Google Calendar event: {str(e)}")
+            return None
+
+    async def update_event_async(
+        self, event_id: str, booking: Booking, user: User
+    ) -> Optional[str]:
+        """Async variant of update_event; the API call runs off the event loop."""
+        try:
+            credentials = self._credentials_for_user(user)
+            event = self._event_from_booking(booking)
+            updated_event = await asyncio.to_thread(
+                self._call_api, credentials, "update_event", event_id, event
+            )
+            return updated_event.id
+
+        except Exception as e:
+            current_app.logger.error(f"Error updating Google Calendar event: {str(e)}")
+            return None
+
+    async def delete_event_async(self, event_id: str, user: User) -> bool:
+        """Async variant of delete_event; the API call runs off the event loop."""
+        try:
+            credentials = self._credentials_for_user(user)
+            await asyncio.to_thread(self._call_api, credentials, "delete_event", event_id)
             return True
 
         except Exception as e:
@@ -219,41 +327,158 @@ class GoogleCalendarService:
 
     def sync_all_bookings(self, user: User):
         """Sync all relevant bookings for a user based on their role."""
-        if not (user.google_calendar_enabled and user.google_calendar_credentials):
+        prepared = self._prepare_sync(user)
+        if prepared is None:
             return
+        jobs, push = prepared
+
+        with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as executor:
+            results = list(executor.map(push, jobs))
+
+        self._finish_sync(jobs, results)
+
+    async def sync_all_bookings_async(self, user: User):
+        """Async variant of sync_all_bookings, fanning out with asyncio.gather."""
+        prepared = self._prepare_sync(user)
+        if prepared is None:
+            return
+        jobs, push = prepared
+
+        semaphore = asyncio.Semaphore(SYNC_MAX_WORKERS)
+
+        async def run(job):
+            async with semaphore:
+                return await asyncio.to_thread(push, job)
 
-        bookings = self.get_bookings_for_user(user)
+        results = await asyncio.gather(*(run(job) for job in jobs))
+        self._finish_sync(jobs, results)
+
+    def _prepare_sync(self, user: User):
+        """Build (booking, event_id, event) jobs and the function that pushes one."""
+        if not (user.google_calendar_enabled and user.google_calendar_credentials):
+            return None
+
+        bookings = self.get_bookings_for_user(user, since=utcnow() - SYNC_LOOKBACK)
+        if not bookings:
+            return None
+
+        # Resolve (and refresh) credentials once for the whole batch
+        try:
+            credentials = self._credentials_for_user(user)
+        except Exception as e:
+            current_app.logger.error(f"Error loading Google Calendar credentials: {str(e)}")
+            return None
+
+        # Build payloads up front: ORM access must stay on this thread
+        jobs = []
         for booking in bookings:
-            if not booking.google_calendar_event_id:
-                event_id = self.create_event(booking, user)
+            try:
+                event = self._event_from_booking(booking)
+            except Exception as e:
+                self._log_sync_error(booking.google_calendar_event_id, e)
+                continue
+            jobs.append((booking, booking.google_calendar_event_id, event))
+
+        # The discovery service is not thread-safe, so each worker gets its own client
+        local = threading.local()
+        client_class = _google().GoogleCalendarClient
+
+        def push(job):
+            _, event_id, event = job
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = client_class(self.auth, credentials)
+            try:
                 if event_id:
-                    booking.google_calendar_event_id = event_id
-            else:
-                self.update_event(booking.google_calendar_event_id, booking, user)
+                    return client.update_event(event_id, event, calendar_id="primary").id, None
+                return client.create_event(event, calendar_id="primary").id, None
+            except Exception as e:
+                return None, e
+
+        return jobs, push
+
+    def _finish_sync(self, jobs, results) -> None:
+        """Record new event IDs and log failures, then commit once."""
+        for (booking, event_id, _), (new_event_id, error) in zip(jobs, results):
+            if error is not None:
+                self._log_sync_error(event_id, error)
+            elif not event_id and new_event_id:
+                booking.google_calendar_event_id = new_event_id
 
         db.session.commit()
 
-    def _initialize_client_for_user(self, user: User):
+    def _call_api(self, credentials: GoogleCredentials, method: str, *args):
+        """Make one Calendar API call on a client of its own, safe on any thread."""
+        client = _google().GoogleCalendarClient(self.auth, credentials)
+        return getattr(client, method)(*args, calendar_id="primary")
+
+    @staticmethod
+    def _log_sync_error(event_id: Optional[str], error: Exception) -> None:
+        action = "updating" if event_id else "creating"
+        current_app.logger.error(f"Error {action} Google Calendar event: {str(error)}")
+
+    @staticmethod
+    def _event_from_booking(booking: Booking) -> CalendarEvent:
+        """Build the calendar event payload for a booking."""
+        google = _google()
+        instructor_name = (
+            booking.instructor.full_name if booking.instructor else "Solo"
+        )
+        return google.CalendarEvent(
+            summary=f"Flight Training - {booking.aircraft.registration}",
+            description=(
+                f"Student: {booking.student.full_name}\n"
+                f"Instructor: {instructor_name}\n"
+                f"Status: {booking.status}"
+            ),
+            start=google.CalendarDateTime(
+                dateTime=booking.start_time.isoformat(),
+                timeZone="UTC",
+            ),
+            end=google.CalendarDateTime(
+                dateTime=booking.end_time.isoformat(),
+                timeZone="UTC",
+            ),
+        )
+
+    def _credentials_for_user(self, user: User) -> GoogleCredentials:
         """
-        Initialize the Google Calendar client with user's credentials.
+        Load a user's Google Calendar credentials, refreshing them if needed.
 
         Args:
             user: User with Google Calendar credentials
+
+        Returns:
+            The (possibly refreshed) credentials
         """
         if not user.google_calendar_credentials:
             raise Exception("No Google Calendar credentials found for user")
 
         # Parse credentials from JSON
-        creds_data = json.loads(user.google_calendar_credentials)
-        credentials = GoogleCredentials.from_dict(creds_data)
+        credentials = load_credentials(user.google_calendar_credentials)
 
         # Ensure credentials are valid (refresh if needed)
         if self.auth:
+            original = credentials
             credentials = self.auth.ensure_valid_credentials(credentials)
 
-            # Update stored credentials if refreshed
-            user.google_calendar_credentials = json.dumps(credentials.to_dict())
-            db.session.commit()
+            # Update stored credentials only if they were refreshed
+            if credentials is not original:
+                user.google_calendar_credentials = dump_credentials(credentials)
+                db.session.commit()
 
-        # Set credentials on client
-        self.client.set_credentials(credentials)
+        return credentials
+
+
+def get_calendar_service() -> GoogleCalendarService:
+    """
+    Return the app-wide GoogleCalendarService, creating it on first use.
+
+    The OAuth config is read from the app config once and shared by every
+    request. The service keeps no per-user state: each call builds its own
+    Calendar client from that user's credentials.
+    """
+    service = current_app.extensions.get("google_calendar")
+    if service is None:
+        service = current_app.extensions["google_calendar"] = GoogleCalendarService()
+    return service
@@ -525,6 +525,11 @@ class Aircraft(db.Model):
 
 
 class Booking(db.Model):
+    __table_args__ = (
+        db.Index('ix_booking_instructor_start', 'instructor_id', 'start_time'),
+        db.Index('ix_booking_student_start', 'student_id', 'start_time'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(
         db.Integer,
@@ -10,8 +10,6 @@ from flask import (
 )
 from flask_login import login_required, current_user
 from app import db
-from app.calendar_service import GoogleCalendarService
-import json
 
 settings_bp = Blueprint("settings", __name__)
 
@@ -32,7 +30,9 @@ def calendar_authorize():
         return redirect(url_for("settings.calendar"))
 
     try:
-        calendar_service = GoogleCalendarService()
+        from app.calendar_service import get_calendar_service
+
+        calendar_service = get_calendar_service()
         authorization_url = calendar_service.get_authorization_url()
         return redirect(authorization_url)
     except Exception as e:
@@ -57,11 +57,13 @@ def calendar_callback():
             return redirect(url_for("settings.calendar"))
 
         # Handle callback using shared SDK
-        calendar_service = GoogleCalendarService()
+        from app.calendar_service import dump_credentials, get_calendar_service
+
+        calendar_service = get_calendar_service()
         credentials = calendar_service.handle_callback(code)
 
         # Store credentials in the database (using shared SDK format)
-        current_user.google_calendar_credentials = json.dumps(credentials.to_dict())
+        current_user.google_calendar_credentials = dump_credentials(credentials)
         current_user.google_calendar_enabled = True
         db.session.commit()
 
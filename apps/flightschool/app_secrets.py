@@ -4,9 +4,10 @@ Secrets management for Flight School.
 This module provides centralized secret loading using the Aviation keystore.
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 # Add keystore Python client to path
 def _packages_root() -> Path:
@@ -33,7 +34,22 @@ except Exception as e:
     KEYSTORE_AVAILABLE = False
 
 
-def get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
+# Every key read by the getters below; config.py fetches them in one batch
+CONFIG_SECRET_KEYS = [
+    'SECRET_KEY',
+    'DATABASE_URL',
+    'WTF_CSRF_SECRET_KEY',
+    'MAIL_SERVER',
+    'MAIL_PORT',
+    'MAIL_USERNAME',
+    'MAIL_PASSWORD',
+    'GOOGLE_CLIENT_ID',
+    'GOOGLE_CLIENT_SECRET',
+    'GOOGLE_REDIRECT_URI',
+]
+
+
+def _keystore_get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
     """
     Get a secret value from keystore or environment.
     
@@ -48,14 +64,6 @@ def get_secret(key: str, default: Optional[str] = None, required: bool = False)
     Raises:
         ValueError: If required=True and secret not found
     """
-    if not KEYSTORE_AVAILABLE:
-        # Fallback to environment variables
-        import os
-        value = os.getenv(key, default)
-        if required and value is None:
-            raise ValueError(f"Required secret not found: {key}")
-        return value
-    
     if required:
         return _secrets.get_required(key)
     elif default is not None:
@@ -64,6 +72,30 @@ def get_secret(key: str, default: Optional[str] = None, required: bool = False)
         return _secrets.get(key)
 
 
+def _env_get_secret(key: str, default: Optional[str] = None, required: bool = False) -> Optional[str]:
+    """get_secret when the keystore client is missing: environment variables only."""
+    value = os.getenv(key, default)
+    if required and value is None:
+        raise ValueError(f"Required secret not found: {key}")
+    return value
+
+
+def _env_get_secrets(keys: List[str]) -> Dict[str, Optional[str]]:
+    """get_secrets when the keystore client is missing."""
+    return {key: os.getenv(key) for key in keys}
+
+
+# Pick the backend once at import rather than branching on every lookup.
+# get_secrets(keys) returns each key's value (None if not found) with a
+# single keystore read.
+if KEYSTORE_AVAILABLE:
+    get_secret = _keystore_get_secret
+    get_secrets = _secrets.get_many
+else:
+    get_secret = _env_get_secret
+    get_secrets = _env_get_secrets
+
+
 # Application secrets
 def get_secret_key() -> str:
     """Get the Flask SECRET_KEY."""
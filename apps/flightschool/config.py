@@ -18,6 +18,8 @@ try:
         get_google_client_id,
         get_google_client_secret,
         get_google_redirect_uri,
+        get_secrets,
+        CONFIG_SECRET_KEYS,
     )
     KEYSTORE_AVAILABLE = True
 except Exception:
@@ -34,15 +36,40 @@ except Exception:
     get_google_client_id = lambda: os.environ.get('GOOGLE_CLIENT_ID')
     get_google_client_secret = lambda: os.environ.get('GOOGLE_CLIENT_SECRET')
     get_google_redirect_uri = lambda: os.environ.get('GOOGLE_REDIRECT_URI')
+    get_secrets = lambda keys: {}
+    CONFIG_SECRET_KEYS = []
+
+
+def _bootstrap():
+    """Resolve every secret-backed setting once, before the config classes are built."""
+    # One batched read loads every keystore secret for the service; the
+    # getters below are then answered from the loader's memory, and keys the
+    # keystore lacks go straight to its environment snapshot
+    get_secrets(CONFIG_SECRET_KEYS)
+    return {
+        'SECRET_KEY': get_secret_key(),
+        'SQLALCHEMY_DATABASE_URI': get_database_url(),
+        'WTF_CSRF_SECRET_KEY': get_csrf_secret_key(),
+        'MAIL_SERVER': get_mail_server(),
+        'MAIL_PORT': get_mail_port(),
+        'MAIL_USERNAME': get_mail_username(),
+        'MAIL_PASSWORD': get_mail_password(),
+        'GOOGLE_CLIENT_ID': get_google_client_id(),
+        'GOOGLE_CLIENT_SECRET': get_google_client_secret(),
+        'GOOGLE_REDIRECT_URI': get_google_redirect_uri(),
+    }
+
+
+_SECRETS = _bootstrap()
 
 class Config:
     """Base configuration."""
-    SECRET_KEY = get_secret_key()
-    SQLALCHEMY_DATABASE_URI = get_database_url()
+    SECRET_KEY = _SECRETS['SECRET_KEY']
+    SQLALCHEMY_DATABASE_URI = _SECRETS['SQLALCHEMY_DATABASE_URI']
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
     WTF_CSRF_ENABLED = True
-    WTF_CSRF_SECRET_KEY = get_csrf_secret_key()
+    WTF_CSRF_SECRET_KEY = _SECRETS['WTF_CSRF_SECRET_KEY']
     WTF_CSRF_TIME_LIMIT = None  # No time limit for CSRF tokens
     SESSION_COOKIE_SECURE = False  # Set to True in production
     SESSION_COOKIE_HTTPONLY = True
@@ -53,20 +80,20 @@ class Config:
     CONTACT_PHONE = os.environ.get('CONTACT_PHONE', '(555) 123-4567')
     
     # Mail settings (placeholder for future implementation)
-    MAIL_SERVER = get_mail_server()
-    MAIL_PORT = get_mail_port()
+    MAIL_SERVER = _SECRETS['MAIL_SERVER']
+    MAIL_PORT = _SECRETS['MAIL_PORT']
     MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS') is not None
-    MAIL_USERNAME = get_mail_username()
-    MAIL_PASSWORD = get_mail_password()
+    MAIL_USERNAME = _SECRETS['MAIL_USERNAME']
+    MAIL_PASSWORD = _SECRETS['MAIL_PASSWORD']
     
     # Application specific settings
     MAX_BOOKING_DURATION = 8  # hours
     MIN_BOOKING_DURATION = 1  # hour
 
     # Google Calendar settings
-    GOOGLE_CLIENT_ID = get_google_client_id()
-    GOOGLE_CLIENT_SECRET = get_google_client_secret()
-    GOOGLE_REDIRECT_URI = get_google_redirect_uri() or 'http://localhost:5000/booking/google-callback'
+    GOOGLE_CLIENT_ID = _SECRETS['GOOGLE_CLIENT_ID']
+    GOOGLE_CLIENT_SECRET = _SECRETS['GOOGLE_CLIENT_SECRET']
+    GOOGLE_REDIRECT_URI = _SECRETS['GOOGLE_REDIRECT_URI'] or 'http://localhost:5000/booking/google-callback'
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -0,0 +1,286 @@
+"""Tests for syncing bookings to Google Calendar."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.calendar_service as calendar_service
+from app.calendar_service import GoogleCalendarService
+from app.models import Booking
+
+
+class FakeCalendarClient:
+    """Stands in for the SDK client; records API calls instead of making them."""
+
+    calls = []
+
+    def __init__(self, auth, credentials=None):
+        self.auth = auth
+        self.credentials = credentials
+
+    def set_credentials(self, credentials):
+        self.credentials = credentials
+
+    def create_event(self, event, calendar_id="primary"):
+        FakeCalendarClient.calls.append(("create", event.summary))
+        return SimpleNamespace(id=f"evt-{event.start.dateTime}")
+
+    def delete_event(self, event_id, calendar_id="primary"):
+        FakeCalendarClient.calls.append(("delete", event_id, self.credentials.access_token))
+
+    def update_event(self, event_id, event, calendar_id="primary"):
+        FakeCalendarClient.calls.append(("update", event_id))
+        return SimpleNamespace(id=event_id)
+
+
+@pytest.fixture
+def calendar_user(session, test_user):
+    expiry_ms = int((time.time() + 3600) * 1000)
+    test_user.google_calendar_enabled = True
+    test_user.google_calendar_credentials = json.dumps({
+        "access_token": "token",
+        "token_type": "Bearer",
+        "refresh_token": "refresh",
+        "expiry_date": expiry_ms,
+    })
+    session.commit()
+    return test_user
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    FakeCalendarClient.calls = []
+    monkeypatch.setattr(
+        calendar_service._google(), "GoogleCalendarClient", FakeCalendarClient
+    )
+    return FakeCalendarClient
+
+
+def test_sync_all_bookings_creates_and_updates(
+    app, session, calendar_user, test_aircraft, fake_client
+):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    bookings = [
+        Booking(
+            student_id=calendar_user.id,
+            aircraft_id=test_aircraft.id,
+            start_time=start + timedelta(hours=i * 3),
+            end_time=start + timedelta(hours=i * 3 + 2),
+            status="confirmed",
+            google_calendar_event_id="existing" if i == 0 else None,
+        )
+        for i in range(5)
+    ]
+    session.add_all(bookings)
+    session.commit()
+
+    GoogleCalendarService().sync_all_bookings(calendar_user)
+
+    kinds = sorted(kind for kind, _ in fake_client.calls)
+    assert kinds == ["create"] * 4 + ["update"]
+    assert ("create", "Flight Training - N12345") in fake_client.calls
+    for booking in bookings:
+        session.refresh(booking)
+        assert booking.google_calendar_event_id
+    assert bookings[0].google_calendar_event_id == "existing"
+
+
+def test_sync_all_bookings_skips_disconnected_user(
+    app, session, test_user, test_booking, fake_client
+):
+    GoogleCalendarService().sync_all_bookings(test_user)
+
+    assert fake_client.calls == []
+
+
+def test_credentials_round_trip():
+    credentials = calendar_service._google().GoogleCredentials(
+        access_token="token", token_type="Bearer", expiry_date=1234
+    )
+
+    stored = calendar_service.dump_credentials(credentials)
+
+    assert json.loads(stored)["access_token"] == "token"
+    assert calendar_service.load_credentials(stored) == credentials
+
+
+@pytest.mark.parametrize("stored, expiry_date", [
+    ('{"access_token": "token", "token_type": "Bearer", "expiry_date": 1234.0, "scope": null}', 1234),
+    ('{"access_token": "token", "token_type": "Bearer", "expiry_date": 1234.5}', 1234.5),
+    ('{"access_token": "token", "token_type": null, "refresh_token": null}', None),
+])
+def test_load_credentials_accepts_loosely_typed_rows(stored, expiry_date):
+    credentials = calendar_service.load_credentials(stored)
+
+    assert credentials.access_token == "token"
+    assert credentials.expiry_date == expiry_date
+
+
+def test_valid_credentials_are_not_rewritten(
+    app, session, calendar_user, fake_client, monkeypatch
+):
+    stored = calendar_user.google_calendar_credentials
+    commits = []
+    monkeypatch.setattr(
+        calendar_service.db.session, "commit", lambda: commits.append(True)
+    )
+
+    GoogleCalendarService()._credentials_for_user(calendar_user)
+
+    assert calendar_user.google_calendar_credentials == stored
+    assert commits == []
+
+
+@pytest.mark.parametrize("failure", ["corrupt", "refresh"])
+def test_sync_logs_and_skips_unusable_credentials(
+    app, session, calendar_user, test_booking, fake_client, failure
+):
+    service = GoogleCalendarService()
+    if failure == "corrupt":
+        calendar_user.google_calendar_credentials = "{not json"
+    else:
+        def refuse(credentials):
+            raise RuntimeError("invalid_grant")
+
+        service.auth = SimpleNamespace(ensure_valid_credentials=refuse)
+
+    service.sync_all_bookings(calendar_user)
+    asyncio.run(service.sync_all_bookings_async(calendar_user))
+
+    assert fake_client.calls == []
+    assert test_booking.google_calendar_event_id is None
+
+
+def test_sync_all_bookings_skips_past_bookings(
+    app, session, calendar_user, test_aircraft, fake_client
+):
+    past = datetime.now(timezone.utc) - timedelta(days=7)
+    session.add(
+        Booking(
+            student_id=calendar_user.id,
+            aircraft_id=test_aircraft.id,
+            start_time=past,
+            end_time=past + timedelta(hours=2),
+            status="completed",
+        )
+    )
+    session.commit()
+
+    GoogleCalendarService().sync_all_bookings(calendar_user)
+
+    assert fake_client.calls == []
+
+
+def test_get_calendar_service_is_shared_per_app(app):
+    service = calendar_service.get_calendar_service()
+
+    assert calendar_service.get_calendar_service() is service
+    assert app.extensions["google_calendar"] is service
+
+
+def test_oauth_state_tokens_are_unique():
+    tokens = {calendar_service._new_oauth_state() for _ in range(200)}
+
+    assert len(tokens) == 200
+    assert all(len(token) == 43 for token in tokens)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_oauth_state_pool_is_not_shared_with_forked_child():
+    calendar_service._refill_state_pool()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            os.write(write_fd, calendar_service._new_oauth_state().encode("ascii"))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        child_token = pipe.read().decode("ascii")
+    os.waitpid(pid, 0)
+
+    assert child_token
+    assert child_token != calendar_service._new_oauth_state()
+
+
+def test_sync_all_bookings_async_creates_events(
+    app, session, calendar_user, test_aircraft, fake_client
+):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    bookings = [
+        Booking(
+            student_id=calendar_user.id,
+            aircraft_id=test_aircraft.id,
+            start_time=start + timedelta(hours=i * 3),
+            end_time=start + timedelta(hours=i * 3 + 2),
+            status="confirmed",
+        )
+        for i in range(3)
+    ]
+    session.add_all(bookings)
+    session.commit()
+
+    asyncio.run(GoogleCalendarService().sync_all_bookings_async(calendar_user))
+
+    assert [kind for kind, _ in fake_client.calls] == ["create"] * 3
+    for booking in bookings:
+        session.refresh(booking)
+        assert booking.google_calendar_event_id
+
+
+def test_create_event_async(app, session, calendar_user, test_booking, fake_client):
+    event_id = asyncio.run(
+        GoogleCalendarService().create_event_async(test_booking, calendar_user)
+    )
+
+    assert event_id.startswith("evt-")
+    assert fake_client.calls == [("create", "Flight Training - N12345")]
+
+
+def test_concurrent_users_keep_their_own_credentials(
+    app, session, calendar_user, test_instructor, fake_client
+):
+    test_instructor.google_calendar_credentials = json.dumps({
+        "access_token": "instructor-token",
+        "token_type": "Bearer",
+        "refresh_token": "instructor-refresh",
+        "expiry_date": int((time.time() + 3600) * 1000),
+    })
+    session.commit()
+    service = calendar_service.get_calendar_service()
+    # Both calls load their credentials before either reaches the API
+    both_loaded = threading.Barrier(2)
+    load = service._credentials_for_user
+
+    def credentials_for_user(user):
+        credentials = load(user)
+        both_loaded.wait(timeout=5)
+        return credentials
+
+    service._credentials_for_user = credentials_for_user
+
+    def delete(event_id, user):
+        with app.app_context():
+            assert service.delete_event(event_id, user)
+
+    threads = [
+        threading.Thread(target=delete, args=("student-event", calendar_user)),
+        threading.Thread(target=delete, args=("instructor-event", test_instructor)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(fake_client.calls) == [
+        ("delete", "instructor-event", "instructor-token"),
+        ("delete", "student-event", "token"),
+    ]
@@ -4,33 +4,34 @@ Secrets management for ForeFlight Dashboard.
 This module provides centralized secret loading using the Aviation keystore.
 """
 
+import logging
 import os
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add keystore Python client to path
-def _packages_root() -> Path:
-    for parent in Path(__file__).resolve().parents:
-        candidate = parent / "packages"
-        if candidate.exists():
-            return candidate
-    return Path("/packages")
+logger = logging.getLogger(__name__)
 
+# Keystore secret loader, created by _loader() on first use (False when the
+# keystore client is not installed)
+_secrets = None
 
-keystore_python = _packages_root() / "keystore" / "python"
-if str(keystore_python) not in sys.path:
-    sys.path.insert(0, str(keystore_python))
 
-try:
-    from keystore import create_secret_loader, SecretNotFoundError
-
-    # Create secret loader for this service
-    secrets = create_secret_loader('foreflight-dashboard')
-    KEYSTORE_AVAILABLE = True
-except Exception as e:
-    print(f"Warning: Keystore not available: {e}")
-    secrets = None
-    KEYSTORE_AVAILABLE = False
+def _loader():
+    """
+    Return the keystore secret loader, importing the client on first use.
+    
+    The client is installed with ``pip install -e packages/keystore/python``;
+    without it secrets come from environment variables only.
+    """
+    global _secrets
+    if _secrets is None:
+        try:
+            from keystore import create_secret_loader
+        except ImportError as e:
+            logger.warning("Keystore not available, using environment variables only: %s", e)
+            _secrets = False
+        else:
+            _secrets = create_secret_loader('foreflight-dashboard')
+    return _secrets or None
 
 
 def get_secret(key: str, default=None, required: bool = False):
@@ -48,46 +49,69 @@ def get_secret(key: str, default=None, required: bool = False):
     Raises:
         SecretNotFoundError: If required=True and secret not found
     """
-    if not KEYSTORE_AVAILABLE:
+    # One lookup, with the default and the required check applied here
+    # rather than through get_required()/get_with_default()
+    secrets = _loader()
+    if secrets is None:
         value = os.getenv(key, default)
-        if required and value is None:
-            raise ValueError(f"Required secret not found: {key}")
-        return value
-
-    if required:
-        return secrets.get_required(key)
-    elif default is not None:
-        return secrets.get_with_default(key, default)
     else:
-        return secrets.get(key)
+        value = secrets.get(key)
+        if value is None:
+            value = default
+    
+    if required and value is None:
+        if secrets is None:
+            raise ValueError(f"Required secret not found: {key}")
+        from keystore import SecretNotFoundError
+        raise SecretNotFoundError(
+            f"Required secret not found: foreflight-dashboard:{key}. "
+            f"Please set it using: npm run keystore set foreflight-dashboard {key} <value>"
+        )
+    return value
 
 
-# Expose common secrets as module-level constants for backward compatibility
-def _load_secrets():
-    """Load secrets into module-level variables."""
-    global SECRET_KEY, DATABASE_URL, FOREFLIGHT_API_KEY, FOREFLIGHT_API_SECRET
-    global SMTP_SERVER, SMTP_USERNAME, SMTP_PASSWORD, REDIS_URL, SENTRY_DSN
-    
+# Secrets exposed as module-level constants for backward compatibility,
+# with their defaults. They are fetched on first attribute access (PEP 562)
+# rather than at import.
+_LAZY_SECRETS = {
     # Required secrets
-    SECRET_KEY = get_secret('SECRET_KEY')
-    
+    'SECRET_KEY': None,
     # Optional secrets with defaults
-    DATABASE_URL = get_secret('DATABASE_URL', default='sqlite:///logbook.db')
-    
+    'DATABASE_URL': 'sqlite:///logbook.db',
     # External API secrets
-    FOREFLIGHT_API_KEY = get_secret('FOREFLIGHT_API_KEY')
-    FOREFLIGHT_API_SECRET = get_secret('FOREFLIGHT_API_SECRET')
-    
+    'FOREFLIGHT_API_KEY': None,
+    'FOREFLIGHT_API_SECRET': None,
     # Email configuration
-    SMTP_SERVER = get_secret('SMTP_SERVER')
-    SMTP_USERNAME = get_secret('SMTP_USERNAME')
-    SMTP_PASSWORD = get_secret('SMTP_PASSWORD')
-    
+    'SMTP_SERVER': None,
+    'SMTP_USERNAME': None,
+    'SMTP_PASSWORD': None,
     # External services
-    REDIS_URL = get_secret('REDIS_URL')
-    SENTRY_DSN = get_secret('SENTRY_DSN')
+    'REDIS_URL': None,
+    'SENTRY_DSN': None,
+}
+
+_warmed = False
 
 
-# Load secrets on module import
-_load_secrets()
+def _warm_cache():
+    """Read the service's secrets from the keystore once, on first use."""
+    global _warmed
+    if _warmed:
+        return
+    _warmed = True
+    
+    # Read the whole service from the keystore in one call; if that fails,
+    # overlap the per-key CLI lookups so they cost one round-trip, not nine
+    secrets = _loader()
+    if secrets is not None and not secrets.prefetch():
+        with ThreadPoolExecutor(max_workers=len(_LAZY_SECRETS)) as executor:
+            list(executor.map(secrets.get, _LAZY_SECRETS))
+
 
+def __getattr__(name):
+    if name not in _LAZY_SECRETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _warm_cache()
+    value = get_secret(name, default=_LAZY_SECRETS[name])
+    globals()[name] = value
+    return value
@@ -5,12 +5,26 @@ This module provides a Python interface to the Aviation monorepo's
 encrypted keystore for managing secrets and API keys.
 """
 
+import base64
+import functools
+import hashlib
 import os
+import socket
+import stat
 import subprocess
+import threading
 import json
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Tuple
 from pathlib import Path
 
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Fernet = None
+    InvalidToken = Exception
+
 
 class KeystoreError(Exception):
     """Base exception for keystore operations."""
@@ -22,12 +36,153 @@ class SecretNotFoundError(KeystoreError):
     pass
 
 
+def _find_monorepo_root() -> Optional[Path]:
+    """
+    Locate the monorepo root.
+    
+    $AVIATION_MONOREPO_ROOT wins; otherwise the nearest parent holding the
+    `.monorepo-root` marker, then (for older checkouts) the nearest
+    package.json that declares workspaces.
+    """
+    env_root = os.environ.get("AVIATION_MONOREPO_ROOT")
+    if env_root:
+        return Path(env_root)
+    return _discover_monorepo_root()
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_monorepo_root() -> Optional[Path]:
+    parents = Path(__file__).resolve().parents
+    for parent in parents:
+        if (parent / ".monorepo-root").exists():
+            return parent
+    
+    for parent in parents:
+        package_json = parent / "package.json"
+        if package_json.exists():
+            try:
+                with open(package_json) as f:
+                    if "workspaces" in json.load(f):
+                        return parent
+            except (json.JSONDecodeError, IOError):
+                continue
+    return None
+
+
+# Decrypted keystore files, keyed by (path, mtime_ns, size, passphrase)
+_VAULTS: Dict[Tuple[str, int, int, str], Dict[str, Dict]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _vault_key(store_path: str, passphrase: str) -> bytes:
+    """AES key for a keystore file, derived as SecureKeyStore does (scrypt)."""
+    salt = hashlib.sha256(store_path.encode("utf-8")).digest()
+    return hashlib.scrypt(
+        passphrase.encode("utf-8"), salt=salt, n=16384, r=8, p=1, dklen=32
+    )
+
+
+def _read_vault(store_path: str) -> Optional[Dict[str, Dict]]:
+    """
+    Decrypt a keystore file in-process.
+    
+    Mirrors SecureKeyStore's format: "<iv hex>:<ciphertext hex>", AES-256-CBC
+    over a JSON object of "service:key" entries. A missing file is an empty
+    vault. Returns None when the file cannot be read this way (no
+    `cryptography`, wrong key or a different format), so callers can fall
+    back to the Node CLI.
+    """
+    if Fernet is None:
+        return None
+    passphrase = os.environ.get("KEYSTORE_ENCRYPTION_KEY", "default-key-change-in-production")
+    try:
+        stat = os.stat(store_path)
+    except FileNotFoundError:
+        return {}
+    except OSError:
+        return None
+    
+    cache_key = (store_path, stat.st_mtime_ns, stat.st_size, passphrase)
+    if cache_key in _VAULTS:
+        return _VAULTS[cache_key]
+    
+    try:
+        with open(store_path, "r", encoding="utf-8") as f:
+            iv_hex, _, cipher_hex = f.read().strip().partition(":")
+        decryptor = Cipher(
+            algorithms.AES(_vault_key(store_path, passphrase)), modes.CBC(bytes.fromhex(iv_hex))
+        ).decryptor()
+        padded = decryptor.update(bytes.fromhex(cipher_hex)) + decryptor.finalize()
+        unpadder = padding.PKCS7(128).unpadder()
+        vault = json.loads(unpadder.update(padded) + unpadder.finalize())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(vault, dict):
+        return None
+    
+    # Only the current version of a file is worth keeping
+    for stale in [k for k in _VAULTS if k[0] == store_path]:
+        del _VAULTS[stale]
+    _VAULTS[cache_key] = vault
+    return vault
+
+
+def _parse_json_line(output: str) -> Optional[Dict]:
+    """Parse the JSON object a `--json` keystore CLI command prints last."""
+    lines = output.strip().split('\n')
+    try:
+        payload = json.loads(lines[-1])
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _default_disk_cache_dir() -> Path:
+    """Directory for the encrypted per-service secret caches."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "aviation-keystore"
+
+
+def _default_daemon_socket() -> Optional[str]:
+    """
+    Socket path of the keystore daemon (scripts/keystore-daemon.ts).
+    
+    Lives in a per-user directory: $XDG_RUNTIME_DIR, or else the private
+    cache directory. Never a shared one such as /tmp, where another user
+    could put a socket of their own.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    if os.environ.get("AVIATION_KEYSTORE_SOCKET"):
+        return os.environ["AVIATION_KEYSTORE_SOCKET"]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "aviation-keystore.sock")
+    return str(_default_disk_cache_dir() / "daemon.sock")
+
+
+def _is_private_socket(path: str) -> bool:
+    """True if path is a socket owned by this user that no one else can open."""
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) == 0o600
+    )
+
+
 class SecretLoader:
     """
     Python client for loading secrets from the Aviation keystore.
     
     This class provides a clean Python interface to the encrypted keystore,
     with automatic fallback to environment variables for backward compatibility.
+    One loader can be shared by several threads.
     
     Example:
         >>> secrets = SecretLoader('my-service')
@@ -40,7 +195,10 @@ class SecretLoader:
         service_name: str,
         keystore_path: Optional[str] = None,
         fallback_to_env: bool = True,
-        npm_executable: str = "npm"
+        npm_executable: str = "npm",
+        node_executable: str = "node",
+        daemon_socket: Optional[str] = None,
+        disk_cache: Optional[bool] = None
     ):
         """
         Initialize the secret loader.
@@ -49,35 +207,62 @@ class SecretLoader:
             service_name: Name of the service (e.g., 'flight-planner', 'flightschool')
             keystore_path: Optional path to keystore file (defaults to monorepo root)
             fallback_to_env: Whether to fall back to environment variables if secret not found
-            npm_executable: Path to npm executable (defaults to 'npm')
+            npm_executable: Path to npm executable (defaults to 'npm'); only
+                used when the keystore CLI cannot be run with node directly
+            node_executable: Path to node executable (defaults to 'node')
+            daemon_socket: Keystore daemon socket (defaults to
+                $AVIATION_KEYSTORE_SOCKET, $XDG_RUNTIME_DIR/aviation-keystore.sock
+                or $XDG_CACHE_HOME/aviation-keystore/daemon.sock); it is only
+                used when owned by this user with mode 0600
+            disk_cache: Persist secrets read from the keystore to an encrypted
+                file under $XDG_CACHE_HOME/aviation-keystore so new processes
+                skip the keystore entirely (defaults to
+                $AVIATION_KEYSTORE_DISK_CACHE == '1'; needs `cryptography`)
         """
         self.service_name = service_name
         self.fallback_to_env = fallback_to_env
+        # Plain-dict snapshot of the environment for the fallback lookups
+        self._env: Dict[str, str] = dict(os.environ) if fallback_to_env else {}
         self.npm_executable = npm_executable
+        self.node_executable = node_executable
+        self.daemon_socket = daemon_socket or _default_daemon_socket()
         
         # Determine keystore root (monorepo root)
         if keystore_path:
             self.keystore_root = Path(keystore_path).parent
+            self._store_path = os.path.abspath(keystore_path)
+        else:
+            # Fallback to current directory
+            self.keystore_root = _find_monorepo_root() or Path.cwd()
+            self._store_path = os.path.abspath(self.keystore_root / ".keystore")
+        
+        # Run the CLI with node + ts-node directly when both are present,
+        # skipping npm's package.json/script resolution on every call
+        cli_script = self.keystore_root / "scripts" / "keystore-cli.ts"
+        ts_node_bin = self.keystore_root / "node_modules" / "ts-node" / "dist" / "bin.js"
+        if cli_script.exists() and ts_node_bin.exists():
+            self._cli_prefix = [
+                self.node_executable, str(ts_node_bin), "--transpile-only", str(cli_script)
+            ]
         else:
-            # Try to find the monorepo root by looking for package.json with workspaces
-            current = Path(__file__).resolve()
-            for parent in current.parents:
-                package_json = parent / "package.json"
-                if package_json.exists():
-                    try:
-                        with open(package_json) as f:
-                            data = json.load(f)
-                            if "workspaces" in data:
-                                self.keystore_root = parent
-                                break
-                    except (json.JSONDecodeError, IOError):
-                        continue
-            else:
-                # Fallback to current directory
-                self.keystore_root = Path.cwd()
+            self._cli_prefix = [self.npm_executable, "run", "--silent", "keystore", "--"]
         
+        # Guards the caches below and the disk cache file, so one loader can
+        # be shared by threads; keystore reads themselves run unlocked
+        self._lock = threading.RLock()
         # Cache for secrets to avoid multiple subprocess calls
         self._cache: Dict[str, str] = {}
+        # Keys the keystore was asked for and does not hold (negative cache)
+        self._misses: Set[str] = set()
+        # Set once prefetch() has loaded every keystore secret for the service
+        self._prefetched = False
+        
+        if disk_cache is None:
+            disk_cache = os.environ.get("AVIATION_KEYSTORE_DISK_CACHE") == "1"
+        self._disk_cache_path: Optional[Path] = None
+        if disk_cache and Fernet is not None:
+            self._disk_cache_path = _default_disk_cache_dir() / f"{service_name}.enc"
+        self._disk_cache_loaded = False
     
     def get(self, key: str, use_cache: bool = True) -> Optional[str]:
         """
@@ -91,21 +276,30 @@ class SecretLoader:
             Secret value or None if not found
         """
         # Check cache first
-        if use_cache and key in self._cache:
-            return self._cache[key]
-        
-        # Try keystore
-        try:
-            value = self._get_from_keystore(key)
+        if use_cache:
+            self._load_disk_cache()
+            value = self._cache.get(key)
             if value is not None:
-                self._cache[key] = value
                 return value
-        except KeystoreError:
-            pass  # Continue to fallback
+        
+        # Try keystore, unless it is already known not to hold the key
+        # (a completed prefetch holds every stored key)
+        if not (use_cache and (self._prefetched or key in self._misses)):
+            try:
+                value = self._get_from_keystore(key)
+                with self._lock:
+                    if value is not None:
+                        self._cache[key] = value
+                        self._misses.discard(key)
+                        self._save_disk_cache()
+                        return value
+                    self._misses.add(key)
+            except KeystoreError:
+                pass  # Continue to fallback
         
         # Fall back to environment variables if enabled
         if self.fallback_to_env:
-            value = os.environ.get(key)
+            value = self._env.get(key)
             if value is not None:
                 return value
         
@@ -146,6 +340,73 @@ class SecretLoader:
         value = self.get(key)
         return value if value is not None else default
     
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get several secret values in one call.
+        
+        Args:
+            keys: Secret key names
+            
+        Returns:
+            Mapping of each key to its value (None if not found)
+        """
+        keys = list(dict.fromkeys(keys))
+        self._load_disk_cache()
+        if any(key not in self._cache and key not in self._misses for key in keys):
+            self.prefetch()
+        return {key: self.get(key) for key in keys}
+    
+    def prefetch(self) -> bool:
+        """
+        Load every secret for this service with a single keystore call.
+        
+        After a successful prefetch, lookups of keys the keystore does not
+        hold go straight to the environment fallback.
+        
+        Returns:
+            True if the keystore was read, False otherwise
+        """
+        values = self._vault_values()
+        if values is not None:
+            self._store_prefetched(values)
+            return True
+        
+        response = self._daemon_request({"op": "export", "service": self.service_name})
+        if response is not None:
+            values = response.get("values")
+            if not isinstance(values, dict):
+                return False
+            self._store_prefetched(values)
+            return True
+        
+        try:
+            result = subprocess.run(
+                self._cli_prefix + ["export", self.service_name],
+                cwd=str(self.keystore_root),
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                return False
+            # The JSON object is the last line of output
+            lines = result.stdout.strip().split('\n')
+            values = json.loads(lines[-1])
+        except Exception:
+            return False
+        
+        if not isinstance(values, dict):
+            return False
+        self._store_prefetched(values)
+        return True
+    
+    def _store_prefetched(self, values: Dict) -> None:
+        """Cache every secret of the service, as read by prefetch()."""
+        with self._lock:
+            self._cache.update({str(k): str(v) for k, v in values.items()})
+            self._prefetched = True
+            self._save_disk_cache()
+    
     def has(self, key: str) -> bool:
         """
         Check if a secret exists.
@@ -165,9 +426,13 @@ class SecretLoader:
         Returns:
             List of secret key names
         """
+        values = self._vault_values()
+        if values is not None:
+            return sorted(values)
+        
         try:
             result = subprocess.run(
-                [self.npm_executable, "run", "keystore", "list", self.service_name],
+                self._cli_prefix + ["list", "--json", self.service_name],
                 cwd=str(self.keystore_root),
                 capture_output=True,
                 text=True,
@@ -175,7 +440,11 @@ class SecretLoader:
             )
             
             if result.returncode == 0:
-                # Parse the output to extract key names
+                payload = _parse_json_line(result.stdout)
+                if payload is not None:
+                    return [str(key) for key in payload.get("keys", [])]
+                
+                # Older CLIs without --json: scrape the bulleted listing
                 keys = []
                 for line in result.stdout.split('\n'):
                     line = line.strip()
@@ -202,9 +471,20 @@ class SecretLoader:
         Raises:
             KeystoreError: If there's an error accessing the keystore
         """
+        values = self._vault_values()
+        if values is not None:
+            return values.get(key)
+        
+        response = self._daemon_request(
+            {"op": "get", "service": self.service_name, "key": key}
+        )
+        if response is not None:
+            value = response.get("value")
+            return str(value) if value is not None else None
+        
         try:
             result = subprocess.run(
-                [self.npm_executable, "run", "keystore", "get", self.service_name, key],
+                self._cli_prefix + ["get", "--json", self.service_name, key],
                 cwd=str(self.keystore_root),
                 capture_output=True,
                 text=True,
@@ -212,7 +492,12 @@ class SecretLoader:
             )
             
             if result.returncode == 0:
-                # Parse the output - the value is on the last line
+                payload = _parse_json_line(result.stdout)
+                if payload is not None:
+                    value = payload.get("value")
+                    return str(value) if value is not None else None
+                
+                # Older CLIs without --json: the value is on the last line
                 lines = result.stdout.strip().split('\n')
                 if len(lines) >= 2:
                     # The last line contains the value
@@ -222,9 +507,138 @@ class SecretLoader:
         except Exception as e:
             raise KeystoreError(f"Error accessing keystore: {e}")
     
+    def _vault_values(self) -> Optional[Dict[str, str]]:
+        """
+        This service's secrets, decrypted in-process from the keystore file.
+        
+        Returns:
+            Mapping of key to value, or None when the file can only be read
+            through the daemon or CLI
+        """
+        vault = _read_vault(self._store_path)
+        if vault is None:
+            return None
+        prefix = f"{self.service_name}:"
+        values = {}
+        for name, entry in vault.items():
+            if name.startswith(prefix) and isinstance(entry, dict) and "value" in entry:
+                values[name[len(prefix):]] = str(entry["value"])
+        return values
+    
+    def _daemon_request(self, message: Dict[str, str]) -> Optional[Dict]:
+        """
+        Send one request to the keystore daemon, if it is running.
+        
+        The request names this loader's keystore file, and the daemon refuses
+        it unless that is the store it serves. A socket not owned by this user,
+        or open to others, is ignored.
+        
+        Returns:
+            The daemon's response, or None when the daemon is unavailable
+            (callers then fall back to the CLI)
+        """
+        if not self.daemon_socket or not _is_private_socket(self.daemon_socket):
+            return None
+        message = {**message, "store": os.path.realpath(self._store_path)}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(5)
+                sock.connect(self.daemon_socket)
+                sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+                data = b""
+                while not data.endswith(b"\n"):
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+            response = json.loads(data)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(response, dict) or not response.get("ok"):
+            return None
+        return response
+    
+    def _disk_cache_fernet(self) -> "Fernet":
+        """
+        Fernet for the on-disk cache.
+        
+        The key is derived from the keystore's own encryption key, the user
+        and the store location, so the cache is no easier to read than the
+        keystore itself.
+        """
+        material = "\0".join([
+            os.environ.get("KEYSTORE_ENCRYPTION_KEY", "default-key-change-in-production"),
+            str(os.getuid() if hasattr(os, "getuid") else ""),
+            self._store_path,
+            self.service_name,
+        ])
+        key = hashlib.sha256(material.encode("utf-8")).digest()
+        return Fernet(base64.urlsafe_b64encode(key))
+    
+    def _keystore_mtime(self) -> float:
+        try:
+            return os.stat(self._store_path).st_mtime
+        except OSError:
+            return 0.0
+    
+    def _load_disk_cache(self):
+        """Seed the in-process cache from the disk cache, once, if still fresh."""
+        if self._disk_cache_loaded or self._disk_cache_path is None:
+            return
+        with self._lock:
+            if self._disk_cache_loaded:
+                return
+            self._disk_cache_loaded = True
+            try:
+                # Stale once the keystore has been written since the cache was
+                if self._disk_cache_path.stat().st_mtime < self._keystore_mtime():
+                    return
+                payload = json.loads(
+                    self._disk_cache_fernet().decrypt(self._disk_cache_path.read_bytes())
+                )
+                values = payload["values"]
+            except (OSError, ValueError, KeyError, TypeError, InvalidToken):
+                return
+            self._cache.update({str(k): str(v) for k, v in values.items()})
+            self._prefetched = self._prefetched or bool(payload.get("complete"))
+    
+    def _save_disk_cache(self):
+        """Write the keystore-sourced cache through to disk (best effort)."""
+        if self._disk_cache_path is None:
+            return
+        # Under the lock: the cache can't change mid-dump, and only one
+        # thread at a time uses the temporary file
+        with self._lock:
+            payload = json.dumps({"complete": self._prefetched, "values": self._cache})
+            try:
+                self._disk_cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                tmp_path = self._disk_cache_path.with_name(
+                    f".{self._disk_cache_path.name}.{os.getpid()}"
+                )
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(self._disk_cache_fernet().encrypt(payload.encode("utf-8")))
+                os.replace(tmp_path, self._disk_cache_path)
+            except OSError:
+                pass
+    
+    def refresh_env(self):
+        """Re-read the environment after it has been changed at runtime."""
+        self._env = dict(os.environ) if self.fallback_to_env else {}
+    
     def clear_cache(self):
-        """Clear the internal cache."""
-        self._cache.clear()
+        """Clear the internal cache (and the on-disk cache, if enabled)."""
+        with self._lock:
+            self._cache.clear()
+            self._misses.clear()
+            self._prefetched = False
+            self.refresh_env()
+            if self._disk_cache_path is not None:
+                try:
+                    self._disk_cache_path.unlink()
+                except OSError:
+                    pass
+            self._disk_cache_loaded = False
 
 
 def create_secret_loader(
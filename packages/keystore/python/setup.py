@@ -0,0 +1,26 @@
+"""
+Aviation Keystore - Python Client
+
+Python client for the Aviation monorepo's encrypted keystore.
+"""
+
+from setuptools import setup
+
+setup(
+    name="aviation-keystore",
+    version="0.1.0",
+    description="Python client for the Aviation keystore",
+    author="Aviation Team",
+    py_modules=["keystore"],
+    python_requires=">=3.11",
+    extras_require={
+        # In-process decryption of .keystore and the encrypted disk cache
+        "crypto": ["cryptography"],
+    },
+    classifiers=[
+        "Development Status :: 3 - Alpha",
+        "Intended Audience :: Developers",
+        "License :: OSI Approved :: MIT License",
+        "Programming Language :: Python :: 3.11",
+    ],
+)
@@ -0,0 +1,331 @@
+"""
+Tests for the Python keystore client
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+import keystore
+from keystore import SecretLoader
+
+PASSPHRASE = "test-passphrase"
+
+# SecureKeyStore.encrypt/saveSecrets (src/keystore.ts), run by Node itself
+NODE_WRITER = """
+const crypto = require('crypto');
+const fs = require('fs');
+const [storePath, passphrase, json] = process.argv.slice(1);
+const salt = crypto.createHash('sha256').update(storePath).digest();
+const key = crypto.scryptSync(passphrase, salt, 32);
+const iv = crypto.randomBytes(16);
+const cipher = crypto.createCipheriv('aes-256-cbc', key, iv);
+let encrypted = cipher.update(json, 'utf8', 'hex');
+encrypted += cipher.final('hex');
+fs.writeFileSync(storePath, iv.toString('hex') + ':' + encrypted, { mode: 0o600 });
+"""
+
+# Stands in for `npm run keystore`, logging each call
+FAKE_CLI = """#!{python}
+import json, os, sys
+args = sys.argv[sys.argv.index("--") + 1:]
+with open(os.environ["FAKE_CLI_LOG"], "a") as log:
+    log.write(" ".join(args) + "\\n")
+print("> aviation@1.0.0 keystore")
+if args[0] == "get":
+    print(json.dumps({{"service": args[2], "key": args[3], "value": "from-cli"}}))
+elif args[0] == "export":
+    print(json.dumps({{"CLI_ONLY": "from-cli"}}))
+"""
+
+
+def _entries(service, values):
+    return {
+        f"{service}:{key}": {
+            "service": service,
+            "key": key,
+            "value": value,
+            "createdAt": "2026-01-01T00:00:00.000Z",
+            "updatedAt": "2026-01-01T00:00:00.000Z",
+        }
+        for key, value in values.items()
+    }
+
+
+def write_vault(path, entries, passphrase=PASSPHRASE):
+    """Encrypt entries into path the way SecureKeyStore does"""
+    salt = hashlib.sha256(str(path).encode("utf-8")).digest()
+    key = hashlib.scrypt(passphrase.encode("utf-8"), salt=salt, n=16384, r=8, p=1, dklen=32)
+    iv = os.urandom(16)
+    padder = padding.PKCS7(128).padder()
+    padded = padder.update(json.dumps(entries).encode("utf-8")) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+    ciphertext = encryptor.update(padded) + encryptor.finalize()
+    path.write_text(f"{iv.hex()}:{ciphertext.hex()}", encoding="utf-8")
+
+
+def bump_mtime(path, seconds=10):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("KEYSTORE_ENCRYPTION_KEY", PASSPHRASE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("AVIATION_KEYSTORE_SOCKET", raising=False)
+    monkeypatch.delenv("AVIATION_KEYSTORE_DISK_CACHE", raising=False)
+    keystore._VAULTS.clear()
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / ".keystore"
+    write_vault(path, {
+        **_entries("flight-planner", {"API_KEY": "secret-1", "PORT": "5000"}),
+        **_entries("flightschool", {"API_KEY": "other-service"}),
+    })
+    return path
+
+
+@pytest.fixture
+def cli_log(monkeypatch, tmp_path):
+    """Path of the log the fake CLI appends its arguments to"""
+    log = tmp_path / "cli.log"
+    log.touch()
+    monkeypatch.setenv("FAKE_CLI_LOG", str(log))
+    return log
+
+
+def make_loader(store, tmp_path, **kwargs):
+    fake_npm = tmp_path / "npm"
+    if not fake_npm.exists():
+        fake_npm.write_text(FAKE_CLI.format(python=sys.executable))
+        fake_npm.chmod(0o755)
+    kwargs.setdefault("daemon_socket", str(tmp_path / "no-daemon.sock"))
+    return SecretLoader(
+        "flight-planner", keystore_path=str(store), npm_executable=str(fake_npm), **kwargs
+    )
+
+
+class TestVault:
+    """The keystore file is decrypted in-process"""
+
+    def test_reads_service_secrets(self, store, tmp_path, cli_log):
+        loader = make_loader(store, tmp_path)
+
+        assert loader.get("API_KEY") == "secret-1"
+        assert loader.list_keys() == ["API_KEY", "PORT"]
+        assert cli_log.read_text() == ""
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_reads_vault_written_by_node(self, tmp_path, cli_log):
+        path = tmp_path / ".keystore"
+        entries = _entries("flight-planner", {"API_KEY": "from-node", "UNICODE": "✈ ü"})
+        subprocess.run(
+            ["node", "-e", NODE_WRITER, str(path), PASSPHRASE, json.dumps(entries)], check=True
+        )
+
+        loader = make_loader(path, tmp_path)
+
+        assert loader.get("API_KEY") == "from-node"
+        assert loader.get("UNICODE") == "✈ ü"
+        assert cli_log.read_text() == ""
+
+    def test_wrong_passphrase_falls_back_to_cli(self, store, tmp_path, cli_log, monkeypatch):
+        monkeypatch.setenv("KEYSTORE_ENCRYPTION_KEY", "not-the-passphrase")
+        loader = make_loader(store, tmp_path)
+
+        assert loader.get("API_KEY") == "from-cli"
+        assert cli_log.read_text() == "get --json flight-planner API_KEY\n"
+
+    def test_missing_file_is_empty(self, tmp_path, cli_log):
+        loader = make_loader(tmp_path / ".keystore", tmp_path, fallback_to_env=False)
+
+        assert loader.get("API_KEY") is None
+        assert loader.list_keys() == []
+
+    def test_rewritten_file_is_reread(self, store, tmp_path):
+        assert make_loader(store, tmp_path).get("PORT") == "5000"
+
+        write_vault(store, _entries("flight-planner", {"PORT": "6000"}))
+        bump_mtime(store)
+
+        assert make_loader(store, tmp_path).get("PORT") == "6000"
+
+
+class TestMisses:
+    """Keys the keystore doesn't hold are remembered"""
+
+    def test_miss_is_cached(self, store, tmp_path, monkeypatch):
+        monkeypatch.setenv("MISSING", "from-env")
+        loader = make_loader(store, tmp_path)
+        reads = []
+        read = loader._get_from_keystore
+        monkeypatch.setattr(loader, "_get_from_keystore", lambda key: reads.append(key) or read(key))
+
+        assert loader.get("MISSING") == "from-env"
+        assert loader.get("MISSING") == "from-env"
+        assert reads == ["MISSING"]
+
+        # use_cache=False asks the keystore again
+        assert loader.get("MISSING", use_cache=False) == "from-env"
+        assert reads == ["MISSING", "MISSING"]
+
+    def test_clear_cache_forgets_misses(self, store, tmp_path):
+        loader = make_loader(store, tmp_path, fallback_to_env=False)
+        assert loader.get("NEW_KEY") is None
+
+        write_vault(store, _entries("flight-planner", {"NEW_KEY": "added"}))
+        bump_mtime(store)
+        assert loader.get("NEW_KEY") is None
+
+        loader.clear_cache()
+        assert loader.get("NEW_KEY") == "added"
+
+
+class TestPrefetch:
+    """prefetch() loads the whole service in one keystore read"""
+
+    def test_prefetch_answers_misses_without_keystore(self, store, tmp_path, monkeypatch):
+        loader = make_loader(store, tmp_path, fallback_to_env=False)
+        assert loader.prefetch()
+        monkeypatch.setattr(loader, "_get_from_keystore", pytest.fail)
+
+        assert loader.get("API_KEY") == "secret-1"
+        assert loader.get("NOT_STORED") is None
+
+    def test_prefetch_through_cli(self, store, tmp_path, cli_log, monkeypatch):
+        monkeypatch.setenv("KEYSTORE_ENCRYPTION_KEY", "not-the-passphrase")
+        loader = make_loader(store, tmp_path)
+
+        assert loader.prefetch()
+        assert loader.get("CLI_ONLY") == "from-cli"
+        assert cli_log.read_text() == "export flight-planner\n"
+
+    def test_get_many(self, store, tmp_path, monkeypatch):
+        monkeypatch.setenv("FROM_ENV", "env-value")
+        loader = make_loader(store, tmp_path)
+
+        values = loader.get_many(["API_KEY", "FROM_ENV", "NOWHERE", "API_KEY"])
+
+        assert values == {"API_KEY": "secret-1", "FROM_ENV": "env-value", "NOWHERE": None}
+        assert loader._prefetched
+
+
+class TestDiskCache:
+    """Secrets are persisted, encrypted, for new processes"""
+
+    def test_new_loader_reads_disk_cache(self, store, tmp_path, monkeypatch):
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "secret-1"
+        cache_file = tmp_path / "cache" / "aviation-keystore" / "flight-planner.enc"
+        assert b"secret-1" not in cache_file.read_bytes()
+
+        monkeypatch.setattr(keystore, "_read_vault", pytest.fail)
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "secret-1"
+
+    def test_stale_once_keystore_is_newer(self, store, tmp_path):
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "secret-1"
+
+        write_vault(store, _entries("flight-planner", {"API_KEY": "rotated"}))
+        bump_mtime(store)
+
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "rotated"
+
+    def test_other_passphrase_cannot_read_it(self, store, tmp_path, cli_log, monkeypatch):
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "secret-1"
+
+        monkeypatch.setenv("KEYSTORE_ENCRYPTION_KEY", "not-the-passphrase")
+        assert make_loader(store, tmp_path, disk_cache=True).get("API_KEY") == "from-cli"
+
+    def test_concurrent_gets(self, store, tmp_path):
+        """Threads sharing a loader don't trip over the cache or its file"""
+        loader = make_loader(store, tmp_path, disk_cache=True)
+        keys = ["API_KEY", "PORT"] * 50 + [f"MISSING_{i}" for i in range(50)]
+
+        with ThreadPoolExecutor(max_workers=9) as executor:
+            values = list(executor.map(loader.get, keys))
+
+        assert values[:2] == ["secret-1", "5000"]
+        assert make_loader(store, tmp_path, disk_cache=True).get("PORT") == "5000"
+
+
+class TestCliOutput:
+    """`--json` output is the last line, after npm's banner"""
+
+    def test_parse_json_line(self):
+        assert keystore._parse_json_line('> keystore\n{"value": "x"}\n') == {"value": "x"}
+        assert keystore._parse_json_line('> keystore\nplain value') is None
+        assert keystore._parse_json_line('["not", "an", "object"]') is None
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix sockets")
+class TestDaemon:
+    """The daemon is used only through a private socket"""
+
+    @pytest.fixture
+    def daemon(self, tmp_path):
+        path = str(tmp_path / "daemon.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+        requests = []
+
+        def serve():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                with conn:
+                    request = json.loads(conn.makefile().readline())
+                    requests.append(request)
+                    conn.sendall(json.dumps({"ok": True, "value": "from-daemon"}).encode() + b"\n")
+
+        threading.Thread(target=serve, daemon=True).start()
+        yield path, requests
+        server.close()
+
+    def test_request_names_the_store(self, tmp_path, daemon, cli_log, monkeypatch):
+        path, requests = daemon
+        os.chmod(path, 0o600)
+        monkeypatch.setattr(keystore, "_read_vault", lambda store_path: None)
+        loader = make_loader(tmp_path / ".keystore", tmp_path, daemon_socket=path)
+
+        assert loader.get("API_KEY") == "from-daemon"
+        assert requests == [{
+            "op": "get",
+            "service": "flight-planner",
+            "key": "API_KEY",
+            "store": os.path.realpath(tmp_path / ".keystore"),
+        }]
+        assert cli_log.read_text() == ""
+
+    def test_socket_open_to_others_is_ignored(self, tmp_path, daemon, cli_log, monkeypatch):
+        path, requests = daemon
+        os.chmod(path, 0o666)
+        monkeypatch.setattr(keystore, "_read_vault", lambda store_path: None)
+        loader = make_loader(tmp_path / ".keystore", tmp_path, daemon_socket=path)
+
+        assert loader.get("API_KEY") == "from-cli"
+        assert requests == []
+
+    def test_default_socket_is_never_in_tmp(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        assert keystore._default_daemon_socket() == str(
+            tmp_path / "cache" / "aviation-keystore" / "daemon.sock"
+        )
@@ -2,26 +2,84 @@
 
 __version__ = "0.2.0"
 
+import importlib
+import importlib.util
+import sys
+from typing import TYPE_CHECKING
+
+
+def _lazy_submodule(name):
+    """
+    Register a sub-package whose code only runs on first attribute access.
+    
+    Uses importlib.util.LazyLoader, so `aviation.integrations.X` and
+    `from aviation.integrations import X` work as with an eager import.
+    """
+    fullname = f"{__name__}.{name}"
+    if fullname in sys.modules:
+        return sys.modules[fullname]
+    spec = importlib.util.find_spec(fullname)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    return module
+
+
+# Sub-packages and re-exports are only executed when first used, so each
+# caller only pays for the parts of the SDK it actually uses. `weather` is
+# resolved by __getattr__ so it can still degrade to None when its optional
+# dependencies are missing.
+integrations = _lazy_submodule("integrations")
+
 # Airport services
-from .airports import (
-    Airport,
-    AirportDatabase,
-    get_airport,
-    search_airports,
-    search_airports_advanced,
-    get_airport_by_code,
-    find_nearby_airports,
-    haversine_distance,
-    load_airport_cache,
-)
-
-# Import sub-packages for convenient access
-try:
-    from . import weather
-except (ModuleNotFoundError, ImportError):
-    weather = None
+_AIRPORT_EXPORTS = {
+    "Airport",
+    "AirportDatabase",
+    "get_airport",
+    "search_airports",
+    "search_airports_advanced",
+    "get_airport_by_code",
+    "find_nearby_airports",
+    "haversine_distance",
+    "load_airport_cache",
+}
+
+
+def __getattr__(name):
+    # PEP 562: airport re-exports resolve from aviation.airports on first use
+    if name == "weather":
+        try:
+            value = importlib.import_module(".weather", __name__)
+        except ImportError:
+            value = None
+        globals()[name] = value
+        return value
+    if name not in _AIRPORT_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".airports", __name__), name)
+    globals()[name] = value
+    return value
 
-from . import integrations
+
+def __dir__():
+    return sorted(set(globals()) | _AIRPORT_EXPORTS | {"weather"})
+
+
+if TYPE_CHECKING:
+    from . import weather
+    from .airports import (
+        Airport,
+        AirportDatabase,
+        get_airport,
+        search_airports,
+        search_airports_advanced,
+        get_airport_by_code,
+        find_nearby_airports,
+        haversine_distance,
+        load_airport_cache,
+    )
 
 __all__ = [
     # Airports
@@ -36,7 +94,5 @@ __all__ = [
     "load_airport_cache",
     # Modules
     "integrations",
+    "weather",
 ]
-
-if weather is not None:
-    __all__.append("weather")
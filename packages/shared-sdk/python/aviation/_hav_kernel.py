@@ -0,0 +1,60 @@
+"""Great-circle distance kernel for airport proximity search.
+
+Compiled with Numba (one fused, multi-threaded loop with no temporaries) when
+it is installed; otherwise the equivalent NumPy expression is used. Callers
+only import this module when NumPy is available.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None  # type: ignore
+
+
+def _hav_dist_numpy(phi, lam, lat_rad, lon_rad, cos_lat, scale, out):
+    sin_half_dphi = np.sin((lat_rad - phi) / 2)
+    sin_half_dlambda = np.sin((lon_rad - lam) / 2)
+    a = sin_half_dphi ** 2 + math.cos(phi) * cos_lat * sin_half_dlambda ** 2
+    np.multiply(scale, 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)), out=out)
+    return out
+
+
+if numba is not None:
+
+    # fastmath is left off: reassociation could move airports across the
+    # radius boundary relative to the NumPy and pure-Python paths.
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _hav_dist_numba(phi, lam, lat_rad, lon_rad, cos_lat, scale, out):  # pragma: no cover
+        cos_phi = math.cos(phi)
+        for i in numba.prange(lat_rad.shape[0]):
+            sin_half_dphi = math.sin((lat_rad[i] - phi) / 2)
+            sin_half_dlambda = math.sin((lon_rad[i] - lam) / 2)
+            a = sin_half_dphi ** 2 + cos_phi * cos_lat[i] * sin_half_dlambda ** 2
+            out[i] = scale * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+        return out
+
+    hav_dist_all = _hav_dist_numba
+else:
+    hav_dist_all = _hav_dist_numpy
+
+
+def distances(
+    phi: float,
+    lam: float,
+    lat_rad: np.ndarray,
+    lon_rad: np.ndarray,
+    cos_lat: np.ndarray,
+    scale: float,
+) -> np.ndarray:
+    """Great-circle distance from (phi, lam) to each point, all in radians.
+
+    ``scale`` is the sphere radius in the output unit.
+    """
+    out = np.empty(lat_rad.shape[0], dtype=np.float64)
+    return hav_dist_all(phi, lam, lat_rad, lon_rad, cos_lat, scale, out)
@@ -0,0 +1,126 @@
+"""Numba-compiled navigation kernels.
+
+Native versions of the trig-heavy functions in aviation.navigation, with the
+distance unit already resolved to an earth radius by the caller, plus a
+multi-threaded batch haversine. Importing this module raises ImportError when
+Numba is not installed, and aviation.navigation keeps its pure-Python math.
+
+Nothing is compiled at import: each kernel is compiled (or loaded from
+Numba's on-disk cache) on its first call. aviation.navigation only passes
+floats, so each scalar kernel gets a single float64 specialization. A math
+domain error (which raises ValueError in Python) comes back as NaN, and the
+caller then falls back to the Python implementation, which behaves exactly
+as before.
+
+All kernels release the GIL while they run (nogil), so simulations calling
+them from several threads, or splitting a batch with ThreadPoolExecutor,
+compute in parallel.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numba
+
+# Compiled lazily, on first call. fastmath is left off, as in _hav_kernel, so
+# results agree with the pure-Python functions to within an ulp or so.
+_jit = numba.njit(cache=True, nogil=True)
+
+
+@_jit
+def haversine(lat1, lon1, lat2, lon2, radius):  # pragma: no cover
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_phi = math.radians(lat2 - lat1)
+    delta_lambda = math.radians(lon2 - lon1)
+
+    a = (math.sin(delta_phi / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2)
+
+    return radius * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def haversine_batch(lat1, lon1, lat2, lon2, radius, out):  # pragma: no cover
+    for i in numba.prange(out.shape[0]):
+        out[i] = haversine(lat1[i], lon1[i], lat2[i], lon2[i], radius)
+    return out
+
+
+@_jit
+def midpoint(lat1, lon1, lat2, lon2):  # pragma: no cover
+    phi1 = math.radians(lat1)
+    lambda1 = math.radians(lon1)
+    phi2 = math.radians(lat2)
+    delta_lambda = math.radians(lon2 - lon1)
+
+    bx = math.cos(phi2) * math.cos(delta_lambda)
+    by = math.cos(phi2) * math.sin(delta_lambda)
+
+    phi3 = math.atan2(
+        math.sin(phi1) + math.sin(phi2),
+        math.sqrt((math.cos(phi1) + bx) ** 2 + by ** 2)
+    )
+    lambda3 = lambda1 + math.atan2(by, math.cos(phi1) + bx)
+
+    return (math.degrees(phi3), math.degrees(lambda3))
+
+
+@_jit
+def destination(lat, lon, distance, bearing, radius):  # pragma: no cover
+    delta = distance / radius
+    theta = math.radians(bearing)
+
+    phi1 = math.radians(lat)
+    lambda1 = math.radians(lon)
+
+    phi2 = math.asin(
+        math.sin(phi1) * math.cos(delta) +
+        math.cos(phi1) * math.sin(delta) * math.cos(theta)
+    )
+    lambda2 = lambda1 + math.atan2(
+        math.sin(theta) * math.sin(delta) * math.cos(phi1),
+        math.cos(delta) - math.sin(phi1) * math.sin(phi2)
+    )
+
+    return (math.degrees(phi2), math.degrees(lambda2))
+
+
+@_jit
+def initial_bearing(lat1, lon1, lat2, lon2):  # pragma: no cover
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_lambda = math.radians(lon2 - lon1)
+
+    y = math.sin(delta_lambda) * math.cos(phi2)
+    x = (math.cos(phi1) * math.sin(phi2) -
+         math.sin(phi1) * math.cos(phi2) * math.cos(delta_lambda))
+
+    return (math.degrees(math.atan2(y, x)) + 360) % 360
+
+
+@_jit
+def wind_correction_angle(true_airspeed, true_course, wind_direction, wind_speed):  # pragma: no cover
+    crosswind = wind_speed * math.sin(math.radians(wind_direction) - math.radians(true_course))
+    return math.degrees(math.asin(crosswind / true_airspeed))
+
+
+@_jit
+def ground_speed(true_airspeed, true_course, wind_direction, wind_speed):  # pragma: no cover
+    course_rad = math.radians(true_course)
+    wind_dir_rad = math.radians(wind_direction)
+
+    headwind = wind_speed * math.cos(wind_dir_rad - course_rad)
+    crosswind = wind_speed * math.sin(wind_dir_rad - course_rad)
+
+    return math.sqrt((true_airspeed + headwind) ** 2 + crosswind ** 2)
+
+
+@_jit
+def ias_to_tas(indicated_airspeed_kts, altitude_ft, temperature_c):  # pragma: no cover
+    standard_temp_c = 15 - (0.00198 * altitude_ft)
+    temp_ratio = (temperature_c + 273.15) / (standard_temp_c + 273.15)
+    altitude_correction = 1 + (altitude_ft / 1000) * 0.02
+
+    return indicated_airspeed_kts * altitude_correction * math.sqrt(temp_ratio)
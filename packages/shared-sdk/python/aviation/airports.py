@@ -5,20 +5,102 @@ Provides airport lookup, search, and geospatial queries for aviation application
 Extracted from flight-planner for shared use across the monorepo.
 """
 
+import bisect
 import difflib
+import functools
+import hashlib
+import heapq
 import json
+import logging
 import math
 import os
+import pickle
 import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from sys import intern
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
 from .navigation import haversine_distance as _haversine_distance
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from . import _hav_kernel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Indel
+except ImportError:
+    rapidfuzz_process = None
+    Indel = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the binary airport cache changes
+_BINARY_CACHE_VERSION = 2
+
+# Distinct searches remembered per database (see `search_airports`)
+_SEARCH_CACHE_SIZE = 512
+
+# Below this many airports a radius query just scans every distance
+_TREE_MIN_AIRPORTS = 1024
+
+# Side of a latitude/longitude grid cell, in degrees, and the most cells a
+# radius query walks before it scans the coordinate columns instead
+_GRID_CELL_DEG = 1
+_GRID_MAX_CELLS = 2048
+
+# Minimum SequenceMatcher ratio for a fuzzy text match
+_FUZZY_MIN_RATIO = 0.6
+# Highest score a fuzzy-only match can get (a ratio of 1.0 in `_text_score`)
+_FUZZY_MAX_SCORE = 0.5 + (1.0 - _FUZZY_MIN_RATIO) * 0.5
+# Separates the per-airport search strings in the joined text index
+_TEXT_SEPARATOR = "\x00"
+
+# Record fields whose values repeat across many airports; interned at load
+# so each distinct value is stored once
+_INTERNED_FIELDS = ("country", "type", "city")
+
+# Separator between a code and its description ("KSFO - San Francisco ...")
+_CODE_DASH_RE = re.compile(r"\s*[-–—]\s*")
+_AIRPORT_CODE_RE = re.compile(r"[A-Z0-9]{3,5}")
+
+
+def _char_bucket(ch: str) -> int:
+    """Bucket of a character in the fuzzy-match prefilter's count matrix."""
+    if "a" <= ch <= "z":
+        return ord(ch) - ord("a")
+    if "0" <= ch <= "9":
+        return 26 + ord(ch) - ord("0")
+    if ch == " ":
+        return 36
+    return 37
+
+
+_CHAR_BUCKETS = 38
+
 
 class Airport(Dict[str, Any]):
     """Airport data structure (dictionary with typed access)."""
     
+    # Results stay plain dicts for callers and JSON; no per-instance
+    # __dict__ or weakref slot on top of the dict itself
+    __slots__ = ()
+    
     @property
     def icao(self) -> str:
         return self.get('icao', '')
@@ -60,6 +142,18 @@ class Airport(Dict[str, Any]):
         return self.get('distance_nm')
 
 
+class _SearchRecord(NamedTuple):
+    """Per-airport search fields, normalized once rather than per query."""
+    
+    key: str  # deduplication key
+    codes: FrozenSet[str]  # lower-cased ICAO, IATA and alternate codes
+    icao: str  # lower-cased
+    iata: str  # lower-cased
+    name: str  # lower-cased
+    code_hay: str
+    text_hay: str
+
+
 def _resolve_airport_data_path(data_path: Optional[str]) -> Path:
     if data_path:
         return Path(data_path)
@@ -86,6 +180,18 @@ def _resolve_airport_data_path(data_path: Optional[str]) -> Path:
     return default_path
 
 
+def _binary_cache_path(data_path: Path) -> Optional[Path]:
+    """
+    Where the parsed copy of an airport JSON file is cached, or None when
+    $AVIATION_AIRPORTS_BINARY_CACHE is '0'.
+    """
+    if os.environ.get("AVIATION_AIRPORTS_BINARY_CACHE") == "0":
+        return None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    digest = hashlib.sha256(str(data_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "aviation-sdk" / f"airports-{digest}.pickle"
+
+
 class AirportDatabase:
     """Airport database for loading, caching, and searching airports."""
     
@@ -98,21 +204,480 @@ class AirportDatabase:
         """
         self.data_path = _resolve_airport_data_path(data_path)
         
-        self.airports: List[Dict[str, Any]] = []
+        # Bumped by the `airports` setter; with the list's length it tells
+        # `_ensure_indexes` when the indexes are stale
+        self._airports_version = 0
+        self.airports = []
         self.loaded = False
+        # Held while loading so concurrent first calls parse the file once
+        self._load_lock = threading.Lock()
+        # Upper-cased ICAO/IATA code -> row (see below) of the first airport
+        # with coordinates carrying it. Built on first use for the current
+        # `airports` list, which callers may also assign directly.
+        self._by_code: Dict[str, int] = {}
+        # Airports with coordinates, one row each, stored as parallel columns
+        # rather than a dict per airport: their positions in `airports`, the
+        # normalized fields returned to callers (dicts are only built for the
+        # airports actually returned, by `_make_airport`), and latitude and
+        # longitude in degrees and radians, plus cos(latitude), which never
+        # changes (NumPy arrays when available) for distance queries
+        self._geo_positions: List[int] = []
+        self._col_icao: List[str] = []
+        self._col_iata: List[str] = []
+        self._col_name: List[Optional[str]] = []
+        self._col_city: List[str] = []
+        self._col_country: List[str] = []
+        self._col_elevation: List[Any] = []
+        self._col_type: List[str] = []
+        self._geo_lat: Any = []
+        self._geo_lon: Any = []
+        self._geo_lat_rad: Any = []
+        self._geo_lon_rad: Any = []
+        self._geo_cos_lat: Any = []
+        # KD-tree over the airports' 3D unit vectors (a chord-length ball is
+        # a great-circle radius), built by the first radius query
+        self._geo_tree: Any = None
+        # Rows bucketed by `_GRID_CELL_DEG` latitude/longitude cell, used for
+        # radius queries when there is no KD-tree; built on first use
+        self._geo_grid: Optional[Dict[Tuple[int, int], List[int]]] = None
+        # Search records for the same airports, built by the first search
+        self._records: Optional[List[_SearchRecord]] = None
+        # Text search index over the same airports, built by the first text
+        # query: every airport's lower-cased search string joined into one
+        # blob (so substring matching is a C-level str.find), whether each
+        # airport is the first with its dedup key, the rows of those airports
+        # by lower-cased code (exact code matches), their lower-cased ICAO and
+        # IATA codes sorted with the matching rows (prefix matches by
+        # bisection), and per-field character counts and values that bound
+        # SequenceMatcher ratios from above
+        self._text_blob = ""
+        self._text_starts: List[int] = []
+        self._first_of_key: List[bool] = []
+        self._rows_by_code: Dict[str, List[int]] = {}
+        self._code_prefix_indexes: List[Tuple[List[str], List[int]]] = []
+        self._fuzzy_fields: Optional[List[Tuple[Any, Any, List[str]]]] = None
+        self._indexed_stamp: Optional[Tuple[int, int]] = None
+        # Results of recent searches, cleared whenever the airports are
+        # re-indexed
+        self._cached_search = functools.lru_cache(maxsize=_SEARCH_CACHE_SIZE)(self._search)
     
     def _load_airports(self) -> None:
-        """Load airport data from JSON file."""
+        """
+        Load airport data from JSON file.
+        
+        The parsed records and index columns are cached in a pickle under
+        $XDG_CACHE_HOME/aviation-sdk, so later processes skip both the JSON
+        parse and the index build until the JSON file changes.
+        """
         if self.loaded:
             return
         
-        try:
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                self.airports = json.load(f)
+        with self._load_lock:
+            if self.loaded:
+                return
+            
+            if self._load_binary_cache():
+                self.loaded = True
+                return
+            
+            try:
+                with open(self.data_path, 'rb') as f:
+                    data = f.read()
+                self.airports = orjson.loads(data) if orjson else json.loads(data)
+                self._intern_fields(self.airports)
+            except Exception as e:
+                logger.warning("Failed to load airport data: %s", e)
+                self.airports = []
+                return
+            
+            self._save_binary_cache()
             self.loaded = True
-        except Exception as e:
-            print(f"Failed to load airport data: {e}")
-            self.airports = []
+    
+    @staticmethod
+    def _intern_fields(airports: List[Dict[str, Any]]) -> None:
+        """Replace repeated string values (country, type, city) with interned copies."""
+        for airport in airports:
+            for field in _INTERNED_FIELDS:
+                value = airport.get(field)
+                if type(value) is str:
+                    airport[field] = intern(value)
+    
+    def _binary_cache_stamp(self) -> Tuple[int, int, int]:
+        """Identifies the JSON file contents a binary cache was built from."""
+        stat = self.data_path.stat()
+        return (_BINARY_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    def _load_binary_cache(self) -> bool:
+        """Restore records and columns from the binary cache if it is current."""
+        cache_path = _binary_cache_path(self.data_path)
+        if cache_path is None:
+            return False
+        try:
+            stamp = self._binary_cache_stamp()
+            with open(cache_path, "rb") as f:
+                payload = pickle.load(f)
+            if payload["stamp"] != stamp:
+                return False
+            airports, columns = payload["airports"], payload["columns"]
+        except Exception:
+            # Missing, stale-format or unreadable caches are rebuilt from JSON
+            return False
+        
+        self.airports = airports
+        self._set_columns(columns)
+        self._indexed_stamp = self._airports_stamp()
+        return True
+    
+    def _save_binary_cache(self) -> None:
+        """Index the freshly parsed JSON and write the binary cache (best effort)."""
+        cache_path = _binary_cache_path(self.data_path)
+        if cache_path is None:
+            return
+        columns = self._index_columns()
+        self._set_columns(columns)
+        self._indexed_stamp = self._airports_stamp()
+        try:
+            payload = pickle.dumps(
+                {"stamp": self._binary_cache_stamp(), "airports": self.airports, "columns": columns},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            pass
+    
+    @property
+    def airports(self) -> List[Dict[str, Any]]:
+        """
+        The airport records, in file order.
+        
+        The indexes and cached search results follow assignments and changes
+        in length; after editing records in place, assign the list again
+        (``db.airports = db.airports``).
+        """
+        return self._airports
+    
+    @airports.setter
+    def airports(self, airports: List[Dict[str, Any]]) -> None:
+        self._airports = airports
+        self._airports_version += 1
+    
+    def _airports_stamp(self) -> Tuple[int, int]:
+        return self._airports_version, len(self._airports)
+    
+    def _ensure_indexes(self) -> None:
+        """(Re)build the lookup indexes if `airports` has been replaced or resized."""
+        stamp = self._airports_stamp()
+        if self._indexed_stamp != stamp:
+            self._build_indexes()
+            self._indexed_stamp = stamp
+    
+    def _build_indexes(self) -> None:
+        """Build the per-row columns and code index for airports with coordinates."""
+        self._set_columns(self._index_columns())
+    
+    def _index_columns(self) -> Dict[str, Any]:
+        """Per-row columns and code index for `airports`, as plain lists and dicts."""
+        by_code: Dict[str, int] = {}
+        positions: List[int] = []
+        icaos: List[str] = []
+        iatas: List[str] = []
+        names: List[Optional[str]] = []
+        cities: List[str] = []
+        countries: List[str] = []
+        elevations: List[Any] = []
+        types: List[str] = []
+        lats: List[float] = []
+        lons: List[float] = []
+        for position, airport in enumerate(self.airports):
+            lat, lon = self._extract_lat_lon(airport)
+            if lat is None or lon is None:
+                continue
+            
+            icao_code = (airport.get("icao") or airport.get("icaoCode") or "").upper()
+            iata_code = (airport.get("iata") or airport.get("iataCode") or "").upper()
+            by_code.setdefault(icao_code, len(positions))
+            by_code.setdefault(iata_code, len(positions))
+            
+            positions.append(position)
+            icaos.append(icao_code)
+            iatas.append(iata_code)
+            names.append(airport.get("name"))
+            cities.append(airport.get("city") or "")
+            countries.append(airport.get("country") or "")
+            elevations.append(airport.get("elevation"))
+            types.append(airport.get("type") or "")
+            lats.append(float(lat))
+            lons.append(float(lon))
+        return {
+            "by_code": by_code,
+            "positions": positions,
+            "icao": icaos,
+            "iata": iatas,
+            "name": names,
+            "city": cities,
+            "country": countries,
+            "elevation": elevations,
+            "type": types,
+            "latitude": lats,
+            "longitude": lons,
+        }
+    
+    def _set_columns(self, columns: Dict[str, Any]) -> None:
+        """Install columns from `_index_columns` and reset the derived indexes."""
+        lats = columns["latitude"]
+        lons = columns["longitude"]
+        self._by_code = columns["by_code"]
+        self._geo_positions = columns["positions"]
+        self._col_icao = columns["icao"]
+        self._col_iata = columns["iata"]
+        self._col_name = columns["name"]
+        self._col_city = columns["city"]
+        self._col_country = columns["country"]
+        self._col_elevation = columns["elevation"]
+        self._col_type = columns["type"]
+        self._geo_tree = None
+        self._geo_grid = None
+        self._cached_search.cache_clear()
+        self._records = None
+        self._text_starts = []
+        self._fuzzy_fields = None
+        if np is not None:
+            self._geo_lat = np.array(lats, dtype=np.float64)
+            self._geo_lon = np.array(lons, dtype=np.float64)
+            self._geo_lat_rad = np.radians(self._geo_lat)
+            self._geo_lon_rad = np.radians(self._geo_lon)
+            self._geo_cos_lat = np.cos(self._geo_lat_rad)
+        else:
+            self._geo_lat = lats
+            self._geo_lon = lons
+            self._geo_lat_rad = [math.radians(lat) for lat in lats]
+            self._geo_lon_rad = [math.radians(lon) for lon in lons]
+            self._geo_cos_lat = [math.cos(lat) for lat in self._geo_lat_rad]
+    
+    def _make_airport(self, row: int) -> Airport:
+        """Build the normalized airport for a row of the columns."""
+        return Airport({
+            "icao": self._col_icao[row],
+            "iata": self._col_iata[row],
+            "name": self._col_name[row],
+            "city": self._col_city[row],
+            "country": self._col_country[row],
+            "latitude": float(self._geo_lat[row]),
+            "longitude": float(self._geo_lon[row]),
+            "elevation": self._col_elevation[row],
+            "type": self._col_type[row],
+        })
+    
+    def _distances_nm(self, latitude: float, longitude: float, idx: Any = None) -> Any:
+        """
+        Haversine distance from a point to every airport with coordinates
+        (or to the rows `idx` of the coordinate columns).
+        
+        Same formula as `_haversine_nm`, using the precomputed radians and
+        cos(latitude) columns, so the only per-airport transcendentals are the
+        two half-angle sines and the final atan2. Evaluated over the whole
+        column at once when NumPy is available (in a compiled loop when Numba
+        is installed too).
+        """
+        R_NM = 3440.065  # Earth radius in nautical miles
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        cos_phi = math.cos(phi)
+        
+        if np is None:
+            rows = range(len(self._geo_lat_rad)) if idx is None else idx
+            distances = []
+            for row in rows:
+                lat_rad = self._geo_lat_rad[row]
+                lon_rad = self._geo_lon_rad[row]
+                cos_lat = self._geo_cos_lat[row]
+                a = (
+                    math.sin((lat_rad - phi) / 2) ** 2
+                    + cos_phi * cos_lat * math.sin((lon_rad - lam) / 2) ** 2
+                )
+                distances.append(R_NM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+            return distances
+        
+        lat_rad, lon_rad, cos_lat = self._geo_lat_rad, self._geo_lon_rad, self._geo_cos_lat
+        if idx is not None:
+            lat_rad, lon_rad, cos_lat = lat_rad[idx], lon_rad[idx], cos_lat[idx]
+        
+        return _hav_kernel.distances(phi, lam, lat_rad, lon_rad, cos_lat, R_NM)
+    
+    def _rows_near(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_nm: Optional[float],
+    ) -> List[Tuple[int, float]]:
+        """
+        (row, distance) pairs within radius_nm (all if None), in file order.
+        
+        Rows index the coordinate columns and search records.
+        """
+        self._ensure_indexes()
+        
+        candidates = None
+        if radius_nm is not None:
+            candidates = self._tree_candidates(latitude, longitude, float(radius_nm))
+            if candidates is None:
+                candidates = self._bbox_candidates(latitude, longitude, float(radius_nm))
+        if candidates is not None:
+            distances = self._distances_nm(latitude, longitude, candidates)
+            if np is None:
+                return [
+                    (row, dist)
+                    for row, dist in zip(candidates, distances)
+                    if dist <= float(radius_nm)
+                ]
+            keep = distances <= float(radius_nm)
+            return list(zip(candidates[keep].tolist(), distances[keep].tolist()))
+        
+        distances = self._distances_nm(latitude, longitude)
+        if radius_nm is None:
+            keep_rows: Any = range(len(distances))
+        elif np is not None:
+            keep_rows = np.flatnonzero(distances <= float(radius_nm)).tolist()
+        else:
+            keep_rows = [i for i, dist in enumerate(distances) if dist <= float(radius_nm)]
+        if np is not None:
+            distances = distances.tolist()
+        
+        return [(i, distances[i]) for i in keep_rows]
+    
+    def _tree_candidates(self, latitude: float, longitude: float, radius_nm: float) -> Any:
+        """
+        Sorted coordinate rows that may lie within radius_nm, from the KD-tree.
+        
+        Returns None when the tree is unavailable or not worthwhile, in which
+        case every airport is checked.
+        """
+        if np is None or cKDTree is None or len(self._geo_positions) < _TREE_MIN_AIRPORTS:
+            return None
+        angle = radius_nm / 3440.065
+        if angle >= math.pi:
+            return None
+        
+        if self._geo_tree is None:
+            self._geo_tree = cKDTree(self._unit_vectors(self._geo_lat_rad, self._geo_lon_rad))
+        # Widen the chord slightly so float error never drops a boundary
+        # airport; the exact haversine check makes the final decision
+        chord = 2 * math.sin(angle / 2) * (1 + 1e-9) + 1e-12
+        query = self._unit_vectors(np.radians([latitude]), np.radians([longitude]))[0]
+        rows = np.asarray(self._geo_tree.query_ball_point(query, chord), dtype=np.intp)
+        rows.sort()
+        return rows
+    
+    def _bbox_candidates(self, latitude: float, longitude: float, radius_nm: float) -> Any:
+        """
+        Sorted coordinate rows inside the latitude/longitude box around the
+        radius_nm circle.
+        
+        Small boxes are answered from the grid buckets it overlaps (a superset
+        of the box); larger ones scan the columns with only subtractions and
+        comparisons per airport. Either way the haversine runs on the few rows
+        that survive rather than the whole column. Returns None when the
+        circle is too large for the box to exclude anything.
+        """
+        angle = radius_nm / 3440.065
+        if angle >= math.pi:
+            return None
+        
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        # Widen slightly so float error never drops a boundary airport; the
+        # exact haversine check makes the final decision
+        dlat_max = angle * (1 + 1e-9) + 1e-12
+        if abs(phi) + dlat_max >= math.pi / 2:
+            # The circle covers a pole, so it spans every longitude
+            dlon_max = None
+        else:
+            # Widest longitude offset of the circle, reached poleward of the
+            # query latitude (wider than radius / cos(latitude))
+            dlon_max = math.asin(min(1.0, math.sin(angle) / math.cos(phi)))
+            dlon_max = dlon_max * (1 + 1e-9) + 1e-12
+        
+        rows = self._grid_candidates(phi, lam, dlat_max, dlon_max)
+        if rows is not None:
+            return rows if np is None else np.array(rows, dtype=np.intp)
+        
+        if np is None:
+            rows = []
+            for row, (lat_rad, lon_rad) in enumerate(zip(self._geo_lat_rad, self._geo_lon_rad)):
+                if abs(lat_rad - phi) > dlat_max:
+                    continue
+                # Longitude difference wrapped into [-pi, pi) across the dateline
+                if dlon_max is not None and abs((lon_rad - lam + math.pi) % (2 * math.pi) - math.pi) > dlon_max:
+                    continue
+                rows.append(row)
+            return rows
+        
+        mask = np.abs(self._geo_lat_rad - phi) <= dlat_max
+        if dlon_max is not None:
+            dlon = np.remainder(self._geo_lon_rad - lam + math.pi, 2 * math.pi) - math.pi
+            mask &= np.abs(dlon) <= dlon_max
+        return np.flatnonzero(mask)
+    
+    def _grid_candidates(
+        self,
+        phi: float,
+        lam: float,
+        dlat_max: float,
+        dlon_max: Optional[float],
+    ) -> Optional[List[int]]:
+        """
+        Sorted rows in the grid cells overlapping the box of half-widths
+        dlat_max and dlon_max (None for every longitude) around (phi, lam),
+        all in radians; None when the box covers more than `_GRID_MAX_CELLS`.
+        """
+        columns = 360 // _GRID_CELL_DEG
+        lat_cells = range(
+            math.floor(math.degrees(phi - dlat_max) / _GRID_CELL_DEG),
+            math.floor(math.degrees(phi + dlat_max) / _GRID_CELL_DEG) + 1,
+        )
+        if dlon_max is None:
+            lon_cells: Any = range(columns)
+        else:
+            first = math.floor(math.degrees(lam - dlon_max) / _GRID_CELL_DEG)
+            last = math.floor(math.degrees(lam + dlon_max) / _GRID_CELL_DEG)
+            if last - first + 1 >= columns:
+                lon_cells = range(columns)
+            else:
+                # Cells past the dateline wrap around to the other side
+                lon_cells = [cell % columns for cell in range(first, last + 1)]
+        if len(lat_cells) * len(lon_cells) > _GRID_MAX_CELLS:
+            return None
+        
+        grid = self._geo_grid
+        if grid is None:
+            grid = {}
+            lats = self._geo_lat.tolist() if np is not None else self._geo_lat
+            lons = self._geo_lon.tolist() if np is not None else self._geo_lon
+            for row, (lat, lon) in enumerate(zip(lats, lons)):
+                cell = (
+                    math.floor(lat / _GRID_CELL_DEG),
+                    math.floor(lon / _GRID_CELL_DEG) % columns,
+                )
+                grid.setdefault(cell, []).append(row)
+            self._geo_grid = grid
+        
+        rows: List[int] = []
+        for lat_cell in lat_cells:
+            for lon_cell in lon_cells:
+                bucket = grid.get((lat_cell, lon_cell))
+                if bucket:
+                    rows.extend(bucket)
+        rows.sort()
+        return rows
+    
+    @staticmethod
+    def _unit_vectors(lat_rad: Any, lon_rad: Any) -> Any:
+        cos_lat = np.cos(lat_rad)
+        return np.column_stack((cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)))
     
     @staticmethod
     def _normalize_airport_code(value: str) -> str:
@@ -124,14 +689,19 @@ class AirportDatabase:
         if not value:
             return ""
         
-        before_dash = re.split(r"\s*[-–—]\s*", value.strip(), maxsplit=1)[0]
+        stripped = value.strip()
+        # Fast path: already a bare code, which is what most lookups pass
+        if 3 <= len(stripped) <= 5 and stripped.isascii() and stripped.isalnum():
+            return stripped.upper()
+        
+        before_dash = _CODE_DASH_RE.split(stripped, maxsplit=1)[0]
         token = before_dash.strip().split()[0] if before_dash.strip() else ""
         token_u = token.upper()
         
-        if re.fullmatch(r"[A-Z0-9]{3,5}", token_u):
+        if _AIRPORT_CODE_RE.fullmatch(token_u):
             return token_u
         
-        return value.strip().upper()
+        return stripped.upper()
     
     @staticmethod
     def _candidate_codes(code_u: str) -> Set[str]:
@@ -188,8 +758,8 @@ class AirportDatabase:
         R_NM = 3440.065  # Earth radius in nautical miles
         phi1 = math.radians(lat1)
         phi2 = math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlambda = math.radians(lon2 - lon1)
+        dphi = phi2 - phi1
+        dlambda = math.radians(lon2) - math.radians(lon1)
         a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return R_NM * c
@@ -205,34 +775,242 @@ class AirportDatabase:
             Airport data or None if not found
         """
         self._load_airports()
+        self._ensure_indexes()
         
         code_u = self._normalize_airport_code(code)
-        candidates = self._candidate_codes(code_u)
+        rows = [
+            self._by_code[candidate]
+            for candidate in self._candidate_codes(code_u)
+            if candidate in self._by_code
+        ]
+        if not rows:
+            return None
         
-        for airport in self.airports:
-            icao_code = (airport.get("icao") or airport.get("icaoCode") or "").upper()
-            iata_code = (airport.get("iata") or airport.get("iataCode") or "").upper()
-            
-            if not ({icao_code, iata_code} & candidates):
-                continue
-            
-            lat, lon = self._extract_lat_lon(airport)
-            if lat is None or lon is None:
-                continue
+        # Candidates can hit different airports (e.g. "7S5" and "K7S5"); return
+        # the one that comes first in the file
+        return self._make_airport(min(rows))
+    
+    @staticmethod
+    def _text_score(q: str, record: _SearchRecord) -> Optional[float]:
+        """Relevance of an airport to a lower-cased query; None if it doesn't match."""
+        # Exact code match
+        if q in record.codes:
+            return 1.0
+        # ICAO starts with query
+        if record.icao.startswith(q):
+            return 0.95
+        # IATA starts with query
+        if record.iata.startswith(q):
+            return 0.9
+        # Code contains query
+        if q in record.code_hay:
+            return 0.85
+        # Text contains query
+        if q in record.text_hay:
+            return 0.65
+        # Fuzzy match
+        ratio = max(
+            AirportDatabase._fuzzy_ratio(q, record.icao),
+            AirportDatabase._fuzzy_ratio(q, record.iata),
+            AirportDatabase._fuzzy_ratio(q, record.name),
+        )
+        if ratio < _FUZZY_MIN_RATIO:
+            return None
+        return 0.5 + (ratio - _FUZZY_MIN_RATIO) * 0.5
+    
+    @staticmethod
+    def _fuzzy_ratio(q: str, value: str) -> float:
+        """
+        SequenceMatcher ratio of q and value, or 0.0 when RapidFuzz shows it
+        is below the fuzzy threshold (so it can't affect the score).
+        """
+        if Indel is not None and Indel.normalized_similarity(q, value) < _FUZZY_MIN_RATIO - 1e-9:
+            return 0.0
+        return difflib.SequenceMatcher(None, q, value).ratio()
+    
+    def _search_records(self) -> List[_SearchRecord]:
+        """Search records for the airports with coordinates, built on first use."""
+        self._ensure_indexes()
+        if self._records is not None:
+            return self._records
+        
+        records = []
+        for row in range(len(self._geo_positions)):
+            icao_code = self._col_icao[row]
+            iata_code = self._col_iata[row]
+            alt_codes = self._candidate_codes(icao_code)
+            name = str(self._col_name[row] or "")
+            city = str(self._col_city[row])
+            country = str(self._col_country[row])
             
-            return Airport({
-                "icao": icao_code,
-                "iata": iata_code,
-                "name": airport.get("name"),
-                "city": airport.get("city") or "",
-                "country": airport.get("country") or "",
-                "latitude": float(lat),
-                "longitude": float(lon),
-                "elevation": airport.get("elevation"),
-                "type": airport.get("type") or "",
-            })
+            key = (
+                icao_code
+                or iata_code
+                or f"{float(self._geo_lat[row])},{float(self._geo_lon[row])}"
+            )
+            code_hay = " ".join(sorted({icao_code, iata_code, *alt_codes})).lower()
+            records.append(_SearchRecord(
+                key=key,
+                codes=frozenset(c.lower() for c in {icao_code, iata_code, *alt_codes} if c),
+                icao=icao_code.lower(),
+                iata=iata_code.lower(),
+                name=name.lower(),
+                code_hay=code_hay,
+                text_hay=f"{code_hay} {name} {city} {country}".lower(),
+            ))
+        self._records = records
+        return records
+    
+    def _build_text_index(self) -> None:
+        """Build the text search index for the airports with coordinates."""
+        records = self._search_records()
+        hays = [record.text_hay for record in records]
+        fields = [
+            [record.icao for record in records],
+            [record.iata for record in records],
+            [record.name for record in records],
+        ]
+        first_of_key: List[bool] = []
+        rows_by_code: Dict[str, List[int]] = {}
+        seen: Set[str] = set()
+        for row, record in enumerate(records):
+            first_of_key.append(record.key not in seen)
+            seen.add(record.key)
+            if first_of_key[row]:
+                for code in record.codes:
+                    rows_by_code.setdefault(code, []).append(row)
         
-        return None
+        starts = []
+        offset = 0
+        for hay in hays:
+            starts.append(offset)
+            offset += len(hay) + len(_TEXT_SEPARATOR)
+        self._text_blob = _TEXT_SEPARATOR.join(hays)
+        self._text_starts = starts
+        self._first_of_key = first_of_key
+        self._rows_by_code = rows_by_code
+        
+        code_prefix_indexes = []
+        for values in fields[:2]:
+            pairs = sorted(
+                (value, row) for row, value in enumerate(values) if value and first_of_key[row]
+            )
+            code_prefix_indexes.append(([value for value, _ in pairs], [row for _, row in pairs]))
+        self._code_prefix_indexes = code_prefix_indexes
+        
+        bucket_of = np.full(128, 37, dtype=np.intp)
+        for code in range(128):
+            bucket_of[code] = _char_bucket(chr(code))
+        fuzzy_fields = []
+        for values in fields:
+            lengths = np.array([len(value) for value in values], dtype=np.intp)
+            codepoints = np.frombuffer("".join(values).encode("utf-32-le"), dtype=np.uint32)
+            buckets = np.where(codepoints < 128, bucket_of[np.minimum(codepoints, 127)], 37)
+            rows = np.repeat(np.arange(len(values)), lengths)
+            counts = np.bincount(
+                buckets * len(values) + rows, minlength=_CHAR_BUCKETS * len(values)
+            ).reshape(_CHAR_BUCKETS, len(values))
+            # Saturating at 255 keeps min(query count, count) exact for any
+            # query with fewer than 256 of a character
+            fuzzy_fields.append((lengths, np.minimum(counts, 255).astype(np.uint8), values))
+        self._fuzzy_fields = fuzzy_fields
+    
+    def _text_matches(self, q: str, limit: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Rows (indexes into the coordinate columns, in file order) of every
+        airport that can match the query, deduplicated as search_airports
+        does. Returns None when the index can't be used.
+        
+        Substring matches (all non-fuzzy scores) are found by scanning the
+        joined search strings. For fuzzy matches, a ratio of 2*M/T needs M
+        matching characters, and M is at most the size of the multiset
+        intersection of the two strings, so only airports whose character
+        counts allow a ratio >= 0.6 are kept. When RapidFuzz is installed,
+        those are narrowed further by the Indel (LCS) similarity, which also
+        bounds the ratio from above. Survivors are scored by SequenceMatcher
+        as usual, so the results are exactly those of a full scan.
+        
+        With `limit`, only the exact code matches are returned when there
+        are at least `limit` of them (no other airport can outrank them), or
+        those plus the ICAO (then IATA) prefix matches, found by bisecting
+        the sorted codes, when those reach `limit`. Fuzzy candidates are
+        skipped when at least `limit` substring matches outrank any fuzzy
+        score, as they could not make the top `limit` results either.
+        """
+        if np is None or _TEXT_SEPARATOR in q:
+            return None
+        self._ensure_indexes()
+        if self._fuzzy_fields is None:
+            self._build_text_index()
+        
+        if limit is not None and limit > 0:
+            top_rows = set(self._rows_by_code.get(q, []))
+            if len(top_rows) >= limit:
+                return sorted(top_rows)
+            # ICAO prefix matches score next, then IATA prefix matches
+            for codes, code_rows in self._code_prefix_indexes:
+                i = bisect.bisect_left(codes, q)
+                while i < len(codes) and codes[i].startswith(q):
+                    top_rows.add(code_rows[i])
+                    i += 1
+                if len(top_rows) >= limit:
+                    return sorted(top_rows)
+        
+        blob = self._text_blob
+        starts = self._text_starts
+        rows: Set[int] = set()
+        i = blob.find(q)
+        while i >= 0:
+            row = bisect.bisect_right(starts, i) - 1
+            rows.add(row)
+            if row + 1 >= len(starts):
+                break
+            i = blob.find(q, starts[row + 1])
+        
+        first_of_key = self._first_of_key
+        if limit is not None and limit > 0:
+            records = self._search_records()
+            substring_rows = sorted(row for row in rows if first_of_key[row])
+            strong = 0
+            for row in substring_rows:
+                if self._text_score(q, records[row]) > _FUZZY_MAX_SCORE:
+                    strong += 1
+                    if strong >= limit:
+                        return substring_rows
+        
+        q_counts: Dict[int, int] = {}
+        for ch in q:
+            bucket = _char_bucket(ch)
+            q_counts[bucket] = q_counts.get(bucket, 0) + 1
+        if max(q_counts.values()) > 255:
+            return None
+        possible = np.zeros(len(starts), dtype=bool)
+        for lengths, counts, _ in self._fuzzy_fields:
+            shared = np.zeros(len(starts), dtype=np.int32)
+            for bucket, count in q_counts.items():
+                shared += np.minimum(counts[bucket], count)
+            # Small tolerance so rounding never excludes a borderline match
+            possible |= 2 * shared >= (_FUZZY_MIN_RATIO - 1e-9) * (len(q) + lengths)
+        candidates = np.flatnonzero(possible)
+        
+        if rapidfuzz_process is not None and candidates.size:
+            # SequenceMatcher's matching blocks form a common subsequence, so
+            # its ratio never exceeds the Indel similarity 2*LCS/T, which
+            # RapidFuzz computes for all candidates in one native call
+            close = np.zeros(candidates.size, dtype=bool)
+            candidate_rows = candidates.tolist()
+            for _, _, values in self._fuzzy_fields:
+                similarity = rapidfuzz_process.cdist(
+                    [q],
+                    [values[row] for row in candidate_rows],
+                    scorer=Indel.normalized_similarity,
+                    dtype=np.float64,
+                )[0]
+                close |= similarity >= _FUZZY_MIN_RATIO - 1e-9
+            candidates = candidates[close]
+        rows.update(candidates.tolist())
+        
+        return sorted(row for row in rows if first_of_key[row])
     
     def search_airports(
         self,
@@ -257,6 +1035,7 @@ class AirportDatabase:
             List of matching airports sorted by relevance/distance
         """
         self._load_airports()
+        self._ensure_indexes()
         
         q = (query or "").strip().lower()
         has_geo = latitude is not None and longitude is not None
@@ -264,98 +1043,94 @@ class AirportDatabase:
         if not q and not has_geo:
             return []
         
-        candidates: List[Tuple[float, float, Airport]] = []
+        # Repeated searches (e.g. autocomplete) come from the cache; copy so
+        # callers can't mutate the cached results
+        results = self._cached_search(q, limit, latitude, longitude, radius_nm)
+        return [Airport(airport) for airport in results]
+    
+    def _search(
+        self,
+        q: str,
+        limit: int,
+        latitude: Optional[float],
+        longitude: Optional[float],
+        radius_nm: Optional[float],
+    ) -> List[Airport]:
+        """Uncached search_airports for a lower-cased, stripped query."""
+        has_geo = latitude is not None and longitude is not None
+        
+        # (-score, sort distance, row, distance). Plain tuple order ranks by
+        # score, then distance, then file order (rows are visited in
+        # ascending order), so no per-candidate sort key is needed. Airports
+        # are only materialized for the results actually returned.
+        candidates: List[Tuple[float, float, int, Optional[float]]] = []
         seen: Set[str] = set()
         
-        for airport in self.airports:
-            icao_code = (airport.get("icao") or airport.get("icaoCode") or "").upper()
-            iata_code = (airport.get("iata") or airport.get("iataCode") or "").upper()
-            alt_codes = self._candidate_codes(icao_code)
-            name = str(airport.get("name") or "")
-            city = str(airport.get("city") or "")
-            country = str(airport.get("country") or "")
-            
-            lat_v, lon_v = self._extract_lat_lon(airport)
-            if lat_v is None or lon_v is None:
-                continue
-            
-            # Calculate distance if geo coordinates provided
-            dist_nm: Optional[float] = None
+        # Text queries over the whole table go through the text index, which
+        # visits only the airports that can match
+        matches = None
+        if q and (not has_geo or radius_nm is None):
+            matches = self._text_matches(q, limit)
+        
+        records = self._search_records()
+        
+        # Distances for every airport are computed in one vectorized pass;
+        # only airports inside the radius are visited below
+        rows: List[Tuple[int, Optional[float]]]
+        if matches is not None:
             if has_geo:
-                dist_nm = self._haversine_nm(float(latitude), float(longitude), float(lat_v), float(lon_v))
-                if radius_nm is not None and dist_nm > float(radius_nm):
-                    continue
-            
-            # Normalize airport data
-            normalized = Airport({
-                "icao": icao_code,
-                "iata": iata_code,
-                "name": airport.get("name") or "",
-                "city": airport.get("city") or "",
-                "country": airport.get("country") or "",
-                "latitude": float(lat_v),
-                "longitude": float(lon_v),
-                "elevation": airport.get("elevation"),
-                "type": airport.get("type") or "",
-            })
+                distances = self._distances_nm(
+                    float(latitude), float(longitude), np.array(matches, dtype=np.intp)
+                ).tolist()
+                rows = list(zip(matches, distances))
+            else:
+                rows = [(row, None) for row in matches]
+        elif has_geo:
+            rows = self._rows_near(float(latitude), float(longitude), radius_nm)
+        else:
+            rows = [(row, None) for row in range(len(records))]
+        
+        # Text index matches are already one per key
+        dedupe = matches is None
+        text_score = self._text_score
+        inf = float("inf")
+        for row, dist_nm in rows:
+            record = records[row]
             
             # Deduplicate by key
-            key = (
-                normalized["icao"]
-                or normalized["iata"]
-                or f"{normalized['latitude']},{normalized['longitude']}"
-            )
-            if key in seen:
-                continue
-            seen.add(key)
+            if dedupe:
+                if record.key in seen:
+                    continue
+                seen.add(record.key)
             
             # Calculate search score if query provided
             score = 0.0
             if q:
-                code_hay = " ".join(sorted({icao_code, iata_code, *alt_codes})).lower()
-                text_hay = f"{code_hay} {name} {city} {country}".lower()
-                
-                # Exact code match
-                if q in {c.lower() for c in {icao_code, iata_code, *alt_codes} if c}:
-                    score = 1.0
-                # ICAO starts with query
-                elif icao_code.lower().startswith(q):
-                    score = 0.95
-                # IATA starts with query
-                elif iata_code.lower().startswith(q):
-                    score = 0.9
-                # Code contains query
-                elif q in code_hay:
-                    score = 0.85
-                # Text contains query
-                elif q in text_hay:
-                    score = 0.65
-                # Fuzzy match
-                else:
-                    ratio = max(
-                        difflib.SequenceMatcher(None, q, icao_code.lower()).ratio(),
-                        difflib.SequenceMatcher(None, q, iata_code.lower()).ratio(),
-                        difflib.SequenceMatcher(None, q, name.lower()).ratio(),
-                    )
-                    if ratio < 0.6:
-                        continue  # Skip low-quality matches
-                    score = 0.5 + (ratio - 0.6) * 0.5
+                score = text_score(q, record)
+                if score is None:
+                    continue  # Skip low-quality matches
             
-            # Add distance to result if available
-            if dist_nm is not None:
-                normalized["distance_nm"] = round(dist_nm, 2)
-            
-            candidates.append((score, dist_nm if dist_nm is not None else float("inf"), normalized))
+            candidates.append((-score, inf if dist_nm is None else dist_nm, row, dist_nm))
         
-        # Sort by score (descending) then distance (ascending)
-        if has_geo and not q:
-            # Proximity search only: sort by distance
-            candidates.sort(key=lambda t: t[1])
+        # Sort by score (descending) then distance (ascending); only the top
+        # `limit` are needed: a bounded heap selection, which is equivalent
+        # to sorting and slicing
+        if 0 <= limit < len(candidates):
+            top = heapq.nsmallest(limit, candidates)
         else:
-            # Text search or combined: sort by score then distance
-            candidates.sort(key=lambda t: (-t[0], t[1]))
+            top = sorted(candidates)[:limit]
         
-        return [item[2] for item in candidates[:limit]]
+        results = []
+        for _, _, row, dist_nm in top:
+            normalized = self._make_airport(row)
+            # Search results always carry a string name
+            normalized["name"] = normalized["name"] or ""
+            
+            # Add distance to result if available
+            if dist_nm is not None:
+                normalized["distance_nm"] = round(dist_nm, 2)
+            results.append(normalized)
+        return results
     
     def search(self, query: str, limit: int = 20) -> List[Airport]:
         """
@@ -407,13 +1182,16 @@ class AirportDatabase:
 
 # Singleton instance
 _default_database: Optional[AirportDatabase] = None
+_default_database_lock = threading.Lock()
 
 
 def get_airport_database(data_path: Optional[str] = None) -> AirportDatabase:
     """Get or create the default airport database instance."""
     global _default_database
     if _default_database is None or data_path:
-        _default_database = AirportDatabase(data_path)
+        with _default_database_lock:
+            if _default_database is None or data_path:
+                _default_database = AirportDatabase(data_path)
     return _default_database
 
 
@@ -5,9 +5,13 @@ Redis-based caching for improved performance.
 """
 
 from .redis_cache import (
+    AsyncRedisCache,
+    CacheCodec,
     CacheConfig,
     CacheMetrics,
     CacheTTL,
+    JSONCodec,
+    MsgpackCodec,
     RedisCache,
     get_cache,
     init_cache,
@@ -15,9 +19,13 @@ from .redis_cache import (
 
 __all__ = [
     "RedisCache",
+    "AsyncRedisCache",
     "CacheConfig",
     "CacheMetrics",
     "CacheTTL",
+    "CacheCodec",
+    "JSONCodec",
+    "MsgpackCodec",
     "get_cache",
     "init_cache",
 ]
@@ -3,36 +3,190 @@ Redis Cache Implementation for Aviation Python SDK
 
 Provides a unified caching interface with TTL management,
 hit rate monitoring, and automatic serialization.
+
+Install with the "cache" extra for redis plus the hiredis parser.
+
+Status and errors are logged to the "aviation.cache.redis_cache" logger
+rather than printed; applications that want log output off the request
+path can route it through a logging.handlers.QueueHandler/QueueListener.
 """
 
 from __future__ import annotations
 
+import functools
+import itertools
+import enum
 import json
+import logging
 import os
-from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, TypeVar
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import (
+    Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, TypeVar, Union,
+)
 
 try:
     import redis
+    import redis.asyncio
     from redis import Redis
+    from redis.exceptions import RedisError
 except ImportError:
     redis = None  # type: ignore
     Redis = None  # type: ignore
+    RedisError = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+
+class CacheCodec:
+    """Converts cached values to and from the bytes stored in Redis"""
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a JSON-ready value holds NaN or an infinity anywhere"""
+    if isinstance(value, float):
+        return value != value or value in (float("inf"), float("-inf"))
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _json_default(value: Any) -> Any:
+    """Encode Enum members and UUIDs for json.dumps the way orjson does"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec(CacheCodec):
+    """JSON values, as written by the TypeScript SDK; uses orjson when installed
+
+    A value encodes (or is rejected) the same way with or without orjson:
+    as json.dumps would, except that Enum members are written as their value
+    and UUIDs as strings. Values orjson would write differently (NaN and
+    infinities, which it writes as null; dicts with non-str keys) or would
+    accept where json does not (datetimes, dataclasses) go through json.
+    """
+
+    if orjson is not None:
+        # Datetimes and dataclasses are handed to `default`, which is unset
+        # here, so they raise and reach json, which rejects them too. Without
+        # OPT_NON_STR_KEYS, non-str keys also raise and json coerces them
+        _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def encode(self, value: Any) -> bytes:
+        if orjson is not None:
+            try:
+                data = orjson.dumps(value, option=self._ORJSON_OPTIONS)
+            except TypeError:
+                pass  # e.g. integers wider than 64 bits, which json handles
+            else:
+                # orjson writes non-finite floats as null; only a payload with
+                # a null can hold one
+                if b"null" not in data or not _has_non_finite(value):
+                    return data
+        return json.dumps(value, default=_json_default).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN or Infinity as written by json.dumps
+        return json.loads(data)
+
+
+# One msgspec encoder/decoder for the process; both are safe to share
+# across threads, and every MsgpackCodec uses them
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder() if msgspec is not None else None
+_MSGPACK_DECODER = msgspec.msgpack.Decoder() if msgspec is not None else None
+
+
+class MsgpackCodec(CacheCodec):
+    """MessagePack values via msgspec; smaller and faster, but Python-only"""
+
+    def __init__(self):
+        if msgspec is None:
+            raise RuntimeError(
+                "msgspec package not installed. Install with: pip install msgspec"
+            )
+
+    def encode(self, value: Any) -> bytes:
+        return _MSGPACK_ENCODER.encode(value)
+
+    def decode(self, data: bytes) -> Any:
+        return _MSGPACK_DECODER.decode(data)
+
+
+_CODECS = {
+    "json": JSONCodec,
+    "msgpack": MsgpackCodec,
+}
+
+# Values a codec can't encode or decode are reported like Redis failures
+_CODEC_ERRORS: tuple = (TypeError, ValueError) + (
+    (msgspec.MsgspecError,) if msgspec is not None else ()
+)
+
+
+def _log_error(operation: str, error: Exception) -> None:
+    """Report a failed cache operation; the traceback only at DEBUG level"""
+    logger.warning(
+        "Cache %s error: %s", operation, error, exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+
+
+# Server defaults, read from the environment once at import
+_DEFAULT_HOST = os.getenv("REDIS_HOST", "localhost")
+_DEFAULT_PORT = int(os.getenv("REDIS_PORT", "6379"))
+_DEFAULT_PASSWORD = os.getenv("REDIS_PASSWORD")
+
 
 @dataclass
 class CacheConfig:
     """Redis cache configuration"""
 
-    host: str = field(default_factory=lambda: os.getenv("REDIS_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("REDIS_PORT", "6379")))
-    password: Optional[str] = field(default_factory=lambda: os.getenv("REDIS_PASSWORD"))
+    host: str = _DEFAULT_HOST
+    port: int = _DEFAULT_PORT
+    password: Optional[str] = _DEFAULT_PASSWORD
     db: int = 0
     key_prefix: str = "aviation:"
     default_ttl: int = 3600  # 1 hour
     enable_metrics: bool = True
+    # "json" (shared with the TypeScript SDK), "msgpack", or a CacheCodec
+    codec: Union[str, CacheCodec] = "json"
+    # delete_pattern: keys asked for per SCAN call, and DELs sent per pipeline
+    scan_count: int = 10000
+    delete_batch_size: int = 1000
+    # Connections shared by every RedisCache with the same server settings;
+    # callers wait for a free one rather than opening more than pool_size
+    pool_size: int = 32
+    socket_timeout: Optional[float] = 2.0  # seconds
+    health_check_interval: int = 30  # seconds idle before a PING on checkout
 
 
 @dataclass
@@ -51,8 +205,70 @@ class CacheMetrics:
         return (self.hits / total * 100) if total > 0 else 0.0
 
 
-class RedisCache:
-    """Redis-based cache with metrics and TTL management"""
+class _ThreadOwner:
+    """Lives in one thread's local storage; its finalizer retires that thread's counters"""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_counters(
+    live: Dict[int, CacheMetrics], retired: CacheMetrics, lock: Any, key: int
+) -> None:
+    """Fold a finished thread's counters into the retired totals"""
+    with lock:
+        counters = live.pop(key, None)
+        if counters is not None:  # None if reset_metrics dropped them already
+            retired.hits += counters.hits
+            retired.misses += counters.misses
+            retired.sets += counters.sets
+            retired.deletes += counters.deletes
+
+
+# Connection pools by server settings, shared across RedisCache instances
+_pools: Dict[tuple, Any] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_kwargs(config: CacheConfig) -> Dict[str, Any]:
+    """Connection pool settings for a cache configuration"""
+    return dict(
+        host=config.host,
+        port=config.port,
+        password=config.password,
+        db=config.db,
+        max_connections=config.pool_size,
+        socket_timeout=config.socket_timeout,
+        socket_connect_timeout=config.socket_timeout,
+        socket_keepalive=True,
+        health_check_interval=config.health_check_interval,
+        # Values stay bytes for the codec; with hiredis installed (picked up
+        # by redis-py automatically) replies go straight from the C parser
+        # to the codec with no UTF-8 decode
+        decode_responses=False,
+    )
+
+
+def _connection_pool(config: CacheConfig) -> Any:
+    """Shared blocking connection pool for a cache configuration"""
+    key = (
+        config.host,
+        config.port,
+        config.password,
+        config.db,
+        config.pool_size,
+        config.socket_timeout,
+        config.health_check_interval,
+    )
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = redis.BlockingConnectionPool(**_pool_kwargs(config))
+            _pools[key] = pool
+        return pool
+
+
+class _CacheBase:
+    """Configuration, codec, keys and metrics shared by the sync and async caches"""
 
     def __init__(self, config: Optional[CacheConfig] = None):
         if redis is None:
@@ -61,40 +277,157 @@ class RedisCache:
             )
 
         self.config = config or CacheConfig()
-        self.metrics = CacheMetrics()
+        # Each thread counts into its own CacheMetrics (no lost updates from
+        # concurrent read-modify-writes, no shared counter on the hot path);
+        # `metrics` sums them. When a thread ends, its counters are folded
+        # into `_retired_metrics`, so short-lived threads don't pile up.
+        self._metrics_local = threading.local()
+        self._thread_metrics: Dict[int, CacheMetrics] = {}
+        self._retired_metrics = CacheMetrics()
+        self._thread_ids = itertools.count()
+        # Reentrant: a thread's counters can be retired by garbage collection
+        # in a thread already holding the lock
+        self._metrics_lock = threading.RLock()
+        self._codec = self._make_codec(self.config.codec)
+        # Keys are sent as bytes (UTF-8, as redis-py would encode them)
+        self._key_prefix = self.config.key_prefix.encode("utf-8")
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """Cache metrics summed across threads"""
+        with self._metrics_lock:
+            parts = [self._retired_metrics, *self._thread_metrics.values()]
+        return CacheMetrics(
+            hits=sum(part.hits for part in parts),
+            misses=sum(part.misses for part in parts),
+            sets=sum(part.sets for part in parts),
+            deletes=sum(part.deletes for part in parts),
+        )
+
+    def _counters(self) -> CacheMetrics:
+        """This thread's metrics, created on its first use of the cache"""
+        try:
+            return self._metrics_local.metrics
+        except AttributeError:
+            counters = CacheMetrics()
+            owner = _ThreadOwner()
+            with self._metrics_lock:
+                key = next(self._thread_ids)
+                self._thread_metrics[key] = counters
+            weakref.finalize(
+                owner, _retire_counters,
+                self._thread_metrics, self._retired_metrics, self._metrics_lock, key,
+            )
+            self._metrics_local.owner = owner
+            self._metrics_local.metrics = counters
+            return counters
+
+    def _count_reads(self, values: Sequence[Optional[bytes]]) -> None:
+        """Record hits and misses for values read from Redis"""
+        if self.config.enable_metrics:
+            found = sum(value is not None for value in values)
+            counters = self._counters()
+            counters.hits += found
+            counters.misses += len(values) - found
+
+    @staticmethod
+    def _make_codec(codec: Union[str, CacheCodec]) -> CacheCodec:
+        """Codec instance for a CacheConfig.codec setting"""
+        if isinstance(codec, CacheCodec):
+            return codec
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown cache codec: {codec!r} (expected one of {sorted(_CODECS)})")
+        return _CODECS[codec]()
+
+    def _key(self, key: Any) -> bytes:
+        """Generate full cache key with prefix; non-bytes keys are formatted with str()"""
+        if isinstance(key, bytes):
+            return self._key_prefix + key
+        return self._key_prefix + str(key).encode("utf-8")
+
+    def _tag_key(self, tag: str) -> bytes:
+        """Key of the Redis set listing the keys stored under a tag"""
+        return self._key_prefix + b"tag:" + tag.encode("utf-8")
+
+    def _queue_set_tagged(
+        self, pipe: Any, key: str, value: Any, tags: Sequence[str], ttl: int, serialize: bool
+    ) -> None:
+        """Queue the SETEX and tag-set updates for set_tagged on a pipeline"""
+        full_key = self._key(key)
+        pipe.setex(full_key, ttl, self._encode(value, serialize))
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, full_key)
+            # The tag set lives at least as long as its longest-lived key:
+            # NX sets a TTL on a new set, GT only ever extends it
+            pipe.expire(tag_key, ttl, nx=True)
+            pipe.expire(tag_key, ttl, gt=True)
+
+    def _queue_invalidate(self, pipe: Any, tag_key: bytes, members: Sequence[bytes]) -> None:
+        """Queue DELs for a tag's keys, delete_batch_size at a time, then the tag set"""
+        batch = self.config.delete_batch_size
+        for start in range(0, len(members), batch):
+            pipe.delete(*members[start:start + batch])
+        pipe.delete(tag_key)
+
+    def _encode(self, value: Any, serialize: bool) -> Union[bytes, str]:
+        """Value as sent to Redis by set"""
+        return self._codec.encode(value) if serialize else str(value)
+
+    def _decode(self, value: bytes, serialize: bool) -> Any:
+        """Value as returned by get for raw bytes from Redis"""
+        if serialize:
+            return self._codec.decode(value)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def get_metrics(self) -> CacheMetrics:
+        """Get cache metrics"""
+        return self.metrics
+
+    def reset_metrics(self) -> None:
+        """Reset cache metrics"""
+        with self._metrics_lock:
+            # Threads register fresh counters on their next operation
+            self._thread_metrics.clear()
+            retired = self._retired_metrics
+            retired.hits = retired.misses = retired.sets = retired.deletes = 0
+            self._metrics_local = threading.local()
+
+
+class RedisCache(_CacheBase):
+    """Redis-based cache with metrics and TTL management"""
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        super().__init__(config)
         self._client: Optional[Redis] = None
 
     def connect(self) -> None:
         """Connect to Redis"""
         if self._client is None:
-            self._client = redis.Redis(
-                host=self.config.host,
-                port=self.config.port,
-                password=self.config.password,
-                db=self.config.db,
-                decode_responses=True,
-            )
+            self._client = redis.Redis(connection_pool=_connection_pool(self.config))
             # Test connection
             self._client.ping()
-            print("✅ Redis cache connected")
+            logger.info("Redis cache connected")
 
     def disconnect(self) -> None:
-        """Disconnect from Redis"""
+        """Disconnect from Redis (the shared connection pool stays open)"""
+        # The next use of `client` connects again
+        self.__dict__.pop("client", None)
         if self._client:
             self._client.close()
             self._client = None
 
-    @property
+    @functools.cached_property
     def client(self) -> Redis:
-        """Get Redis client, connecting if necessary"""
-        if self._client is None:
-            self.connect()
+        """
+        Get Redis client, connecting if necessary.
+        
+        Stored on the instance once connected, so later operations read it
+        as a plain attribute without a connection check.
+        """
+        self.connect()
         return self._client  # type: ignore
 
-    def _key(self, key: str) -> str:
-        """Generate full cache key with prefix"""
-        return f"{self.config.key_prefix}{key}"
-
     def get(self, key: str, serialize: bool = True) -> Optional[Any]:
         """Get value from cache"""
         try:
@@ -102,32 +435,62 @@ class RedisCache:
 
             if value is None:
                 if self.config.enable_metrics:
-                    self.metrics.misses += 1
+                    self._counters().misses += 1
                 return None
 
             if self.config.enable_metrics:
-                self.metrics.hits += 1
+                self._counters().hits += 1
 
-            return json.loads(value) if serialize else value
-        except Exception as e:
-            print(f"Cache get error: {e}")
+            return self._decode(value, serialize)
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("get", e)
             return None
 
+    def mget(self, keys: Sequence[str], serialize: bool = True) -> List[Optional[Any]]:
+        """Get several values in one round trip (None for each miss)"""
+        if not keys:
+            return []
+        try:
+            values = self.client.mget([self._key(key) for key in keys])
+            self._count_reads(values)
+            return [None if value is None else self._decode(value, serialize) for value in values]
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("mget", e)
+            return [None] * len(keys)
+
     def set(
         self, key: str, value: Any, ttl: Optional[int] = None, serialize: bool = True
     ) -> bool:
         """Set value in cache with TTL"""
         try:
             ttl = ttl if ttl is not None else self.config.default_ttl
-            serialized = json.dumps(value) if serialize else str(value)
+            self.client.setex(self._key(key), ttl, self._encode(value, serialize))
+
+            if self.config.enable_metrics:
+                self._counters().sets += 1
+            return True
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("set", e)
+            return False
 
-            self.client.setex(self._key(key), ttl, serialized)
+    def mset(
+        self, mapping: Mapping[str, Any], ttl: Optional[int] = None, serialize: bool = True
+    ) -> bool:
+        """Set several values with TTL in one pipelined round trip"""
+        if not mapping:
+            return True
+        try:
+            ttl = ttl if ttl is not None else self.config.default_ttl
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(self._key(key), ttl, self._encode(value, serialize))
+            pipe.execute()
 
             if self.config.enable_metrics:
-                self.metrics.sets += 1
+                self._counters().sets += len(mapping)
             return True
-        except Exception as e:
-            print(f"Cache set error: {e}")
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("mset", e)
             return False
 
     def get_or_set(
@@ -144,78 +507,416 @@ class RedisCache:
 
         return value
 
+    def get_or_set_many(
+        self,
+        keys: Sequence[str],
+        fn: Callable[[List[str]], Mapping[str, T]],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+    ) -> Dict[str, T]:
+        """
+        Batched get_or_set: fn is called once with the keys that missed and
+        returns their values by key, which are cached with one mset. Keys
+        fn leaves out map to None.
+        """
+        values = dict(zip(keys, self.mget(keys, serialize=serialize)))
+        missing = [key for key, value in values.items() if value is None]
+
+        computed: Mapping[str, T] = fn(missing) if missing else {}
+        self.mset(computed, ttl=ttl, serialize=serialize)
+
+        return {key: computed.get(key) if values[key] is None else values[key] for key in values}
+
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
             result = self.client.delete(self._key(key))
             if self.config.enable_metrics:
-                self.metrics.deletes += 1
+                self._counters().deletes += 1
             return result > 0
-        except Exception as e:
-            print(f"Cache delete error: {e}")
+        except RedisError as e:
+            _log_error("delete", e)
             return False
 
+    def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        tags: Sequence[str],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+    ) -> bool:
+        """
+        Set value in cache with TTL and record the key under each tag, all in
+        one pipelined round trip, so invalidate_tag can delete it later
+        """
+        try:
+            ttl = ttl if ttl is not None else self.config.default_ttl
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_set_tagged(pipe, key, value, tags, ttl, serialize)
+            pipe.execute()
+
+            if self.config.enable_metrics:
+                self._counters().sets += 1
+            return True
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("set tagged", e)
+            return False
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete the keys stored under tag with set_tagged, and the tag itself"""
+        try:
+            # Only the tag's own keys are touched, however large the keyspace
+            tag_key = self._tag_key(tag)
+            members = list(self.client.smembers(tag_key))
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_invalidate(pipe, tag_key, members)
+            result = sum(pipe.execute()[:-1])
+
+            if self.config.enable_metrics:
+                self._counters().deletes += result
+            return result
+        except RedisError as e:
+            _log_error("invalidate tag", e)
+            return 0
+
     def delete_pattern(self, pattern: str) -> int:
-        """Delete keys matching pattern"""
+        """
+        Delete keys matching pattern.
+        
+        Scans the whole keyspace; for groups of keys invalidated together,
+        prefer set_tagged and invalidate_tag.
+        """
         try:
-            keys = self.client.keys(self._key(pattern))
-            if not keys:
-                return 0
+            # SCAN walks the keyspace incrementally instead of blocking Redis
+            # like KEYS, and the DELs go out in pipelined batches
+            result = 0
+            pipe = self.client.pipeline(transaction=False)
+            pending = 0
+            for key in self.client.scan_iter(match=self._key(pattern), count=self.config.scan_count):
+                pipe.delete(key)
+                pending += 1
+                if pending >= self.config.delete_batch_size:
+                    result += sum(pipe.execute())
+                    pending = 0
+            if pending:
+                result += sum(pipe.execute())
 
-            result = self.client.delete(*keys)
             if self.config.enable_metrics:
-                self.metrics.deletes += result
+                self._counters().deletes += result
             return result
-        except Exception as e:
-            print(f"Cache delete pattern error: {e}")
+        except RedisError as e:
+            _log_error("delete pattern", e)
             return 0
 
     def exists(self, key: str) -> bool:
         """Check if key exists"""
         try:
             return self.client.exists(self._key(key)) > 0
-        except Exception as e:
-            print(f"Cache exists error: {e}")
+        except RedisError as e:
+            _log_error("exists", e)
             return False
 
     def ttl(self, key: str) -> int:
         """Get remaining TTL for key (in seconds)"""
         try:
             return self.client.ttl(self._key(key))
-        except Exception as e:
-            print(f"Cache TTL error: {e}")
+        except RedisError as e:
+            _log_error("TTL", e)
             return -1
 
     def extend(self, key: str, seconds: int) -> bool:
         """Extend TTL for existing key"""
         try:
             return self.client.expire(self._key(key), seconds)
-        except Exception as e:
-            print(f"Cache extend error: {e}")
+        except RedisError as e:
+            _log_error("extend", e)
             return False
 
-    def get_metrics(self) -> CacheMetrics:
-        """Get cache metrics"""
-        return self.metrics
-
-    def reset_metrics(self) -> None:
-        """Reset cache metrics"""
-        self.metrics = CacheMetrics()
-
     def flush(self) -> None:
         """Flush entire cache (use with caution!)"""
         try:
             self.client.flushdb()
-            print("⚠️  Cache flushed")
-        except Exception as e:
-            print(f"Cache flush error: {e}")
+            logger.info("Cache flushed")
+        except RedisError as e:
+            _log_error("flush", e)
 
     def info(self) -> str:
         """Get cache info"""
         try:
             return str(self.client.info())
-        except Exception as e:
-            print(f"Cache info error: {e}")
+        except RedisError as e:
+            _log_error("info", e)
+            return ""
+
+
+class AsyncRedisCache(_CacheBase):
+    """
+    asyncio counterpart of RedisCache, backed by redis.asyncio.
+
+    Same operations and return values as RedisCache, as coroutines, so one
+    event loop can have many cache calls waiting on Redis at once. The
+    connection pool belongs to the instance and is bound to the event loop
+    that first connects; use one AsyncRedisCache per loop.
+    """
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        super().__init__(config)
+        self._client: Optional[Any] = None
+
+    async def connect(self) -> None:
+        """Connect to Redis"""
+        if self._client is None:
+            self._client = redis.asyncio.Redis(
+                connection_pool=redis.asyncio.BlockingConnectionPool(**_pool_kwargs(self.config))
+            )
+            # Test connection
+            await self._client.ping()
+            logger.info("Redis cache connected")
+
+    async def disconnect(self) -> None:
+        """Disconnect from Redis and close the connection pool"""
+        if self._client:
+            client, self._client = self._client, None
+            await client.aclose()
+            await client.connection_pool.disconnect()
+
+    async def _connected(self) -> Any:
+        """Redis client, connecting if necessary"""
+        if self._client is None:
+            await self.connect()
+        return self._client
+
+    async def get(self, key: str, serialize: bool = True) -> Optional[Any]:
+        """Get value from cache"""
+        try:
+            client = await self._connected()
+            value = await client.get(self._key(key))
+
+            if value is None:
+                if self.config.enable_metrics:
+                    self._counters().misses += 1
+                return None
+
+            if self.config.enable_metrics:
+                self._counters().hits += 1
+
+            return self._decode(value, serialize)
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("get", e)
+            return None
+
+    async def mget(self, keys: Sequence[str], serialize: bool = True) -> List[Optional[Any]]:
+        """Get several values in one round trip (None for each miss)"""
+        if not keys:
+            return []
+        try:
+            client = await self._connected()
+            values = await client.mget([self._key(key) for key in keys])
+            self._count_reads(values)
+            return [None if value is None else self._decode(value, serialize) for value in values]
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("mget", e)
+            return [None] * len(keys)
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, serialize: bool = True
+    ) -> bool:
+        """Set value in cache with TTL"""
+        try:
+            ttl = ttl if ttl is not None else self.config.default_ttl
+            client = await self._connected()
+            await client.setex(self._key(key), ttl, self._encode(value, serialize))
+
+            if self.config.enable_metrics:
+                self._counters().sets += 1
+            return True
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("set", e)
+            return False
+
+    async def mset(
+        self, mapping: Mapping[str, Any], ttl: Optional[int] = None, serialize: bool = True
+    ) -> bool:
+        """Set several values with TTL in one pipelined round trip"""
+        if not mapping:
+            return True
+        try:
+            ttl = ttl if ttl is not None else self.config.default_ttl
+            client = await self._connected()
+            pipe = client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(self._key(key), ttl, self._encode(value, serialize))
+            await pipe.execute()
+
+            if self.config.enable_metrics:
+                self._counters().sets += len(mapping)
+            return True
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("mset", e)
+            return False
+
+    async def get_or_set(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+    ) -> T:
+        """Get or set pattern - await the coroutine function on a cache miss"""
+        cached = await self.get(key, serialize=serialize)
+
+        if cached is not None:
+            return cached
+
+        value = await fn()
+        await self.set(key, value, ttl=ttl, serialize=serialize)
+
+        return value
+
+    async def get_or_set_many(
+        self,
+        keys: Sequence[str],
+        fn: Callable[[List[str]], Awaitable[Mapping[str, T]]],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+    ) -> Dict[str, T]:
+        """
+        Batched get_or_set: fn is awaited once with the keys that missed and
+        returns their values by key, which are cached with one mset. Keys
+        fn leaves out map to None.
+        """
+        values = dict(zip(keys, await self.mget(keys, serialize=serialize)))
+        missing = [key for key, value in values.items() if value is None]
+
+        computed: Mapping[str, T] = await fn(missing) if missing else {}
+        await self.mset(computed, ttl=ttl, serialize=serialize)
+
+        return {key: computed.get(key) if values[key] is None else values[key] for key in values}
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from cache"""
+        try:
+            client = await self._connected()
+            result = await client.delete(self._key(key))
+            if self.config.enable_metrics:
+                self._counters().deletes += 1
+            return result > 0
+        except RedisError as e:
+            _log_error("delete", e)
+            return False
+
+    async def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        tags: Sequence[str],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+    ) -> bool:
+        """
+        Set value in cache with TTL and record the key under each tag, all in
+        one pipelined round trip, so invalidate_tag can delete it later
+        """
+        try:
+            ttl = ttl if ttl is not None else self.config.default_ttl
+            client = await self._connected()
+            pipe = client.pipeline(transaction=False)
+            self._queue_set_tagged(pipe, key, value, tags, ttl, serialize)
+            await pipe.execute()
+
+            if self.config.enable_metrics:
+                self._counters().sets += 1
+            return True
+        except (RedisError, *_CODEC_ERRORS) as e:
+            _log_error("set tagged", e)
+            return False
+
+    async def invalidate_tag(self, tag: str) -> int:
+        """Delete the keys stored under tag with set_tagged, and the tag itself"""
+        try:
+            # Only the tag's own keys are touched, however large the keyspace
+            tag_key = self._tag_key(tag)
+            client = await self._connected()
+            members = list(await client.smembers(tag_key))
+            pipe = client.pipeline(transaction=False)
+            self._queue_invalidate(pipe, tag_key, members)
+            result = sum((await pipe.execute())[:-1])
+
+            if self.config.enable_metrics:
+                self._counters().deletes += result
+            return result
+        except RedisError as e:
+            _log_error("invalidate tag", e)
+            return 0
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching pattern (see RedisCache.delete_pattern)"""
+        try:
+            # SCAN plus pipelined DEL batches, as in RedisCache.delete_pattern
+            client = await self._connected()
+            result = 0
+            pipe = client.pipeline(transaction=False)
+            pending = 0
+            async for key in client.scan_iter(match=self._key(pattern), count=self.config.scan_count):
+                pipe.delete(key)
+                pending += 1
+                if pending >= self.config.delete_batch_size:
+                    result += sum(await pipe.execute())
+                    pending = 0
+            if pending:
+                result += sum(await pipe.execute())
+
+            if self.config.enable_metrics:
+                self._counters().deletes += result
+            return result
+        except RedisError as e:
+            _log_error("delete pattern", e)
+            return 0
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists"""
+        try:
+            client = await self._connected()
+            return await client.exists(self._key(key)) > 0
+        except RedisError as e:
+            _log_error("exists", e)
+            return False
+
+    async def ttl(self, key: str) -> int:
+        """Get remaining TTL for key (in seconds)"""
+        try:
+            client = await self._connected()
+            return await client.ttl(self._key(key))
+        except RedisError as e:
+            _log_error("TTL", e)
+            return -1
+
+    async def extend(self, key: str, seconds: int) -> bool:
+        """Extend TTL for existing key"""
+        try:
+            client = await self._connected()
+            return await client.expire(self._key(key), seconds)
+        except RedisError as e:
+            _log_error("extend", e)
+            return False
+
+    async def flush(self) -> None:
+        """Flush entire cache (use with caution!)"""
+        try:
+            client = await self._connected()
+            await client.flushdb()
+            logger.info("Cache flushed")
+        except RedisError as e:
+            _log_error("flush", e)
+
+    async def info(self) -> str:
+        """Get cache info"""
+        try:
+            client = await self._connected()
+            return str(await client.info())
+        except RedisError as e:
+            _log_error("info", e)
             return ""
 
 
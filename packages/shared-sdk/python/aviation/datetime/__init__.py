@@ -11,6 +11,7 @@ from .utils import (
     
     # Timezone management
     get_timezone,
+    resolve_tz,
     
     # UTC/Local conversions
     to_utc,
@@ -22,11 +23,13 @@ from .utils import (
     
     # Formatting
     format_datetime,
+    format_datetime_batch,
     format_flight_time,
     parse_flight_time,
     
     # Sunrise/sunset
     calculate_sunrise_sunset,
+    calculate_sunrise_sunset_batch,
     is_night,
     
     # Flight time calculations
@@ -36,14 +39,17 @@ from .utils import (
 __all__ = [
     'utcnow',
     'get_timezone',
+    'resolve_tz',
     'to_utc',
     'from_utc',
     'to_zulu',
     'from_zulu',
     'format_datetime',
+    'format_datetime_batch',
     'format_flight_time',
     'parse_flight_time',
     'calculate_sunrise_sunset',
+    'calculate_sunrise_sunset_batch',
     'is_night',
     'add_flight_time',
 ]
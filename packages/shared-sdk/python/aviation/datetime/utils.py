@@ -15,8 +15,10 @@ Standard Rule:
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Tuple
-import pytz
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import functools
+import os
 import math
 
 # Default timezone for fallback
@@ -38,7 +40,27 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def get_timezone(tz_name: Optional[str] = None) -> pytz.timezone:
+# Raised by ZoneInfo for unknown (not found) and malformed (ValueError) names
+_UNKNOWN_TIMEZONE_ERRORS = (ZoneInfoNotFoundError, ValueError)
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_tz(tz_name: str) -> ZoneInfo:
+    """
+    Get a timezone object by name, memoized.
+    
+    Unlike get_timezone there is no fallback: unknown names raise
+    ZoneInfoNotFoundError (or ValueError if malformed) every time.
+    
+    Example:
+        >>> tz = resolve_tz('Pacific/Auckland')
+        >>> tz is resolve_tz('Pacific/Auckland')
+        True
+    """
+    return ZoneInfo(tz_name)
+
+
+def get_timezone(tz_name: Optional[str] = None) -> ZoneInfo:
     """
     Get a timezone object by name.
     
@@ -47,36 +69,34 @@ def get_timezone(tz_name: Optional[str] = None) -> pytz.timezone:
                 If None, tries to detect local timezone
     
     Returns:
-        pytz.timezone: Timezone object
+        ZoneInfo: Timezone object
         
     Example:
         >>> tz = get_timezone('America/Los_Angeles')
         >>> print(tz)
         America/Los_Angeles
     """
-    import os
-    
     # If specific timezone requested, use it
     if tz_name:
         try:
-            return pytz.timezone(tz_name)
-        except pytz.exceptions.UnknownTimeZoneError:
+            return resolve_tz(tz_name)
+        except _UNKNOWN_TIMEZONE_ERRORS:
             pass
     
     # Check environment variable
     env_tz = os.environ.get('AVIATION_TIMEZONE')
     if env_tz:
         try:
-            return pytz.timezone(env_tz)
-        except pytz.exceptions.UnknownTimeZoneError:
+            return resolve_tz(env_tz)
+        except _UNKNOWN_TIMEZONE_ERRORS:
             pass
     
     # Try to detect system timezone
     try:
         import tzlocal
-        return pytz.timezone(tzlocal.get_localzone().key)
-    except (ImportError, pytz.exceptions.UnknownTimeZoneError):
-        return pytz.timezone(DEFAULT_TIMEZONE)
+        return resolve_tz(tzlocal.get_localzone().key)
+    except (ImportError, *_UNKNOWN_TIMEZONE_ERRORS):
+        return resolve_tz(DEFAULT_TIMEZONE)
 
 
 def to_utc(dt: Optional[datetime], assume_tz: Optional[str] = None) -> Optional[datetime]:
@@ -99,10 +119,9 @@ def to_utc(dt: Optional[datetime], assume_tz: Optional[str] = None) -> Optional[
     if dt is None:
         return None
     
-    # If datetime is naive (no timezone), localize it
+    # If datetime is naive (no timezone), attach the assumed timezone
     if dt.tzinfo is None:
-        tz = get_timezone(assume_tz)
-        dt = tz.localize(dt)
+        dt = dt.replace(tzinfo=get_timezone(assume_tz))
     
     # Convert to UTC
     return dt.astimezone(timezone.utc)
@@ -166,7 +185,11 @@ def to_zulu(dt: Optional[datetime]) -> Optional[str]:
         return None
     
     utc_dt = to_utc(dt)
-    return utc_dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    # isoformat is much cheaper than strftime, but strftime doesn't
+    # zero-pad years before 1000
+    if utc_dt.year < 1000:
+        return utc_dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    return utc_dt.isoformat(timespec='seconds')[:19] + 'Z'
 
 
 def from_zulu(zulu_str: Optional[str]) -> Optional[datetime]:
@@ -187,10 +210,7 @@ def from_zulu(zulu_str: Optional[str]) -> Optional[datetime]:
     if not zulu_str:
         return None
     
-    # Remove Z suffix and parse
-    if zulu_str.endswith('Z'):
-        zulu_str = zulu_str[:-1]
-    
+    # fromisoformat accepts the Z suffix as of Python 3.11
     try:
         dt = datetime.fromisoformat(zulu_str)
         return dt.replace(tzinfo=timezone.utc)
@@ -226,6 +246,51 @@ def format_datetime(dt: Optional[datetime], format_str: str = '%Y-%m-%d %H:%M:%S
     return local_dt.strftime(format_str)
 
 
+# ISO 8601 formats that datetime.isoformat renders faster than strftime,
+# mapped to the date/time separator to pass it
+_ISO_FORMAT_SEPARATORS = {
+    '%Y-%m-%dT%H:%M:%S': 'T',
+    '%Y-%m-%d %H:%M:%S': ' ',
+}
+
+
+def format_datetime_batch(dts: List[Optional[datetime]], format_str: str = '%Y-%m-%d %H:%M:%S',
+                          to_tz: Optional[str] = None) -> List[str]:
+    """
+    Format many datetimes the way format_datetime does, resolving the timezone once.
+    
+    Args:
+        dts: Datetimes to format (naive ones are taken as UTC)
+        format_str: Python strftime format string
+        to_tz: Target timezone (default: local timezone)
+    
+    Returns:
+        List[str]: Formatted strings, with '' for None entries
+        
+    Example:
+        >>> utc_dts = [datetime(2026, 1, 15, 18, 30, tzinfo=timezone.utc)]
+        >>> format_datetime_batch(utc_dts, '%Y-%m-%dT%H:%M:%S', 'America/Los_Angeles')
+        ['2026-01-15T10:30:00']
+    """
+    target_tz = get_timezone(to_tz)
+    iso_sep = _ISO_FORMAT_SEPARATORS.get(format_str)
+    
+    formatted = []
+    for dt in dts:
+        if dt is None:
+            formatted.append('')
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        local_dt = dt.astimezone(target_tz)
+        # strftime doesn't zero-pad years before 1000; isoformat does
+        if iso_sep and local_dt.year >= 1000:
+            formatted.append(local_dt.isoformat(iso_sep, 'seconds')[:19])
+        else:
+            formatted.append(local_dt.strftime(format_str))
+    return formatted
+
+
 def format_flight_time(minutes: float) -> str:
     """
     Format flight time in minutes to human-readable format.
@@ -274,17 +339,22 @@ def parse_flight_time(time_str: str) -> float:
     """
     time_str = time_str.strip().lower()
     
-    # Try decimal hours first (e.g., "2.5")
-    try:
-        hours = float(time_str)
-        return hours * 60
-    except ValueError:
-        pass
+    has_hours = 'h' in time_str
+    has_minutes = 'm' in time_str
+    
+    # Try decimal hours first (e.g., "2.5"); float() never accepts an 'h' or
+    # 'm', so "2h 30m" skips the failed conversion and its exception
+    if not (has_hours or has_minutes):
+        try:
+            hours = float(time_str)
+            return hours * 60
+        except ValueError:
+            pass
     
     # Parse "2h 30m" format
     total_minutes = 0.0
     
-    if 'h' in time_str:
+    if has_hours:
         parts = time_str.split('h')
         try:
             hours = float(parts[0].strip())
@@ -303,39 +373,14 @@ def parse_flight_time(time_str: str) -> float:
     return total_minutes
 
 
-def calculate_sunrise_sunset(
-    latitude: float,
-    longitude: float,
-    date: Optional[datetime] = None
-) -> Tuple[datetime, datetime]:
+@functools.lru_cache(maxsize=4096)
+def _sun_event_hours(latitude: float, longitude: float, n: int) -> Tuple[float, float]:
     """
-    Calculate sunrise and sunset times for a given location and date.
+    UTC hours of sunrise and sunset on day of year n (see calculate_sunrise_sunset).
     
-    Uses a simplified astronomical formula. Accurate to within a few minutes.
-    
-    Args:
-        latitude: Latitude in degrees (-90 to 90)
-        longitude: Longitude in degrees (-180 to 180)
-        date: Date to calculate for (default: today in UTC)
-    
-    Returns:
-        tuple: (sunrise_utc, sunset_utc) as UTC datetimes
-        
-    Example:
-        >>> # San Francisco coordinates
-        >>> sunrise, sunset = calculate_sunrise_sunset(37.7749, -122.4194)
-        >>> print(f'Sunrise: {sunrise.strftime("%H:%M")} UTC')
-        >>> print(f'Sunset: {sunset.strftime("%H:%M")} UTC')
+    Memoized: they only change from day to day, so repeated calls for the same
+    place (e.g. polling is_night) reuse the result.
     """
-    if date is None:
-        date = utcnow()
-    
-    # Convert to UTC if not already
-    date_utc = to_utc(date)
-    
-    # Day of year
-    n = date_utc.timetuple().tm_yday
-    
     # Longitude hour value
     lng_hour = longitude / 15.0
     
@@ -408,6 +453,44 @@ def calculate_sunrise_sunset(
     ut_rise = (t_rise_local - lng_hour) % 24
     ut_set = (t_set_local - lng_hour) % 24
     
+    return ut_rise, ut_set
+
+
+def calculate_sunrise_sunset(
+    latitude: float,
+    longitude: float,
+    date: Optional[datetime] = None
+) -> Tuple[datetime, datetime]:
+    """
+    Calculate sunrise and sunset times for a given location and date.
+    
+    Uses a simplified astronomical formula. Accurate to within a few minutes.
+    
+    Args:
+        latitude: Latitude in degrees (-90 to 90)
+        longitude: Longitude in degrees (-180 to 180)
+        date: Date to calculate for (default: today in UTC)
+    
+    Returns:
+        tuple: (sunrise_utc, sunset_utc) as UTC datetimes
+        
+    Example:
+        >>> # San Francisco coordinates
+        >>> sunrise, sunset = calculate_sunrise_sunset(37.7749, -122.4194)
+        >>> print(f'Sunrise: {sunrise.strftime("%H:%M")} UTC')
+        >>> print(f'Sunset: {sunset.strftime("%H:%M")} UTC')
+    """
+    if date is None:
+        date = utcnow()
+    
+    # Convert to UTC if not already
+    date_utc = to_utc(date)
+    
+    # Day of year
+    n = date_utc.timetuple().tm_yday
+    
+    ut_rise, ut_set = _sun_event_hours(latitude, longitude, n)
+    
     # Create datetime objects
     sunrise = datetime(date_utc.year, date_utc.month, date_utc.day, tzinfo=timezone.utc)
     sunrise = sunrise + timedelta(hours=ut_rise)
@@ -418,6 +501,83 @@ def calculate_sunrise_sunset(
     return sunrise, sunset
 
 
+def calculate_sunrise_sunset_batch(latitudes, longitudes, date: Optional[datetime] = None):
+    """
+    Calculate sunrise and sunset times for many locations on one date.
+    
+    The same formula as calculate_sunrise_sunset, evaluated with NumPy over
+    whole arrays (e.g. every airport along a route) in one call. Requires
+    numpy.
+    
+    Args:
+        latitudes: Latitudes in degrees (array-like)
+        longitudes: Longitudes in degrees (array-like, same shape)
+        date: Date to calculate for (default: today in UTC)
+    
+    Returns:
+        tuple: (sunrise_utc, sunset_utc) as numpy datetime64[us] arrays in UTC
+        
+    Example:
+        >>> sunrises, sunsets = calculate_sunrise_sunset_batch(
+        ...     [37.7749, 40.7128], [-122.4194, -74.0060])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError(
+            "numpy package not installed. Install with: pip install numpy"
+        ) from None
+    
+    if date is None:
+        date = utcnow()
+    
+    date_utc = to_utc(date)
+    n = date_utc.timetuple().tm_yday
+    
+    latitude = np.asarray(latitudes, dtype=np.float64)
+    lng_hour = np.asarray(longitudes, dtype=np.float64) / 15.0
+    
+    t_rise = n + ((6 - lng_hour) / 24.0)
+    t_set = n + ((18 - lng_hour) / 24.0)
+    
+    def sun_longitude(t):
+        m = (0.9856 * t) - 3.289
+        l = m + (1.916 * np.sin(np.radians(m))) + (0.020 * np.sin(np.radians(2 * m))) + 282.634
+        return l % 360
+    
+    def right_ascension(l):
+        ra = np.degrees(np.arctan(0.91764 * np.tan(np.radians(l)))) % 360
+        ra = ra + (np.floor(l / 90) * 90 - np.floor(ra / 90) * 90)
+        return ra / 15.0
+    
+    l_rise = sun_longitude(t_rise)
+    l_set = sun_longitude(t_set)
+    
+    # As in calculate_sunrise_sunset, the hour angle uses the declination at
+    # sunrise for both events
+    dec_rise = np.arcsin(0.39782 * np.sin(np.radians(l_rise)))
+    lat_rad = np.radians(latitude)
+    cos_h = (math.cos(math.radians(90.833)) - (np.sin(dec_rise) * np.sin(lat_rad))) / \
+            (np.cos(dec_rise) * np.cos(lat_rad))
+    
+    h = np.degrees(np.arccos(np.clip(cos_h, -1.0, 1.0)))
+    # Sun never rises (cos_h > 1) or never sets (cos_h < -1)
+    h_rise = np.where(cos_h > 1, 0.0, np.where(cos_h < -1, 180.0, (360 - h) / 15.0))
+    h_set = np.where(cos_h > 1, 0.0, np.where(cos_h < -1, 180.0, h / 15.0))
+    
+    t_rise_local = h_rise + right_ascension(l_rise) - (0.06571 * t_rise) - 6.622
+    t_set_local = h_set + right_ascension(l_set) - (0.06571 * t_set) - 6.622
+    
+    ut_rise = (t_rise_local - lng_hour) % 24
+    ut_set = (t_set_local - lng_hour) % 24
+    
+    midnight = np.datetime64(date_utc.date(), 'us')
+    sunrise = midnight + np.rint(ut_rise * 3.6e9).astype('timedelta64[us]')
+    sunset = midnight + np.rint(ut_set * 3.6e9).astype('timedelta64[us]')
+    
+    return sunrise, sunset
+
+
 def is_night(
     latitude: float,
     longitude: float,
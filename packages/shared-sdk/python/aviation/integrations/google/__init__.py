@@ -5,6 +5,7 @@ Python wrapper for Google Calendar API matching TypeScript implementation
 
 from .auth import GoogleCalendarAuth
 from .calendar import GoogleCalendarClient
+from .async_calendar import AsyncGoogleCalendarClient
 from .types import (
     GoogleCredentials,
     GoogleOAuthConfig,
@@ -16,6 +17,7 @@ from .types import (
 __all__ = [
     'GoogleCalendarAuth',
     'GoogleCalendarClient',
+    'AsyncGoogleCalendarClient',
     'GoogleCredentials',
     'GoogleOAuthConfig',
     'CalendarEvent',
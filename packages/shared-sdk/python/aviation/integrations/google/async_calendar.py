@@ -0,0 +1,246 @@
+"""
+Google Calendar Integration - Async Calendar API Client
+asyncio counterpart of GoogleCalendarClient
+"""
+
+import asyncio
+import logging
+import time
+from typing import List, Optional, Dict, Any, Sequence
+from urllib.parse import quote
+
+import httpx
+
+from .auth import GoogleCalendarAuth, _EXPIRY_BUFFER_MS
+from .types import GoogleCredentials, CalendarEvent, ListEventsOptions
+
+
+CALENDAR_API_URL = 'https://www.googleapis.com/calendar/v3'
+
+# Background refreshes start this long before a token stops counting as
+# valid, so requests find the new token already in place
+_REFRESH_AHEAD_S = 60
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGoogleCalendarClient:
+    """
+    Async Google Calendar API client
+
+    Calls the Calendar REST API directly over one shared httpx.AsyncClient,
+    so requests (e.g. to several crew calendars, see list_events_multi) can
+    be in flight at the same time. Use as an async context manager, or call
+    aclose() when done.
+
+    Once a request has been made, the access token is refreshed in the
+    background shortly before it expires, keeping the token exchange off
+    the request path.
+    """
+
+    def __init__(self, auth: GoogleCalendarAuth, credentials: Optional[GoogleCredentials] = None):
+        self.auth = auth
+        self.credentials = credentials
+        self._http: Optional[httpx.AsyncClient] = None
+        # One token refresh at a time, however many requests find it expired
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'AsyncGoogleCalendarClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool"""
+        self._cancel_refresh()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def set_credentials(self, credentials: GoogleCredentials) -> None:
+        """Set credentials for API calls"""
+        self.credentials = credentials
+        self._cancel_refresh()
+
+    def _cancel_refresh(self) -> None:
+        """Drop the background refresh scheduled for the old credentials"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh of the current credentials, if none is pending"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        if not (self.credentials.refresh_token and self.credentials.expiry_date):
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_ahead(self.credentials))
+
+    async def _refresh_ahead(self, credentials: GoogleCredentials) -> None:
+        """Refresh credentials just before is_token_valid() would reject them"""
+        refresh_at = (credentials.expiry_date - _EXPIRY_BUFFER_MS) / 1000 - _REFRESH_AHEAD_S
+        await asyncio.sleep(max(0.0, refresh_at - time.time()))
+
+        async with self._refresh_lock:
+            if self.credentials is not credentials:
+                return  # Already replaced
+            try:
+                self.credentials = await asyncio.to_thread(
+                    self.auth.refresh_access_token, credentials.refresh_token
+                )
+            except Exception as e:
+                # The next request refreshes on demand instead
+                logger.warning("Background token refresh failed: %s", e)
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Authorization header, refreshing the access token if needed"""
+        if not self.credentials:
+            raise ValueError('No credentials available')
+
+        if not self.auth.is_token_valid(self.credentials):
+            async with self._refresh_lock:
+                # The refresh is a blocking HTTP call; keep it off the event loop
+                self.credentials = await asyncio.to_thread(
+                    self.auth.ensure_valid_credentials, self.credentials
+                )
+
+        self._schedule_refresh()
+        return {'Authorization': f'Bearer {self.credentials.access_token}'}
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send an API request and return its JSON response"""
+        headers = await self._auth_headers()
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(base_url=CALENDAR_API_URL, timeout=30)
+
+        resp = await self._http.request(method, path, params=params, json=body, headers=headers)
+        if resp.is_error:
+            raise Exception(f'Google Calendar API error: {resp.status_code} {resp.text}')
+
+        return resp.json() if resp.content else {}
+
+    @staticmethod
+    def _events_path(calendar_id: str, event_id: Optional[str] = None) -> str:
+        """Path of a calendar's events, or of one event"""
+        path = f'/calendars/{quote(calendar_id, safe="")}/events'
+        if event_id is not None:
+            path += f'/{quote(event_id, safe="")}'
+        return path
+
+    async def list_calendars(self) -> List[Dict[str, Any]]:
+        """List all calendars"""
+        calendar_list = await self._request('GET', '/users/me/calendarList')
+        return calendar_list.get('items', [])
+
+    async def get_calendar(self, calendar_id: str = 'primary') -> Dict[str, Any]:
+        """Get a specific calendar"""
+        return await self._request('GET', f'/calendars/{quote(calendar_id, safe="")}')
+
+    async def list_events(
+        self,
+        calendar_id: str = 'primary',
+        options: Optional[ListEventsOptions] = None
+    ) -> List[CalendarEvent]:
+        """
+        List events in a calendar
+
+        Args:
+            calendar_id: Calendar ID (default: 'primary')
+            options: Filter options
+
+        Returns:
+            List of calendar events
+        """
+        params = options.to_params() if options else None
+        events_result = await self._request('GET', self._events_path(calendar_id), params=params)
+        return [CalendarEvent.from_dict(event) for event in events_result.get('items', [])]
+
+    async def list_events_multi(
+        self,
+        calendar_ids: Sequence[str],
+        options: Optional[ListEventsOptions] = None
+    ) -> Dict[str, List[CalendarEvent]]:
+        """
+        List events in several calendars concurrently
+
+        Args:
+            calendar_ids: Calendar IDs
+            options: Filter options, applied to every calendar
+
+        Returns:
+            Events by calendar ID, in the order given
+        """
+        results = await asyncio.gather(
+            *(self.list_events(calendar_id, options) for calendar_id in calendar_ids)
+        )
+        return dict(zip(calendar_ids, results))
+
+    async def get_event(self, event_id: str, calendar_id: str = 'primary') -> CalendarEvent:
+        """Get a specific event"""
+        event = await self._request('GET', self._events_path(calendar_id, event_id))
+        return CalendarEvent.from_dict(event)
+
+    async def create_event(
+        self,
+        event: CalendarEvent,
+        calendar_id: str = 'primary'
+    ) -> CalendarEvent:
+        """Create a new calendar event"""
+        created = await self._request('POST', self._events_path(calendar_id), body=event.to_dict())
+        return CalendarEvent.from_dict(created)
+
+    async def update_event(
+        self,
+        event_id: str,
+        event: CalendarEvent,
+        calendar_id: str = 'primary'
+    ) -> CalendarEvent:
+        """Update an existing calendar event"""
+        updated = await self._request(
+            'PUT', self._events_path(calendar_id, event_id), body=event.to_dict()
+        )
+        return CalendarEvent.from_dict(updated)
+
+    async def patch_event(
+        self,
+        event_id: str,
+        updates: Dict[str, Any],
+        calendar_id: str = 'primary'
+    ) -> CalendarEvent:
+        """Partially update an event (PATCH)"""
+        updated = await self._request('PATCH', self._events_path(calendar_id, event_id), body=updates)
+        return CalendarEvent.from_dict(updated)
+
+    async def delete_event(self, event_id: str, calendar_id: str = 'primary') -> None:
+        """Delete a calendar event"""
+        await self._request('DELETE', self._events_path(calendar_id, event_id))
+
+    async def quick_add(self, text: str, calendar_id: str = 'primary') -> CalendarEvent:
+        """Quick add event using natural language"""
+        event = await self._request(
+            'POST', self._events_path(calendar_id) + '/quickAdd', params={'text': text}
+        )
+        return CalendarEvent.from_dict(event)
+
+    async def get_free_busy(
+        self,
+        time_min,
+        time_max,
+        items: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Get free/busy information for calendars"""
+        body = {
+            'timeMin': time_min.isoformat() if hasattr(time_min, 'isoformat') else time_min,
+            'timeMax': time_max.isoformat() if hasattr(time_max, 'isoformat') else time_max,
+            'items': items,
+        }
+        return await self._request('POST', '/freeBusy', body=body)
@@ -3,8 +3,10 @@ Google Calendar Integration - OAuth2 Authentication
 Python implementation matching TypeScript API
 """
 
+import functools
+import threading
 import time
-from typing import Optional
+from typing import Dict, Optional
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
@@ -23,6 +25,22 @@ GOOGLE_OAUTH_ENDPOINTS = {
     'revoke_uri': 'https://oauth2.googleapis.com/revoke',
 }
 
+# Authorization flows kept for their callbacks; the oldest are dropped first
+MAX_PENDING_FLOWS = 256
+
+# Tokens count as expired this long before their expiry time (5 minutes)
+_EXPIRY_BUFFER_MS = 5 * 60 * 1000
+
+
+@functools.lru_cache(maxsize=1024)
+def _valid_until_ns(expiry_date: int) -> int:
+    """
+    time.monotonic_ns() deadline for a token expiring at expiry_date (Unix
+    ms), worked out from the wall clock once per expiry time
+    """
+    remaining_ms = expiry_date - _EXPIRY_BUFFER_MS - int(time.time() * 1000)
+    return time.monotonic_ns() + remaining_ms * 1_000_000
+
 
 class GoogleCalendarAuth:
     """Google Calendar OAuth2 authentication handler"""
@@ -30,6 +48,31 @@ class GoogleCalendarAuth:
     def __init__(self, config: GoogleOAuthConfig):
         self.config = config
         self.credentials: Optional[GoogleCredentials] = None
+        self._client_config = {
+            'web': {
+                'client_id': config.client_id,
+                'client_secret': config.client_secret,
+                'auth_uri': GOOGLE_OAUTH_ENDPOINTS['auth_uri'],
+                'token_uri': GOOGLE_OAUTH_ENDPOINTS['token_uri'],
+                'redirect_uris': [config.redirect_uri],
+            }
+        }
+        # Flows from get_authorization_url by state, so the callback reuses
+        # the flow (and its PKCE code verifier) instead of building another
+        self._pending_flows: Dict[str, Flow] = {}
+        self._flows_lock = threading.Lock()
+        # One transport for token refreshes, keeping the HTTPS connection to
+        # the token endpoint alive between them
+        self._auth_request = Request()
+    
+    def _new_flow(self, state: Optional[str]) -> Flow:
+        flow = Flow.from_client_config(
+            self._client_config,
+            scopes=self.config.scopes,
+            state=state,
+        )
+        flow.redirect_uri = self.config.redirect_uri
+        return flow
     
     def get_authorization_url(self, state: Optional[str] = None) -> str:
         """
@@ -41,29 +84,20 @@ class GoogleCalendarAuth:
         Returns:
             Authorization URL to redirect user to
         """
-        client_config = {
-            'web': {
-                'client_id': self.config.client_id,
-                'client_secret': self.config.client_secret,
-                'auth_uri': GOOGLE_OAUTH_ENDPOINTS['auth_uri'],
-                'token_uri': GOOGLE_OAUTH_ENDPOINTS['token_uri'],
-                'redirect_uris': [self.config.redirect_uri],
-            }
-        }
+        flow = self._new_flow(state)
         
-        flow = Flow.from_client_config(
-            client_config,
-            scopes=self.config.scopes,
-            state=state,
-        )
-        flow.redirect_uri = self.config.redirect_uri
-        
-        authorization_url, _ = flow.authorization_url(
+        authorization_url, flow_state = flow.authorization_url(
             access_type='offline',
             include_granted_scopes='true',
             prompt='consent',  # Force to get refresh token
         )
         
+        with self._flows_lock:
+            self._pending_flows.pop(flow_state, None)
+            self._pending_flows[flow_state] = flow
+            while len(self._pending_flows) > MAX_PENDING_FLOWS:
+                del self._pending_flows[next(iter(self._pending_flows))]
+        
         return authorization_url
     
     def handle_callback(self, code: str, state: Optional[str] = None) -> GoogleCredentials:
@@ -77,22 +111,13 @@ class GoogleCalendarAuth:
         Returns:
             Google credentials with access and refresh tokens
         """
-        client_config = {
-            'web': {
-                'client_id': self.config.client_id,
-                'client_secret': self.config.client_secret,
-                'auth_uri': GOOGLE_OAUTH_ENDPOINTS['auth_uri'],
-                'token_uri': GOOGLE_OAUTH_ENDPOINTS['token_uri'],
-                'redirect_uris': [self.config.redirect_uri],
-            }
-        }
-        
-        flow = Flow.from_client_config(
-            client_config,
-            scopes=self.config.scopes,
-            state=state,
-        )
-        flow.redirect_uri = self.config.redirect_uri
+        flow = None
+        if state is not None:
+            with self._flows_lock:
+                flow = self._pending_flows.pop(state, None)
+        if flow is None:
+            # Started elsewhere (another process, or before a restart)
+            flow = self._new_flow(state)
         flow.fetch_token(code=code)
         
         creds = flow.credentials
@@ -131,7 +156,7 @@ class GoogleCalendarAuth:
             scopes=self.config.scopes,
         )
         
-        creds.refresh(Request())
+        creds.refresh(self._auth_request)
         
         expiry_ms = None
         if creds.expiry:
@@ -160,11 +185,9 @@ class GoogleCalendarAuth:
         if not credentials.expiry_date:
             return True  # Assume valid if no expiry
         
-        # Add 5 minute buffer (in milliseconds)
-        buffer_ms = 5 * 60 * 1000
-        current_ms = int(time.time() * 1000)
-        
-        return credentials.expiry_date > (current_ms + buffer_ms)
+        # Compared against a cached monotonic deadline rather than
+        # recomputing the buffered expiry from time.time() on every request
+        return time.monotonic_ns() < _valid_until_ns(credentials.expiry_date)
     
     def ensure_valid_credentials(self, credentials: GoogleCredentials) -> GoogleCredentials:
         """
@@ -3,15 +3,56 @@ Google Calendar Integration - Calendar API Client
 Python implementation matching TypeScript API
 """
 
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Sequence, Union
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from .auth import GoogleCalendarAuth
 from .types import GoogleCredentials, CalendarEvent, ListEventsOptions
 
 
+# Most requests the Calendar API accepts in one batch
+BATCH_SIZE = 50
+
+# Columns of list_events_df(), in order
+EVENT_DF_COLUMNS = [
+    'id', 'summary', 'description', 'location', 'status',
+    'start.dateTime', 'start.date', 'end.dateTime', 'end.date',
+]
+
+
+class _ThreadLocalHttp:
+    """
+    httplib2.Http stand-in that sends each request on the calling thread's own
+    long-lived Http, shared by every client on that thread. Connections stay
+    open between requests (keep-alive), so only the first call on a thread
+    pays for the TLS handshake. httplib2.Http isn't thread-safe, hence one
+    per thread rather than one per process.
+    """
+    
+    _local = threading.local()
+    
+    def _http(self):
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = build_http()
+        return http
+    
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        # timeout, connections, close(), ... of this thread's Http
+        return getattr(self._http(), name)
+
+
+_shared_http = _ThreadLocalHttp()
+
+
 class GoogleCalendarClient:
     """Google Calendar API client"""
     
@@ -19,15 +60,42 @@ class GoogleCalendarClient:
         self.auth = auth
         self.credentials = credentials
         self._service = None
+        # google.oauth2 Credentials the service signs requests with
+        self._creds: Optional[Credentials] = None
     
     def set_credentials(self, credentials: GoogleCredentials) -> None:
         """Set credentials for API calls"""
+        same_grant = (
+            self._creds is not None
+            and credentials.refresh_token == self._creds.refresh_token
+        )
         self.credentials = credentials
-        self._service = None  # Reset service to reinitialize with new credentials
+        if same_grant:
+            # A refreshed token for the same grant; keep the built service
+            self._apply_token()
+        else:
+            self._service = None  # Reset service to reinitialize with new credentials
+            self._creds = None
+    
+    def _apply_token(self) -> None:
+        """Point the built service's credentials at the current access token"""
+        self._creds.token = self.credentials.access_token
+        self._creds.expiry = self._expiry()
+    
+    def _expiry(self):
+        """Token expiry as google.oauth2 Credentials expects it"""
+        if not self.credentials.expiry_date:
+            return None
+        from datetime import datetime
+        return datetime.fromtimestamp(self.credentials.expiry_date / 1000)
     
     def _get_service(self):
         """Get or create Google Calendar service"""
         if self._service:
+            if self._creds is not None and not self.auth.is_token_valid(self.credentials):
+                # Refresh in place; the service itself stays valid
+                self.credentials = self.auth.ensure_valid_credentials(self.credentials)
+                self._apply_token()
             return self._service
         
         if not self.credentials:
@@ -37,12 +105,7 @@ class GoogleCalendarClient:
         self.credentials = self.auth.ensure_valid_credentials(self.credentials)
         
         # Convert to google.oauth2.credentials.Credentials
-        expiry = None
-        if self.credentials.expiry_date:
-            from datetime import datetime
-            expiry = datetime.fromtimestamp(self.credentials.expiry_date / 1000)
-        
-        creds = Credentials(
+        self._creds = Credentials(
             token=self.credentials.access_token,
             refresh_token=self.credentials.refresh_token,
             token_uri='https://oauth2.googleapis.com/token',
@@ -50,10 +113,12 @@ class GoogleCalendarClient:
             client_secret=self.auth.config.client_secret,
             scopes=self.auth.config.scopes,
         )
-        if expiry:
-            creds.expiry = expiry
+        self._creds.expiry = self._expiry()
         
-        self._service = build('calendar', 'v3', credentials=creds)
+        # Discovery document from the copy bundled with the library, not an
+        # HTTP fetch
+        authed_http = google_auth_httplib2.AuthorizedHttp(self._creds, http=_shared_http)
+        self._service = build('calendar', 'v3', http=authed_http, static_discovery=True)
         return self._service
     
     def list_calendars(self) -> List[Dict[str, Any]]:
@@ -89,33 +154,56 @@ class GoogleCalendarClient:
         Returns:
             List of calendar events
         """
+        events_data = self._list_event_items(calendar_id, options)
+        return [CalendarEvent.from_dict(event) for event in events_data]
+    
+    def list_events_df(
+        self,
+        calendar_id: str = 'primary',
+        options: Optional[ListEventsOptions] = None
+    ):
+        """
+        List events in a calendar as a pandas DataFrame
+        
+        Builds the table straight from the API response, without creating a
+        CalendarEvent per row; for dashboards and tables that filter or
+        aggregate many events.
+        
+        Args:
+            calendar_id: Calendar ID (default: 'primary')
+            options: Filter options
+            
+        Returns:
+            DataFrame with one row per event and EVENT_DF_COLUMNS as columns
+            (missing values are NaN)
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError(
+                "pandas package not installed. Install with: pip install pandas"
+            ) from None
+        
+        events_data = self._list_event_items(calendar_id, options)
+        df = pd.json_normalize(events_data, max_level=1)
+        return df.reindex(columns=EVENT_DF_COLUMNS)
+    
+    def _list_event_items(
+        self,
+        calendar_id: str,
+        options: Optional[ListEventsOptions]
+    ) -> List[Dict[str, Any]]:
+        """Raw events.list items"""
         try:
             service = self._get_service()
             
             # Build query parameters
             params = {'calendarId': calendar_id}
-            
             if options:
-                if options.timeMin:
-                    params['timeMin'] = options.timeMin.isoformat()
-                if options.timeMax:
-                    params['timeMax'] = options.timeMax.isoformat()
-                if options.maxResults:
-                    params['maxResults'] = options.maxResults
-                if options.orderBy:
-                    params['orderBy'] = options.orderBy
-                    params['singleEvents'] = True  # Required for orderBy
-                if options.q:
-                    params['q'] = options.q
-                if options.singleEvents is not None:
-                    params['singleEvents'] = options.singleEvents
-                if options.showDeleted is not None:
-                    params['showDeleted'] = options.showDeleted
+                params.update(options.to_params())
             
             events_result = service.events().list(**params).execute()
-            events_data = events_result.get('items', [])
-            
-            return [CalendarEvent.from_dict(event) for event in events_data]
+            return events_result.get('items', [])
         except HttpError as e:
             raise Exception(f'Google Calendar API error: {e}')
     
@@ -229,6 +317,98 @@ class GoogleCalendarClient:
         except HttpError as e:
             raise Exception(f'Google Calendar API error: {e}')
     
+    def _execute_batch(self, requests: Sequence[Any]) -> List[Any]:
+        """
+        Send API requests in batches of BATCH_SIZE (one HTTP round trip each)
+        
+        Returns:
+            Each request's response, or its error as an Exception, in order
+        """
+        service = self._get_service()
+        results: List[Any] = [None] * len(requests)
+        
+        def collect(request_id, response, exception):
+            if exception is not None:
+                response = Exception(f'Google Calendar API error: {exception}')
+            results[int(request_id)] = response
+        
+        try:
+            for start in range(0, len(requests), BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=collect)
+                for i in range(start, min(start + BATCH_SIZE, len(requests))):
+                    batch.add(requests[i], request_id=str(i))
+                batch.execute()
+        except HttpError as e:
+            raise Exception(f'Google Calendar API error: {e}')
+        
+        return results
+    
+    def batch_create_events(
+        self,
+        events: Sequence[CalendarEvent],
+        calendar_id: str = 'primary'
+    ) -> List[Union[CalendarEvent, Exception]]:
+        """
+        Create many events, BATCH_SIZE per HTTP request
+        
+        Args:
+            events: Events to create
+            calendar_id: Calendar ID (default: 'primary')
+            
+        Returns:
+            The created event, or the Exception for a failed one, per event
+        """
+        service = self._get_service()
+        results = self._execute_batch([
+            service.events().insert(calendarId=calendar_id, body=event.to_dict())
+            for event in events
+        ])
+        return [r if isinstance(r, Exception) else CalendarEvent.from_dict(r) for r in results]
+    
+    def batch_update_events(
+        self,
+        updates: Dict[str, CalendarEvent],
+        calendar_id: str = 'primary'
+    ) -> List[Union[CalendarEvent, Exception]]:
+        """
+        Update many events, BATCH_SIZE per HTTP request
+        
+        Args:
+            updates: Updated event data by event ID
+            calendar_id: Calendar ID (default: 'primary')
+            
+        Returns:
+            The updated event, or the Exception for a failed one, per event
+        """
+        service = self._get_service()
+        results = self._execute_batch([
+            service.events().update(calendarId=calendar_id, eventId=event_id, body=event.to_dict())
+            for event_id, event in updates.items()
+        ])
+        return [r if isinstance(r, Exception) else CalendarEvent.from_dict(r) for r in results]
+    
+    def batch_delete_events(
+        self,
+        event_ids: Sequence[str],
+        calendar_id: str = 'primary'
+    ) -> List[Optional[Exception]]:
+        """
+        Delete many events, BATCH_SIZE per HTTP request
+        
+        Args:
+            event_ids: Event IDs to delete
+            calendar_id: Calendar ID (default: 'primary')
+            
+        Returns:
+            None, or the Exception for a failed delete, per event
+        """
+        service = self._get_service()
+        results = self._execute_batch([
+            service.events().delete(calendarId=calendar_id, eventId=event_id)
+            for event_id in event_ids
+        ])
+        return [r if isinstance(r, Exception) else None for r in results]
+    
     def quick_add(self, text: str, calendar_id: str = 'primary') -> CalendarEvent:
         """
         Quick add event using natural language
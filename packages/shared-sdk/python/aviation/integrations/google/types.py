@@ -8,7 +8,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class GoogleCredentials:
     """OAuth2 credentials for Google Calendar"""
     access_token: str
@@ -39,7 +39,7 @@ class GoogleCredentials:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GoogleOAuthConfig:
     """OAuth2 configuration"""
     client_id: str
@@ -51,7 +51,7 @@ class GoogleOAuthConfig:
     ])
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarDateTime:
     """Calendar event date/time"""
     dateTime: Optional[str] = None  # ISO 8601 format
@@ -60,17 +60,13 @@ class CalendarDateTime:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API calls"""
-        result = {}
-        if self.dateTime:
-            result['dateTime'] = self.dateTime
-        if self.date:
-            result['date'] = self.date
-        if self.timeZone:
-            result['timeZone'] = self.timeZone
-        return result
+        return {
+            name: value for name in ('dateTime', 'date', 'timeZone')
+            if (value := getattr(self, name))
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     """Calendar event"""
     summary: str
@@ -85,6 +81,12 @@ class CalendarEvent:
     status: Optional[str] = None
     visibility: Optional[str] = None
     
+    # Sent only when set
+    _OPTIONAL_FIELDS = (
+        'id', 'description', 'location', 'recurrence', 'reminders',
+        'colorId', 'status', 'visibility',
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API calls"""
         result = {
@@ -92,22 +94,9 @@ class CalendarEvent:
             'start': self.start.to_dict(),
             'end': self.end.to_dict(),
         }
-        if self.id:
-            result['id'] = self.id
-        if self.description:
-            result['description'] = self.description
-        if self.location:
-            result['location'] = self.location
-        if self.recurrence:
-            result['recurrence'] = self.recurrence
-        if self.reminders:
-            result['reminders'] = self.reminders
-        if self.colorId:
-            result['colorId'] = self.colorId
-        if self.status:
-            result['status'] = self.status
-        if self.visibility:
-            result['visibility'] = self.visibility
+        for name in self._OPTIONAL_FIELDS:
+            if value := getattr(self, name):
+                result[name] = value
         return result
     
     @classmethod
@@ -139,7 +128,7 @@ class CalendarEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListEventsOptions:
     """Options for listing events"""
     timeMin: Optional[datetime] = None
@@ -149,3 +138,23 @@ class ListEventsOptions:
     q: Optional[str] = None  # Free text search
     singleEvents: Optional[bool] = None
     showDeleted: Optional[bool] = None
+    
+    def to_params(self) -> Dict[str, Any]:
+        """Convert to events.list query parameters"""
+        params: Dict[str, Any] = {}
+        if self.timeMin:
+            params['timeMin'] = self.timeMin.isoformat()
+        if self.timeMax:
+            params['timeMax'] = self.timeMax.isoformat()
+        if self.maxResults:
+            params['maxResults'] = self.maxResults
+        if self.orderBy:
+            params['orderBy'] = self.orderBy
+            params['singleEvents'] = True  # Required for orderBy
+        if self.q:
+            params['q'] = self.q
+        if self.singleEvents is not None:
+            params['singleEvents'] = self.singleEvents
+        if self.showDeleted is not None:
+            params['showDeleted'] = self.showDeleted
+        return params
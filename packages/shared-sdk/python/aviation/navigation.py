@@ -7,9 +7,47 @@ All calculations use standard aviation units: nautical miles, knots, degrees.
 Ported from TypeScript implementation in packages/shared-sdk/src/aviation/navigation/
 """
 
+import functools
 import math
 from datetime import datetime, timedelta
-from typing import Tuple, Dict, Literal, Optional
+from typing import Any, Tuple, Dict, Literal, Optional
+
+
+@functools.lru_cache(maxsize=1)
+def _nav_kernels():
+    """
+    Native kernels for the trig-heavy functions (aviation._nav_kernel), or
+    None without Numba. Imported on first use, so importing this module does
+    not load Numba.
+    """
+    try:
+        from . import _nav_kernel
+    except ImportError:
+        return None
+    return _nav_kernel
+
+
+def _native(name: str, *args: Any) -> Any:
+    """
+    Result of the native kernel `name`, or None to use the Python math.
+    
+    Only int and float arguments go to the kernel, converted to float so each
+    kernel is compiled once. Anything else, and NaN results (the kernels'
+    math domain error), are left to the caller's own math, so errors and edge
+    cases behave exactly as in pure Python.
+    """
+    kernels = _nav_kernels()
+    if kernels is None:
+        return None
+    for arg in args:
+        if not isinstance(arg, (int, float)):
+            return None
+    try:
+        result = getattr(kernels, name)(*[float(arg) for arg in args])
+    except OverflowError:
+        return None  # an int too large for a float
+    first = result[0] if isinstance(result, tuple) else result
+    return result if first == first else None  # not NaN
 
 
 # Constants
@@ -18,6 +56,14 @@ EARTH_RADIUS_KM = 6371.0
 EARTH_RADIUS_MI = 3958.8
 EARTH_RADIUS_METERS = 6371000.0
 
+# Earth radius by distance unit
+_EARTH_RADIUS = {
+    'NM': EARTH_RADIUS_NM,
+    'KM': EARTH_RADIUS_KM,
+    'MI': EARTH_RADIUS_MI,
+    'METERS': EARTH_RADIUS_METERS,
+}
+
 FUEL_DENSITY = {
     'AVGAS_100LL': 6.0,
     'JET_A': 6.7,
@@ -60,13 +106,11 @@ def haversine_distance(
     Returns:
         Distance in specified unit
     """
-    radius_map = {
-        'NM': EARTH_RADIUS_NM,
-        'KM': EARTH_RADIUS_KM,
-        'MI': EARTH_RADIUS_MI,
-        'METERS': EARTH_RADIUS_METERS,
-    }
-    R = radius_map[unit]
+    R = _EARTH_RADIUS[unit]
+    
+    distance = _native("haversine", lat1, lon1, lat2, lon2, R)
+    if distance is not None:
+        return distance
     
     phi1 = to_radians(lat1)
     phi2 = to_radians(lat2)
@@ -96,6 +140,64 @@ def distance_mi(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return haversine_distance(lat1, lon1, lat2, lon2, 'MI')
 
 
+def haversine_distance_batch(lat1, lon1, lat2, lon2, unit: Literal['NM', 'KM', 'MI', 'METERS'] = 'NM'):
+    """
+    Calculate haversine distances for many point pairs at once.
+    
+    The same formula as haversine_distance, evaluated with NumPy over whole
+    arrays (e.g. every leg of a route) in one call. Inputs broadcast against
+    each other, so one point can be measured against many. Requires numpy.
+    
+    Args:
+        lat1: Starting latitudes in degrees (array-like)
+        lon1: Starting longitudes in degrees (array-like)
+        lat2: Ending latitudes in degrees (array-like)
+        lon2: Ending longitudes in degrees (array-like)
+        unit: Unit for result (default: 'NM')
+    
+    Returns:
+        numpy array of distances in specified unit
+    
+    Example:
+        >>> lats, lons = [37.62, 39.86, 40.64], [-122.38, -104.67, -73.78]
+        >>> legs = haversine_distance_batch(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError(
+            "numpy package not installed. Install with: pip install numpy"
+        ) from None
+    
+    R = _EARTH_RADIUS[unit]
+    
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+    
+    kernels = _nav_kernels()
+    if kernels is not None:
+        # Multi-threaded loop over the legs of a 1-D batch
+        shape = np.broadcast_shapes(lat1.shape, lon1.shape, lat2.shape, lon2.shape)
+        if len(shape) == 1:
+            out = np.empty(shape, dtype=np.float64)
+            return kernels.haversine_batch(
+                np.broadcast_to(lat1, shape), np.broadcast_to(lon1, shape),
+                np.broadcast_to(lat2, shape), np.broadcast_to(lon2, shape), R, out,
+            )
+    
+    delta_phi = np.radians(lat2 - lat1)
+    delta_lambda = np.radians(lon2 - lon1)
+    
+    a = (np.sin(delta_phi / 2) ** 2 +
+         np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(delta_lambda / 2) ** 2)
+    
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    return R * c
+
+
 def midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
     """
     Calculate midpoint between two coordinates.
@@ -103,6 +205,10 @@ def midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float,
     Returns:
         Tuple of (latitude, longitude)
     """
+    point = _native("midpoint", lat1, lon1, lat2, lon2)
+    if point is not None:
+        return point
+    
     phi1 = to_radians(lat1)
     lambda1 = to_radians(lon1)
     phi2 = to_radians(lat2)
@@ -141,13 +247,11 @@ def destination(
     Returns:
         Tuple of (latitude, longitude)
     """
-    radius_map = {
-        'NM': EARTH_RADIUS_NM,
-        'KM': EARTH_RADIUS_KM,
-        'MI': EARTH_RADIUS_MI,
-        'METERS': EARTH_RADIUS_METERS,
-    }
-    R = radius_map[unit]
+    R = _EARTH_RADIUS[unit]
+    
+    point = _native("destination", lat, lon, distance, bearing, R)
+    if point is not None:
+        return point
     
     delta = distance / R
     theta = to_radians(bearing)
@@ -179,6 +283,10 @@ def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     Returns:
         Initial bearing in degrees (0-360)
     """
+    bearing = _native("initial_bearing", lat1, lon1, lat2, lon2)
+    if bearing is not None:
+        return bearing
+    
     phi1 = to_radians(lat1)
     phi2 = to_radians(lat2)
     delta_lambda = to_radians(lon2 - lon1)
@@ -199,8 +307,8 @@ def final_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 def normalize_bearing(bearing: float) -> float:
     """Normalize bearing to 0-360 range."""
-    normalized = bearing % 360
-    return normalized if normalized >= 0 else normalized + 360
+    # Python's % takes the sign of the divisor, so this is never negative
+    return bearing % 360
 
 
 def true_to_magnetic(true_heading: float, magnetic_variation: float) -> float:
@@ -225,6 +333,10 @@ def wind_correction_angle(
     Returns:
         WCA in degrees (+ right, - left)
     """
+    wca = _native("wind_correction_angle", true_airspeed, true_course, wind_direction, wind_speed)
+    if wca is not None:
+        return wca
+    
     course_rad = to_radians(true_course)
     wind_dir_rad = to_radians(wind_direction)
     
@@ -252,6 +364,10 @@ def ground_speed(
     wind_speed: float
 ) -> float:
     """Calculate ground speed considering wind."""
+    gs = _native("ground_speed", true_airspeed, true_course, wind_direction, wind_speed)
+    if gs is not None:
+        return gs
+    
     course_rad = to_radians(true_course)
     wind_dir_rad = to_radians(wind_direction)
     
@@ -289,10 +405,7 @@ def normalize_latitude(lat: float) -> float:
 
 def normalize_longitude(lon: float) -> float:
     """Normalize longitude to -180 to 180 range."""
-    normalized = ((lon + 180) % 360)
-    if normalized < 0:
-        normalized += 360
-    return normalized - 180
+    return (lon + 180) % 360 - 180
 
 
 def dms_to_decimal(
@@ -430,6 +543,10 @@ def ias_to_tas(
     Calculate true airspeed from indicated airspeed.
     Simplified calculation - use E6B for more accuracy.
     """
+    tas = _native("ias_to_tas", indicated_airspeed_kts, altitude_ft, temperature_c)
+    if tas is not None:
+        return tas
+    
     # Standard temperature at altitude
     standard_temp_c = 15 - (0.00198 * altitude_ft)
     
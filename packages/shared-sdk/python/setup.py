@@ -15,7 +15,27 @@ setup(
     python_requires=">=3.11",
     install_requires=[
         "httpx>=0.25.0",  # For weather API requests
+        # IANA timezone database for zoneinfo where the OS has none
+        "tzdata; sys_platform == 'win32'",
     ],
+    extras_require={
+        # Vectorized distances and a KD-tree index for airport proximity search
+        "geo": ["numpy", "scipy"],
+        # Compiled, multi-threaded distance kernel on top of "geo", and native
+        # navigation math (haversine, bearings, wind triangle, TAS)
+        "jit": ["numpy", "scipy", "numba"],
+        # Faster JSON for the airport file and the Redis cache
+        "json": ["orjson"],
+        # Redis cache client (sync and asyncio), with the hiredis protocol
+        # parser (redis-py uses it automatically when installed)
+        "cache": ["redis>=5.0.1", "hiredis"],
+        # MessagePack values in the Redis cache (CacheConfig(codec="msgpack"))
+        "msgpack": ["msgspec"],
+        # Native pruning of fuzzy text-search candidates
+        "fuzzy": ["rapidfuzz"],
+        # GoogleCalendarClient.list_events_df
+        "dataframe": ["pandas"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -12,6 +12,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from aviation.airports import (
+    AirportDatabase,
     get_airport,
     search_airports,
     search_airports_advanced,
@@ -52,6 +53,24 @@ class TestHaversineDistance:
         assert distance > 0
         assert distance < 500
 
+    def test_distance_kernel_matches_scalar(self):
+        """Column distance kernel agrees with the scalar formula"""
+        import math
+
+        np = pytest.importorskip('numpy')
+        from aviation import _hav_kernel
+
+        lats = np.array([37.4611, 44.867, -33.9461, 0.0])
+        lons = np.array([-122.115, -123.198, 151.1772, 179.9])
+        lat_rad, lon_rad = np.radians(lats), np.radians(lons)
+
+        distances = _hav_kernel.distances(
+            math.radians(37.0), math.radians(-122.0), lat_rad, lon_rad, np.cos(lat_rad), 3440.065
+        )
+
+        expected = [haversine_distance(37.0, -122.0, lat, lon) for lat, lon in zip(lats, lons)]
+        assert np.allclose(distances, expected, rtol=1e-12)
+
 
 class TestGetAirport:
     """Test airport lookup by code"""
@@ -74,6 +93,18 @@ class TestGetAirport:
         assert airport['icao'] == 'KSFO'
         assert airport['iata'] == 'SFO'
     
+    def test_typed_access_on_slotted_dict(self):
+        """Airport properties read the dict keys; instances carry no __dict__"""
+        import json
+        
+        airport = get_airport('KSFO')
+        
+        assert airport.icao == airport['icao']
+        assert airport.latitude == airport['latitude']
+        assert airport.distance_nm is None
+        assert not hasattr(airport, '__dict__')
+        assert json.loads(json.dumps(airport)) == dict(airport)
+    
     def test_lowercase_code(self):
         """Handle lowercase airport codes"""
         airport = get_airport('ksfo')
@@ -106,6 +137,24 @@ class TestGetAirport:
         airport = get_airport('')
         assert airport is None
     
+    def test_lookups_return_independent_copies(self):
+        """Mutating a returned airport does not affect later lookups"""
+        airport = get_airport('KSFO')
+        airport['name'] = 'changed'
+        
+        assert get_airport('KSFO')['name'] != 'changed'
+    
+    def test_lookup_sees_replaced_airport_list(self):
+        """Assigning a new airports list re-indexes codes"""
+        database = AirportDatabase()
+        database.airports = [{'icao': 'KAAA', 'iata': '', 'latitude': 1.0, 'longitude': 2.0}]
+        database.loaded = True
+        assert database.get_airport_coordinates('KAAA')['longitude'] == 2.0
+        
+        database.airports = [{'icao': 'KBBB', 'iata': '', 'latitude': 3.0, 'longitude': 4.0}]
+        assert database.get_airport_coordinates('KAAA') is None
+        assert database.get_airport_coordinates('KBBB')['latitude'] == 3.0
+    
     def test_major_airports(self):
         """Find multiple major airports"""
         codes = ['KJFK', 'KLAX', 'KORD', 'KATL', 'KDFW']
@@ -185,6 +234,77 @@ class TestSearchAirports:
         # Should all find KSFO
         assert upper[0]['icao'] == lower[0]['icao']
         assert lower[0]['icao'] == mixed[0]['icao']
+    
+    def test_fuzzy_matches_same_as_full_scan(self, monkeypatch):
+        """Text index finds the same fuzzy matches as scoring every airport"""
+        import aviation.airports as airports_module
+        
+        expected = search_airports('heathrw', 20)
+        
+        database = AirportDatabase(str(airports_module.get_airport_database().data_path))
+        monkeypatch.setattr(airports_module, 'np', None)
+        
+        assert expected
+        assert database.search('heathrw', 20) == expected
+    
+    def test_fuzzy_matches_same_without_rapidfuzz(self, monkeypatch):
+        """RapidFuzz pruning keeps exactly the SequenceMatcher results"""
+        import aviation.airports as airports_module
+        
+        queries = ('heathrw', 'internatonal', 'sna jose')
+        expected = [search_airports(query, 20) for query in queries]
+        
+        database = AirportDatabase(str(airports_module.get_airport_database().data_path))
+        monkeypatch.setattr(airports_module, 'rapidfuzz_process', None)
+        monkeypatch.setattr(airports_module, 'Indel', None)
+        
+        assert [database.search(query, 20) for query in queries] == expected
+    
+    def test_repeated_search_returns_independent_copies(self):
+        """Mutating a (cached) search result does not affect later searches"""
+        first = search_airports('KSFO', 5)
+        first[0]['name'] = 'changed'
+        
+        assert search_airports('KSFO', 5)[0]['name'] != 'changed'
+    
+    def test_search_sees_replaced_airport_list(self):
+        """Assigning a new airports list invalidates cached searches"""
+        database = AirportDatabase()
+        database.airports = [{'icao': 'KAAA', 'iata': '', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0}]
+        database.loaded = True
+        assert [a['icao'] for a in database.search('alpha', 5)] == ['KAAA']
+        
+        database.airports = [{'icao': 'KBBB', 'iata': '', 'name': 'Alpha', 'latitude': 3.0, 'longitude': 4.0}]
+        assert [a['icao'] for a in database.search('alpha', 5)] == ['KBBB']
+    
+    def test_search_sees_airport_list_edits(self):
+        """Appending to the airports list, or reassigning it after an in-place edit, invalidates cached searches"""
+        database = AirportDatabase()
+        database.airports = [{'icao': 'KAAA', 'iata': '', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0}]
+        database.loaded = True
+        assert [a['icao'] for a in database.search('alpha', 5)] == ['KAAA']
+        
+        database.airports.append({'icao': 'KBBB', 'iata': '', 'name': 'Alpha', 'latitude': 3.0, 'longitude': 4.0})
+        assert [a['icao'] for a in database.search('alpha', 5)] == ['KAAA', 'KBBB']
+        
+        database.airports[0] = {'icao': 'KCCC', 'iata': '', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0}
+        database.airports = database.airports
+        assert [a['icao'] for a in database.search('alpha', 5)] == ['KCCC', 'KBBB']
+    
+    def test_short_limit_matches_full_ranking(self):
+        """Small limits (exact-code shortcut) keep the full ranking's order"""
+        for query in ('KSFO', 'LAX', '7S5', 'San'):
+            full = search_airports(query, 20)
+            for limit in (1, 2, 3):
+                assert search_airports(query, limit) == full[:limit]
+    
+    def test_code_prefix_limit_matches_full_ranking(self):
+        """Limits filled by ICAO/IATA prefix matches keep the full ranking's order"""
+        for query in ('KS', 'EG', 'SF'):
+            full = search_airports_advanced(query=query, lat=37.6, lon=-122.4, limit=100000)
+            for limit in (1, 5, 20):
+                results = search_airports_advanced(query=query, lat=37.6, lon=-122.4, limit=limit)
+                assert results == full[:limit]
 
 
 class TestSearchAirportsAdvanced:
@@ -277,6 +397,56 @@ class TestSearchAirportsAdvanced:
         assert results[0]['icao'] == 'KSFO'
         assert results[0]['distance_nm'] < 1
     
+    def test_proximity_without_numpy(self, monkeypatch):
+        """Pure-Python distance fallback matches the vectorized path"""
+        import aviation.airports as airports_module
+        
+        expected = search_airports_advanced(lat=37.619, lon=-122.375, radius_nm=40, limit=50)
+        
+        database = AirportDatabase(str(airports_module.get_airport_database().data_path))
+        monkeypatch.setattr(airports_module, 'np', None)
+        results = database.search_airports(
+            latitude=37.619, longitude=-122.375, radius_nm=40, limit=50
+        )
+        
+        assert results == expected
+    
+    def test_proximity_without_spatial_index(self, monkeypatch):
+        """The KD-tree radius query matches a full distance scan"""
+        import aviation.airports as airports_module
+        
+        expected = search_airports_advanced(lat=51.47, lon=-0.45, radius_nm=25, limit=100)
+        
+        database = AirportDatabase(str(airports_module.get_airport_database().data_path))
+        monkeypatch.setattr(airports_module, 'cKDTree', None)
+        results = database.search_airports(
+            latitude=51.47, longitude=-0.45, radius_nm=25, limit=100
+        )
+        
+        assert results == expected
+
+    @pytest.mark.parametrize('use_grid', [True, False])
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_bounding_box_across_dateline(self, monkeypatch, use_numpy, use_grid):
+        """The grid and bounding-box prefilters keep airports on both sides of 180°"""
+        import aviation.airports as airports_module
+    
+        expected = search_airports_advanced(lat=-17.0, lon=179.5, radius_nm=300, limit=200)
+    
+        database = AirportDatabase(str(airports_module.get_airport_database().data_path))
+        monkeypatch.setattr(airports_module, 'cKDTree', None)
+        if not use_grid:
+            monkeypatch.setattr(airports_module, '_GRID_MAX_CELLS', 0)
+        if not use_numpy:
+            monkeypatch.setattr(airports_module, 'np', None)
+        results = database.search_airports(
+            latitude=-17.0, longitude=179.5, radius_nm=300, limit=200
+        )
+    
+        assert results == expected
+        assert any(a['longitude'] < 0 for a in results)
+        assert any(a['longitude'] > 0 for a in results)
+    
     def test_text_plus_geo_ranking(self):
         """Text + geo search ranks by score then distance"""
         results = search_airports_advanced(
@@ -403,5 +573,78 @@ class TestDataIntegrity:
         assert len(icaos) == len(unique_icaos)
 
 
+class TestBinaryCache:
+    """Test the parsed-airport cache used at startup"""
+    
+    @staticmethod
+    def _write_airports(path, airports):
+        import json
+        path.write_text(json.dumps(airports), encoding='utf-8')
+    
+    def test_second_load_skips_json(self, tmp_path, monkeypatch):
+        """A later database loads from the binary cache, not the JSON"""
+        import os
+        
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+        data_path = tmp_path / 'airports.json'
+        self._write_airports(data_path, [
+            {'icao': 'KAAA', 'iata': 'AAA', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0},
+        ])
+        expected = AirportDatabase(str(data_path)).get_airport_coordinates('KAAA')
+        
+        # Unparseable JSON with the same size and mtime: only the cache can
+        # answer
+        stat = data_path.stat()
+        data_path.write_bytes(b'x' * stat.st_size)
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        database = AirportDatabase(str(data_path))
+        
+        assert database.get_airport_coordinates('KAAA') == expected
+        assert database.search('alpha', 5)[0]['icao'] == 'KAAA'
+    
+    def test_changed_json_invalidates_cache(self, tmp_path, monkeypatch):
+        """Editing the JSON file is picked up on the next load"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+        data_path = tmp_path / 'airports.json'
+        self._write_airports(data_path, [
+            {'icao': 'KAAA', 'iata': '', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0},
+        ])
+        AirportDatabase(str(data_path))._load_airports()
+        
+        self._write_airports(data_path, [
+            {'icao': 'KBBB', 'iata': '', 'name': 'Bravo airfield', 'latitude': 3.0, 'longitude': 4.0},
+        ])
+        database = AirportDatabase(str(data_path))
+        
+        assert database.get_airport_coordinates('KAAA') is None
+        assert database.get_airport_coordinates('KBBB')['latitude'] == 3.0
+    
+    def test_concurrent_first_loads_parse_once(self, tmp_path, monkeypatch):
+        """Threads racing to load the same database read the file once"""
+        from concurrent.futures import ThreadPoolExecutor
+        import aviation.airports as airports_module
+        
+        monkeypatch.setenv('AVIATION_AIRPORTS_BINARY_CACHE', '0')
+        data_path = tmp_path / 'airports.json'
+        self._write_airports(data_path, [
+            {'icao': 'KAAA', 'iata': '', 'name': 'Alpha', 'latitude': 1.0, 'longitude': 2.0},
+        ])
+        parses = []
+        real_loads = airports_module.json.loads
+        
+        def counting_loads(data):
+            parses.append(1)
+            return real_loads(data)
+        
+        monkeypatch.setattr(airports_module, 'orjson', None)
+        monkeypatch.setattr(airports_module.json, 'loads', counting_loads)
+        database = AirportDatabase(str(data_path))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: database.get_airport_coordinates('KAAA'), range(32)))
+        
+        assert len(parses) == 1
+        assert all(result['icao'] == 'KAAA' for result in results)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,575 @@
+"""
+Tests for the Redis cache
+"""
+
+import asyncio
+import enum
+import fnmatch
+import json
+import math
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+from aviation.cache import AsyncRedisCache, CacheCodec, CacheConfig, JSONCodec, RedisCache
+from aviation.cache import redis_cache
+
+
+def _encode(value):
+    """Bytes as redis-py would send them"""
+    return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+
+class MemoryRedis:
+    """In-process stand-in for the Redis server commands RedisCache uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.executes = []
+        self.expires = []
+
+    def get(self, key):
+        return self.data.get(_encode(key))
+
+    def mget(self, keys):
+        return [self.data.get(_encode(key)) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[_encode(key)] = _encode(value)
+        return True
+
+    def sadd(self, key, *members):
+        members = {_encode(member) for member in members}
+        tag = self.data.setdefault(_encode(key), set())
+        added = len(members - tag)
+        tag |= members
+        return added
+
+    def smembers(self, key):
+        return set(self.data.get(_encode(key), set()))
+
+    def expire(self, key, ttl, nx=False, gt=False):
+        self.expires.append((_encode(key), ttl, nx, gt))
+        return _encode(key) in self.data
+
+    def delete(self, *keys):
+        return sum(self.data.pop(_encode(key), None) is not None for key in keys)
+
+    def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if match is None or fnmatch.fnmatchcase(key, _encode(match)):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+    def close(self):
+        pass
+
+
+class MemoryPipeline:
+    """Queues commands and runs them on execute(), like a redis-py pipeline"""
+
+    def __init__(self, server):
+        self.server = server
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        self.server.executes.append(len(commands))
+        return [getattr(self.server, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
+class AsyncMemoryRedis:
+    """MemoryRedis behind the redis.asyncio client interface"""
+
+    def __init__(self):
+        self.server = MemoryRedis()
+
+    def __getattr__(self, name):
+        command = getattr(self.server, name)
+
+        async def call(*args, **kwargs):
+            return command(*args, **kwargs)
+        return call
+
+    async def scan_iter(self, match=None, count=None):
+        for key in self.server.scan_iter(match=match, count=count):
+            yield key
+
+    def pipeline(self, transaction=True):
+        return AsyncMemoryPipeline(self.server)
+
+
+class AsyncMemoryPipeline(MemoryPipeline):
+    """MemoryPipeline whose execute() is awaited"""
+
+    async def execute(self):
+        return MemoryPipeline.execute(self)
+
+
+@pytest.fixture
+def cache():
+    """RedisCache backed by MemoryRedis"""
+    pytest.importorskip("redis")
+    cache = RedisCache(CacheConfig(key_prefix="test:", delete_batch_size=3))
+    cache._client = MemoryRedis()
+    return cache
+
+
+class TestJSONCodec:
+    """JSON codec shared with the TypeScript SDK"""
+
+    def test_round_trip(self):
+        """Values come back as json would return them"""
+        codec = JSONCodec()
+        value = {"icao": "KSFO", "elevation": 13, "runways": [{"length": 11870}], "lit": True}
+
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_output_is_plain_json(self):
+        """Encoded values parse with the stdlib (and JSON.parse in TypeScript)"""
+        codec = JSONCodec()
+
+        assert json.loads(codec.encode({1: "a", "b": None})) == {"1": "a", "b": None}
+
+    def test_reads_values_written_by_json_dumps(self):
+        """Non-standard tokens json.dumps emits still decode"""
+        codec = JSONCodec()
+
+        assert math.isnan(codec.decode(json.dumps({"x": float("nan")}).encode())["x"])
+
+    def test_wide_integers_fall_back_to_json(self):
+        """Integers orjson can't encode still round-trip"""
+        codec = JSONCodec()
+
+        assert codec.decode(codec.encode(2 ** 70)) == 2 ** 70
+
+    def test_non_finite_floats_encode_as_json_does(self):
+        """NaN and infinities are written as json.dumps writes them, not as null"""
+        codec = JSONCodec()
+        value = {"x": float("nan"), "y": [float("inf"), None], "z": -float("inf")}
+
+        assert codec.encode(value) == json.dumps(value).encode()
+        decoded = codec.decode(codec.encode(value))
+        assert math.isnan(decoded["x"])
+        assert decoded["y"] == [float("inf"), None]
+        assert decoded["z"] == -float("inf")
+
+    def test_rejects_what_json_rejects(self):
+        """Datetimes and dataclasses are not silently turned into strings"""
+        codec = JSONCodec()
+
+        @dataclass
+        class Point:
+            lat: float
+
+        for value in ({"at": datetime(2024, 1, 1, tzinfo=timezone.utc)}, Point(1.0)):
+            with pytest.raises(TypeError):
+                codec.encode(value)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_enum_encodes_as_its_value(self, monkeypatch, use_orjson):
+        """Enum members encode as their value, with or without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(redis_cache, "orjson", None)
+        codec = JSONCodec()
+
+        class Category(enum.Enum):
+            VFR = "VFR"
+
+        assert json.loads(codec.encode({"category": Category.VFR})) == {"category": "VFR"}
+        with pytest.raises(TypeError):
+            codec.encode({Category.VFR: 1})
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_uuid_encodes_as_string(self, monkeypatch, use_orjson):
+        """UUIDs encode as their string form, with or without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(redis_cache, "orjson", None)
+        codec = JSONCodec()
+        value = uuid.UUID(int=1)
+
+        assert json.loads(codec.encode([value])) == [str(value)]
+        with pytest.raises(TypeError):
+            codec.encode({value: 1})
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_datetime_keys_rejected(self, monkeypatch, use_orjson):
+        """Dict keys json can't coerce are rejected, with or without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(redis_cache, "orjson", None)
+
+        with pytest.raises(TypeError):
+            JSONCodec().encode({datetime(2024, 1, 1): 1})
+
+
+class TestCodecSelection:
+    """CacheConfig.codec picks the codec"""
+
+    def test_unknown_codec_rejected(self):
+        """Unknown codec names fail when the cache is created"""
+        pytest.importorskip("redis")
+
+        with pytest.raises(ValueError):
+            RedisCache(CacheConfig(codec="pickle"))
+
+    def test_custom_codec_instance(self):
+        """A CacheCodec instance is used as-is"""
+        pytest.importorskip("redis")
+        codec = JSONCodec()
+
+        assert RedisCache(CacheConfig(codec=codec))._codec is codec
+
+    def test_msgpack_requires_msgspec(self, monkeypatch):
+        """The msgpack codec explains how to install msgspec"""
+        pytest.importorskip("redis")
+        monkeypatch.setattr(redis_cache, "msgspec", None)
+
+        with pytest.raises(RuntimeError, match="msgspec"):
+            RedisCache(CacheConfig(codec="msgpack"))
+
+    def test_base_codec_is_abstract(self):
+        """CacheCodec only defines the interface"""
+        with pytest.raises(NotImplementedError):
+            CacheCodec().encode({})
+
+
+class TestDeletePattern:
+    """delete_pattern scans and deletes in pipelined batches"""
+
+    def test_deletes_only_matching_keys(self, cache):
+        """Matching keys are deleted and counted; others are kept"""
+        for i in range(7):
+            cache.set(f"metar:K{i:03d}", {"raw": i})
+        cache.set("taf:KSFO", {"raw": "TAF"})
+
+        assert cache.delete_pattern("metar:*") == 7
+        assert cache.get("taf:KSFO") == {"raw": "TAF"}
+        assert cache.get("metar:K000") is None
+        assert cache.metrics.deletes == 7
+
+    def test_deletes_in_batches(self, cache):
+        """DELs go out delete_batch_size at a time, plus the remainder"""
+        for i in range(7):
+            cache.set(f"metar:K{i:03d}", i)
+
+        cache.delete_pattern("metar:*")
+
+        assert cache._client.executes == [3, 3, 1]
+
+    def test_no_matches(self, cache):
+        """Nothing to delete sends no pipeline"""
+        assert cache.delete_pattern("metar:*") == 0
+        assert cache._client.executes == []
+
+
+class TestTags:
+    """set_tagged records keys per tag; invalidate_tag deletes just those"""
+
+    def test_invalidate_tag(self, cache):
+        """Only the tag's keys are deleted, in batches, along with the tag"""
+        for i in range(4):
+            assert cache.set_tagged(f"metar:K{i:03d}", {"raw": i}, tags=["metar", f"station:{i}"])
+        cache.set("metar:KSFO", "untagged")
+
+        assert cache.invalidate_tag("metar") == 4
+        assert cache._client.executes[-1] == 3  # DEL 3, DEL 1, DEL tag
+        assert cache.get("metar:K000") is None
+        assert cache.get("metar:KSFO") == "untagged"
+        assert b"test:tag:metar" not in cache._client.data
+        assert cache._client.data[b"test:tag:station:2"] == {b"test:metar:K002"}
+        assert cache.metrics.deletes == 4
+
+    def test_set_tagged_single_round_trip(self, cache):
+        """The value, tag sets and tag TTLs go out in one pipeline"""
+        cache.set_tagged("taf:KSFO", "TAF", tags=["taf", "station:KSFO"], ttl=600)
+
+        assert cache._client.executes == [7]
+        assert cache.get("taf:KSFO") == "TAF"
+        assert cache._client.expires == [
+            (b"test:tag:taf", 600, True, False),
+            (b"test:tag:taf", 600, False, True),
+            (b"test:tag:station:KSFO", 600, True, False),
+            (b"test:tag:station:KSFO", 600, False, True),
+        ]
+
+    def test_unknown_tag(self, cache):
+        """Invalidating a tag with no keys deletes nothing"""
+        assert cache.invalidate_tag("missing") == 0
+
+
+class TestBatchOperations:
+    """mget, mset and get_or_set_many"""
+
+    def test_mset_then_mget(self, cache):
+        """mset pipelines every SET; mget returns values in key order"""
+        assert cache.mset({"KSFO": {"elev": 13}, "KLAX": {"elev": 128}})
+
+        assert cache.mget(["KLAX", "KJFK", "KSFO"]) == [{"elev": 128}, None, {"elev": 13}]
+        assert cache._client.executes == [2]
+        assert (cache.metrics.sets, cache.metrics.hits, cache.metrics.misses) == (2, 2, 1)
+
+    def test_empty_batches(self, cache):
+        """Empty batches don't touch Redis"""
+        assert cache.mget([]) == []
+        assert cache.mset({})
+        assert cache._client.executes == []
+
+    def test_get_or_set_many(self, cache):
+        """Only the misses are computed, in one call, and then cached"""
+        cache.set("KSFO", "cached")
+        calls = []
+
+        def fetch(keys):
+            calls.append(keys)
+            return {key: f"fetched {key}" for key in keys}
+
+        result = cache.get_or_set_many(["KSFO", "KLAX", "KJFK"], fetch)
+
+        assert result == {"KSFO": "cached", "KLAX": "fetched KLAX", "KJFK": "fetched KJFK"}
+        assert calls == [["KLAX", "KJFK"]]
+        assert cache.get("KJFK") == "fetched KJFK"
+        assert cache.get_or_set_many(["KLAX", "KJFK"], fetch) == {
+            "KLAX": "fetched KLAX",
+            "KJFK": "fetched KJFK",
+        }
+        assert len(calls) == 1
+
+
+class TestClient:
+    """The connected client is kept on the instance"""
+
+    def test_client_cached_until_disconnect(self, cache):
+        """After connecting, `client` is a plain attribute; disconnect clears it"""
+        server = cache._client
+
+        assert cache.client is server
+        assert cache.__dict__["client"] is server
+
+        cache.disconnect()
+
+        assert "client" not in cache.__dict__
+        assert cache._client is None
+
+
+class TestConnectionPool:
+    """Caches with the same server settings share one connection pool"""
+
+    def test_pool_shared_by_settings(self):
+        """Equal settings reuse the pool; a different db gets its own"""
+        pytest.importorskip("redis")
+        config = CacheConfig(host="cache.test", pool_size=4)
+
+        pool = redis_cache._connection_pool(config)
+
+        assert redis_cache._connection_pool(CacheConfig(host="cache.test", pool_size=4)) is pool
+        assert redis_cache._connection_pool(CacheConfig(host="cache.test", pool_size=4, db=1)) is not pool
+        assert pool.max_connections == 4
+        assert pool.connection_kwargs["socket_keepalive"] is True
+        assert pool.connection_kwargs["decode_responses"] is False
+
+
+class TestMetrics:
+    """Per-thread counters summed by metrics/get_metrics"""
+
+    def test_counts_from_all_threads(self, cache):
+        """No increments are lost when threads use the cache concurrently"""
+        cache.set("KSFO", 1)
+
+        def lookups():
+            for _ in range(2000):
+                cache.get("KSFO")
+                cache.get("KLAX")
+
+        threads = [threading.Thread(target=lookups) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = cache.get_metrics()
+        assert (metrics.hits, metrics.misses, metrics.sets) == (8000, 8000, 1)
+        assert metrics.hit_rate == 50.0
+
+    def test_finished_threads_are_folded(self, cache):
+        """Counters of threads that have exited don't accumulate"""
+        cache.set("KSFO", 1)
+
+        for _ in range(50):
+            thread = threading.Thread(target=cache.get, args=("KSFO",))
+            thread.start()
+            thread.join()
+
+        assert len(cache._thread_metrics) <= 2
+        assert (cache.metrics.hits, cache.metrics.sets) == (50, 1)
+
+        cache.reset_metrics()
+        assert (cache.metrics.hits, cache.metrics.sets) == (0, 0)
+
+    def test_reset(self, cache):
+        """reset_metrics starts every thread from zero"""
+        cache.set("KSFO", 1)
+        cache.get("KSFO")
+
+        cache.reset_metrics()
+        cache.get("KSFO")
+
+        assert (cache.metrics.hits, cache.metrics.sets) == (1, 0)
+
+
+class TestKeys:
+    """Keys are the prefix plus the key, as bytes"""
+
+    def test_key_bytes(self, cache):
+        """str keys are UTF-8 encoded; bytes keys are used as-is"""
+        assert cache._key("metar:KSFO") == b"test:metar:KSFO"
+        assert cache._key(b"metar:KSFO") == b"test:metar:KSFO"
+        assert cache._key("métar") == "test:métar".encode("utf-8")
+
+    def test_other_keys_formatted_as_str(self, cache):
+        """Keys that are neither str nor bytes work as their str() form"""
+        assert cache._key(123) == b"test:123"
+
+        cache.set(123, "VFR")
+
+        assert cache.get(123) == "VFR"
+        assert cache.get("123") == "VFR"
+        assert cache.delete(123)
+        assert cache.get(123) is None
+
+    def test_stored_under_prefixed_key(self, cache):
+        """Values land under the prefixed key"""
+        cache.set("metar:KSFO", "VFR")
+
+        assert list(cache._client.data) == [b"test:metar:KSFO"]
+
+
+class TestErrors:
+    """Redis and codec failures degrade to misses; other bugs propagate"""
+
+    def test_redis_error_logged(self, cache, caplog):
+        """A Redis failure is logged and get reports a miss"""
+        import redis
+
+        def fail(key):
+            raise redis.exceptions.ConnectionError("connection refused")
+
+        cache._client.get = fail
+
+        with caplog.at_level("WARNING", logger="aviation.cache.redis_cache"):
+            assert cache.get("KSFO") is None
+        assert "Cache get error: connection refused" in caplog.text
+
+    def test_unencodable_value(self, cache):
+        """Values the codec rejects aren't cached"""
+        assert cache.set("KSFO", object()) is False
+        assert cache._client.data == {}
+
+    def test_other_errors_propagate(self, cache):
+        """Errors that aren't from Redis or the codec aren't swallowed"""
+        def broken(key):
+            raise AttributeError("bug")
+
+        cache._client.get = broken
+
+        with pytest.raises(AttributeError):
+            cache.get("KSFO")
+
+
+class TestAsyncRedisCache:
+    """AsyncRedisCache mirrors RedisCache as coroutines"""
+
+    @pytest.fixture
+    def async_cache(self):
+        pytest.importorskip("redis")
+        cache = AsyncRedisCache(CacheConfig(key_prefix="test:", delete_batch_size=3))
+        cache._client = AsyncMemoryRedis()
+        return cache
+
+    def test_set_get_and_batches(self, async_cache):
+        """Values round-trip through the codec; metrics count as in RedisCache"""
+        async def run():
+            assert await async_cache.set("KSFO", {"elev": 13})
+            assert await async_cache.mset({"KLAX": {"elev": 128}})
+            return (
+                await async_cache.get("KSFO"),
+                await async_cache.mget(["KLAX", "KJFK"]),
+            )
+
+        assert asyncio.run(run()) == ({"elev": 13}, [{"elev": 128}, None])
+        metrics = async_cache.get_metrics()
+        assert (metrics.hits, metrics.misses, metrics.sets) == (2, 1, 2)
+
+    def test_get_or_set_awaits_factory_once(self, async_cache):
+        """The coroutine function only runs on a miss"""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return "VFR"
+
+        async def run():
+            return [await async_cache.get_or_set("KSFO", fetch) for _ in range(3)]
+
+        assert asyncio.run(run()) == ["VFR"] * 3
+        assert calls == [1]
+
+    def test_get_or_set_many(self, async_cache):
+        """Only the misses are fetched, in one call"""
+        calls = []
+
+        async def fetch(keys):
+            calls.append(keys)
+            return {key: key.lower() for key in keys}
+
+        async def run():
+            await async_cache.set("KSFO", "cached")
+            return await async_cache.get_or_set_many(["KSFO", "KLAX"], fetch)
+
+        assert asyncio.run(run()) == {"KSFO": "cached", "KLAX": "klax"}
+        assert calls == [["KLAX"]]
+
+    def test_delete_pattern(self, async_cache):
+        """Matching keys are deleted in pipelined batches"""
+        async def run():
+            await async_cache.mset({f"metar:K{i:03d}": i for i in range(7)})
+            await async_cache.set("taf:KSFO", "TAF")
+            return await async_cache.delete_pattern("metar:*")
+
+        assert asyncio.run(run()) == 7
+        assert async_cache._client.server.executes == [7, 3, 3, 1]
+        assert list(async_cache._client.server.data) == [b"test:taf:KSFO"]
+
+    def test_tags(self, async_cache):
+        """set_tagged and invalidate_tag work as in RedisCache"""
+        async def run():
+            await async_cache.set_tagged("metar:KSFO", "VFR", tags=["metar"])
+            await async_cache.set_tagged("metar:KLAX", "IFR", tags=["metar"])
+            await async_cache.set("taf:KSFO", "TAF")
+            return await async_cache.invalidate_tag("metar")
+
+        assert asyncio.run(run()) == 2
+        assert list(async_cache._client.server.data) == [b"test:taf:KSFO"]
+
+    def test_redis_error_logged(self, async_cache, caplog):
+        """A Redis failure is logged and get reports a miss"""
+        import redis
+
+        async def fail(key):
+            raise redis.exceptions.ConnectionError("connection refused")
+
+        async_cache._client.get = fail
+
+        with caplog.at_level("WARNING", logger="aviation.cache.redis_cache"):
+            assert asyncio.run(async_cache.get("KSFO")) is None
+        assert "Cache get error: connection refused" in caplog.text
@@ -7,14 +7,17 @@ from datetime import datetime, timezone, timedelta
 from aviation.datetime import (
     utcnow,
     get_timezone,
+    resolve_tz,
     to_utc,
     from_utc,
     to_zulu,
     from_zulu,
     format_datetime,
+    format_datetime_batch,
     format_flight_time,
     parse_flight_time,
     calculate_sunrise_sunset,
+    calculate_sunrise_sunset_batch,
     is_night,
     add_flight_time,
 )
@@ -32,12 +35,21 @@ class TestDatetimeUtilities:
 
     def test_get_timezone(self):
         """Test timezone retrieval"""
-        import pytz
+        from zoneinfo import ZoneInfo
         
         tz = get_timezone('America/Los_Angeles')
-        assert isinstance(tz, pytz.tzinfo.BaseTzInfo)
+        assert isinstance(tz, ZoneInfo)
         assert str(tz) == 'America/Los_Angeles'
 
+    def test_get_timezone_unknown_uses_environment(self, monkeypatch):
+        """Unknown names fall back to AVIATION_TIMEZONE, read on every call"""
+        monkeypatch.setenv('AVIATION_TIMEZONE', 'Pacific/Auckland')
+        assert str(get_timezone('Not/AZone')) == 'Pacific/Auckland'
+        
+        monkeypatch.setenv('AVIATION_TIMEZONE', 'Europe/London')
+        assert str(get_timezone('Not/AZone')) == 'Europe/London'
+        assert get_timezone('Europe/London') is get_timezone('Europe/London')
+
     def test_to_utc_aware(self):
         """Test to_utc with timezone-aware datetime"""
         dt = datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
@@ -94,6 +106,11 @@ class TestDatetimeUtilities:
         zulu = to_zulu(dt)
         assert zulu == '2026-01-15T10:30:00Z'
 
+    def test_to_zulu_drops_fraction_and_offset(self):
+        """to_zulu converts to UTC and drops microseconds"""
+        dt = datetime(2026, 1, 15, 10, 30, 5, 999999, tzinfo=timezone(timedelta(hours=-8)))
+        assert to_zulu(dt) == '2026-01-15T18:30:05Z'
+
     def test_to_zulu_none(self):
         """Test to_zulu with None"""
         result = to_zulu(None)
@@ -136,6 +153,28 @@ class TestDatetimeUtilities:
         result = format_datetime(None)
         assert result == ''
 
+    def test_format_datetime_batch_matches_format_datetime(self):
+        """format_datetime_batch gives what format_datetime gives for each entry"""
+        dts = [
+            datetime(2026, 1, 15, 18, 30, 5, 123456, tzinfo=timezone.utc),
+            datetime(2026, 7, 1, 3, 0),
+            None,
+            datetime(5, 3, 1, 12, 0, tzinfo=timezone.utc),
+        ]
+        for format_str in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%B %d, %Y at %I:%M %p'):
+            expected = [format_datetime(dt, format_str, 'America/Los_Angeles') for dt in dts]
+            assert format_datetime_batch(dts, format_str, 'America/Los_Angeles') == expected
+        
+        assert format_datetime_batch(dts[:1], '%Y-%m-%dT%H:%M:%S', 'UTC') == ['2026-01-15T18:30:05']
+
+    def test_resolve_tz(self):
+        """resolve_tz is memoized and, unlike get_timezone, rejects unknown names"""
+        from zoneinfo import ZoneInfoNotFoundError
+        
+        assert resolve_tz('Pacific/Auckland') is resolve_tz('Pacific/Auckland')
+        with pytest.raises(ZoneInfoNotFoundError):
+            resolve_tz('Not/AZone')
+
     def test_format_flight_time_hours_minutes(self):
         """Test format_flight_time with hours and minutes"""
         assert format_flight_time(150) == '2h 30m'
@@ -212,6 +251,21 @@ class TestDatetimeUtilities:
         assert sf_rise != ny_rise
         assert sf_set != ny_set
 
+    def test_calculate_sunrise_sunset_batch_matches_scalar(self):
+        """Batch sunrise/sunset agrees with the scalar calculation"""
+        pytest.importorskip('numpy')
+        date = datetime(2026, 6, 21, 12, 0, tzinfo=timezone.utc)
+        # Includes polar day and polar night
+        latitudes = [37.7749, 40.7128, -33.8688, 78.2232, -77.8463, 0.0]
+        longitudes = [-122.4194, -74.0060, 151.2093, 15.6267, 166.6683, 180.0]
+        
+        sunrises, sunsets = calculate_sunrise_sunset_batch(latitudes, longitudes, date)
+        
+        for i, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+            sunrise, sunset = calculate_sunrise_sunset(lat, lon, date)
+            assert abs(sunrises[i].astype(datetime) - sunrise.replace(tzinfo=None)) <= timedelta(milliseconds=1)
+            assert abs(sunsets[i].astype(datetime) - sunset.replace(tzinfo=None)) <= timedelta(milliseconds=1)
+
     def test_calculate_sunrise_sunset_current_date(self):
         """Test sunrise/sunset with current date"""
         sunrise, sunset = calculate_sunrise_sunset(37.7749, -122.4194)
@@ -238,6 +292,17 @@ class TestDatetimeUtilities:
         result = is_night(37.7749, -122.4194, midnight_utc)
         assert isinstance(result, bool)
 
+    def test_is_night_reuses_daily_sun_events(self):
+        """Repeated checks on the same day reuse one sunrise/sunset calculation"""
+        from aviation.datetime.utils import _sun_event_hours
+        
+        base = datetime(2026, 1, 15, 0, 0, tzinfo=timezone.utc)
+        _sun_event_hours.cache_clear()
+        for minute in range(0, 24 * 60, 10):
+            is_night(37.7749, -122.4194, base + timedelta(minutes=minute))
+        
+        assert _sun_event_hours.cache_info().misses == 1
+
     def test_add_flight_time(self):
         """Test add_flight_time"""
         base = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
@@ -0,0 +1,96 @@
+"""
+Tests for the Google Calendar OAuth2 handler
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("google_auth_oauthlib")
+
+from aviation.integrations.google import auth as google_auth
+from aviation.integrations.google import GoogleCalendarAuth, GoogleCredentials, GoogleOAuthConfig
+
+
+@pytest.fixture
+def calendar_auth():
+    return GoogleCalendarAuth(GoogleOAuthConfig(
+        client_id='client-id',
+        client_secret='client-secret',
+        redirect_uri='https://app.test/callback',
+    ))
+
+
+class TestAuthorizationFlow:
+    """The callback completes the flow that produced the authorization URL"""
+
+    def test_callback_reuses_flow_and_code_verifier(self, calendar_auth):
+        """The token exchange sends the PKCE verifier behind the URL's challenge"""
+        url = calendar_auth.get_authorization_url(state='abc')
+        flow = calendar_auth._pending_flows['abc']
+        assert 'code_challenge=' in url
+        assert 'state=abc' in url
+
+        exchanged = []
+
+        def fetch_token(code):
+            exchanged.append((code, flow.code_verifier))
+            flow.oauth2session.token = {
+                'access_token': 'access',
+                'refresh_token': 'refresh',
+                'expires_at': 4102444800,
+            }
+
+        flow.fetch_token = fetch_token
+        credentials = calendar_auth.handle_callback('the-code', state='abc')
+
+        assert exchanged == [('the-code', flow.code_verifier)]
+        assert flow.code_verifier
+        assert credentials.access_token == 'access'
+        assert credentials.refresh_token == 'refresh'
+        assert 'abc' not in calendar_auth._pending_flows
+
+    def test_pending_flows_bounded(self, calendar_auth, monkeypatch):
+        """Only the most recent flows are kept"""
+        monkeypatch.setattr(google_auth, 'MAX_PENDING_FLOWS', 3)
+
+        for i in range(5):
+            calendar_auth.get_authorization_url(state=f'state-{i}')
+
+        assert list(calendar_auth._pending_flows) == ['state-2', 'state-3', 'state-4']
+
+    def test_generated_state_is_tracked(self, calendar_auth):
+        """Without a state, the flow is kept under the one it generated"""
+        url = calendar_auth.get_authorization_url()
+
+        (state,) = calendar_auth._pending_flows
+        assert f'state={state}' in url
+
+
+class TestTokenValidity:
+    """Tokens are valid until five minutes before they expire"""
+
+    @staticmethod
+    def _expiring_in(seconds):
+        return GoogleCredentials(
+            access_token='access',
+            token_type='Bearer',
+            expiry_date=int((time.time() + seconds) * 1000),
+        )
+
+    def test_buffer(self, calendar_auth):
+        """Tokens inside the five-minute buffer are already invalid"""
+        assert calendar_auth.is_token_valid(self._expiring_in(600))
+        assert not calendar_auth.is_token_valid(self._expiring_in(240))
+        assert not calendar_auth.is_token_valid(self._expiring_in(-60))
+        assert calendar_auth.is_token_valid(GoogleCredentials(access_token='access', token_type='Bearer'))
+
+    def test_expires_as_time_passes(self, calendar_auth, monkeypatch):
+        """A token checked once becomes invalid when its deadline passes"""
+        credentials = self._expiring_in(400)
+        assert calendar_auth.is_token_valid(credentials)
+
+        now_ns = time.monotonic_ns()
+        monkeypatch.setattr(google_auth.time, 'monotonic_ns', lambda: now_ns + 120 * 10**9)
+
+        assert not calendar_auth.is_token_valid(credentials)
@@ -0,0 +1,409 @@
+"""
+Tests for the Google Calendar clients
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from aviation.integrations.google import (
+    AsyncGoogleCalendarClient,
+    CalendarEvent,
+    GoogleCalendarAuth,
+    GoogleCalendarClient,
+    GoogleCredentials,
+    GoogleOAuthConfig,
+    ListEventsOptions,
+)
+from aviation.integrations.google import async_calendar
+from aviation.integrations.google import auth as auth_module
+from aviation.integrations.google.async_calendar import CALENDAR_API_URL
+from aviation.integrations.google.calendar import EVENT_DF_COLUMNS
+
+
+def _event(summary, event_id='evt-1'):
+    return {
+        'id': event_id,
+        'summary': summary,
+        'start': {'dateTime': '2026-01-15T10:00:00Z'},
+        'end': {'dateTime': '2026-01-15T11:00:00Z'},
+    }
+
+
+@pytest.fixture
+def calendar_auth():
+    return GoogleCalendarAuth(GoogleOAuthConfig(
+        client_id='client-id',
+        client_secret='client-secret',
+        redirect_uri='https://app.test/callback',
+    ))
+
+
+@pytest.fixture
+def credentials():
+    return GoogleCredentials(
+        access_token='access',
+        token_type='Bearer',
+        refresh_token='refresh',
+        expiry_date=int((time.time() + 3600) * 1000),
+    )
+
+
+def _client(calendar_auth, credentials, handler):
+    """Client whose requests go to handler instead of Google"""
+    client = AsyncGoogleCalendarClient(calendar_auth, credentials)
+    client._http = httpx.AsyncClient(base_url=CALENDAR_API_URL, transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncGoogleCalendarClient:
+    """REST calls made by AsyncGoogleCalendarClient"""
+
+    def test_list_events_multi(self, calendar_auth, credentials):
+        """Each calendar is listed with the same options, keyed by calendar ID"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            calendar_id = request.url.path.split('/')[-2]
+            return httpx.Response(200, json={'items': [_event(calendar_id)]})
+
+        async def run():
+            async with _client(calendar_auth, credentials, handler) as client:
+                return await client.list_events_multi(
+                    ['primary', 'crew#1@group.calendar.google.com'],
+                    ListEventsOptions(maxResults=5, orderBy='startTime'),
+                )
+
+        events = asyncio.run(run())
+
+        assert list(events) == ['primary', 'crew#1@group.calendar.google.com']
+        assert events['primary'][0].summary == 'primary'
+        assert requests[1].url.raw_path.startswith(
+            b'/calendar/v3/calendars/crew%231%40group.calendar.google.com/events?'
+        )
+        assert dict(requests[0].url.params) == {
+            'maxResults': '5', 'orderBy': 'startTime', 'singleEvents': 'true',
+        }
+        assert all(request.headers['Authorization'] == 'Bearer access' for request in requests)
+
+    def test_create_and_delete(self, calendar_auth, credentials):
+        """Events are sent as JSON bodies; DELETE's empty reply is fine"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.method == 'DELETE':
+                return httpx.Response(204)
+            return httpx.Response(200, json={**json.loads(request.content), 'id': 'evt-9'})
+
+        async def run():
+            async with _client(calendar_auth, credentials, handler) as client:
+                created = await client.create_event(
+                    CalendarEvent.from_dict(_event('Flight Training', event_id=None))
+                )
+                await client.delete_event(created.id)
+                return created
+
+        created = asyncio.run(run())
+
+        assert created.id == 'evt-9'
+        assert created.summary == 'Flight Training'
+        assert [request.method for request in requests] == ['POST', 'DELETE']
+        assert requests[1].url.path == '/calendar/v3/calendars/primary/events/evt-9'
+
+    def test_api_error(self, calendar_auth, credentials):
+        """Error responses raise like GoogleCalendarClient"""
+        def handler(request):
+            return httpx.Response(404, json={'error': {'message': 'Not Found'}})
+
+        async def run():
+            async with _client(calendar_auth, credentials, handler) as client:
+                await client.get_event('missing')
+
+        with pytest.raises(Exception, match='Google Calendar API error: 404'):
+            asyncio.run(run())
+
+    def test_expired_token_refreshed_once(self, calendar_auth, credentials, monkeypatch):
+        """Concurrent requests with an expired token share one refresh"""
+        credentials.expiry_date = int((time.time() - 60) * 1000)
+        refreshes = []
+
+        def refresh(refresh_token):
+            refreshes.append(refresh_token)
+            return GoogleCredentials(
+                access_token='fresh',
+                token_type='Bearer',
+                refresh_token=refresh_token,
+                expiry_date=int((time.time() + 3600) * 1000),
+            )
+
+        monkeypatch.setattr(calendar_auth, 'refresh_access_token', refresh)
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers['Authorization'])
+            return httpx.Response(200, json={'items': []})
+
+        async def run():
+            async with _client(calendar_auth, credentials, handler) as client:
+                await client.list_events_multi(['a', 'b', 'c'])
+
+        asyncio.run(run())
+
+        assert refreshes == ['refresh']
+        assert seen == ['Bearer fresh'] * 3
+
+    def test_token_refreshed_ahead_of_expiry(self, calendar_auth, credentials, monkeypatch):
+        """The token is swapped in the background before it would expire"""
+        buffer_s = auth_module._EXPIRY_BUFFER_MS / 1000 + async_calendar._REFRESH_AHEAD_S
+        credentials.expiry_date = int((time.time() + buffer_s + 0.05) * 1000)
+        refreshes = []
+
+        def refresh(refresh_token):
+            refreshes.append(refresh_token)
+            return GoogleCredentials(
+                access_token='fresh',
+                token_type='Bearer',
+                refresh_token=refresh_token,
+                expiry_date=int((time.time() + 3600) * 1000),
+            )
+
+        monkeypatch.setattr(calendar_auth, 'refresh_access_token', refresh)
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers['Authorization'])
+            return httpx.Response(200, json={'items': []})
+
+        async def run():
+            async with _client(calendar_auth, credentials, handler) as client:
+                await client.list_events()
+                await asyncio.sleep(0.3)
+                await client.list_events()
+                pending = client._refresh_task
+            await asyncio.sleep(0)
+            assert pending.cancelled()
+
+        asyncio.run(run())
+
+        assert refreshes == ['refresh']
+        assert seen == ['Bearer access', 'Bearer fresh']
+
+    def test_no_credentials(self, calendar_auth):
+        """Calls without credentials fail before any request"""
+        client = AsyncGoogleCalendarClient(calendar_auth)
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.list_calendars())
+
+
+class FakeEvents:
+    """events() resource whose methods return request descriptions"""
+
+    def insert(self, calendarId, body):
+        return ('insert', calendarId, body)
+
+    def update(self, calendarId, eventId, body):
+        return ('update', calendarId, eventId, body)
+
+    def delete(self, calendarId, eventId):
+        return ('delete', calendarId, eventId)
+
+    def list(self, calendarId, **params):
+        return FakeRequest({'items': [_event('Checkride', 'evt-1'), _event('Solo XC', 'evt-2')]})
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class FakeBatch:
+    """BatchHttpRequest that answers each request on execute()"""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, *self.service.respond(request))
+
+
+class FakeService:
+    """Calendar service recording the size of each batch sent"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.batch_sizes = []
+
+    def events(self):
+        return FakeEvents()
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+class TestBatchRequests:
+    """Bulk create/update/delete go out BATCH_SIZE requests at a time"""
+
+    @staticmethod
+    def _client(calendar_auth, credentials, respond):
+        client = GoogleCalendarClient(calendar_auth, credentials)
+        client._service = FakeService(respond)
+        return client
+
+    def test_batch_create_events(self, calendar_auth, credentials):
+        """Results come back in input order across batches"""
+        def respond(request):
+            _, _, body = request
+            return {**body, 'id': f"id-{body['summary']}"}, None
+
+        client = self._client(calendar_auth, credentials, respond)
+        events = [CalendarEvent.from_dict(_event(str(i), event_id=None)) for i in range(120)]
+
+        created = client.batch_create_events(events, calendar_id='crew')
+
+        assert client._service.batch_sizes == [50, 50, 20]
+        assert [event.id for event in created] == [f'id-{i}' for i in range(120)]
+
+    def test_failures_returned_per_request(self, calendar_auth, credentials):
+        """A failed request is reported in its slot; the rest still succeed"""
+        def respond(request):
+            _, _, event_id = request
+            if event_id == 'evt-2':
+                return None, RuntimeError('404 Not Found')
+            return '', None
+
+        client = self._client(calendar_auth, credentials, respond)
+
+        results = client.batch_delete_events(['evt-1', 'evt-2', 'evt-3'])
+
+        assert results[0] is None and results[2] is None
+        assert str(results[1]) == 'Google Calendar API error: 404 Not Found'
+
+    def test_batch_update_events(self, calendar_auth, credentials):
+        """Updates are keyed by event ID"""
+        def respond(request):
+            _, _, event_id, body = request
+            return {**body, 'id': event_id}, None
+
+        client = self._client(calendar_auth, credentials, respond)
+        event = CalendarEvent.from_dict(_event('Moved', event_id=None))
+
+        updated = client.batch_update_events({'evt-1': event, 'evt-2': event})
+
+        assert [(e.id, e.summary) for e in updated] == [('evt-1', 'Moved'), ('evt-2', 'Moved')]
+
+
+class TestListEventsDataFrame:
+    def test_list_events_df(self, calendar_auth, credentials):
+        pytest.importorskip('pandas')
+        client = TestBatchRequests._client(calendar_auth, credentials, respond=None)
+
+        df = client.list_events_df()
+
+        assert list(df.columns) == EVENT_DF_COLUMNS
+        assert list(df['id']) == ['evt-1', 'evt-2']
+        assert list(df['start.dateTime']) == ['2026-01-15T10:00:00Z'] * 2
+        assert df['location'].isna().all()
+
+
+class TestSharedHttp:
+    """Services send requests over the calling thread's long-lived Http"""
+
+    @staticmethod
+    def _transport(client):
+        return client._get_service().events().list(calendarId='primary').http.http
+
+    def test_clients_share_connections_per_thread(self, calendar_auth, credentials):
+        first = GoogleCalendarClient(calendar_auth, credentials)
+        second = GoogleCalendarClient(calendar_auth, credentials)
+
+        transport = self._transport(first)
+        assert transport is self._transport(second)
+
+        here = transport._http()
+        assert transport._http() is here
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(transport._http()))
+        thread.start()
+        thread.join()
+        assert other[0] is not here
+
+
+class TestServiceReuse:
+    """The built service survives token refreshes"""
+
+    def test_expired_token_refreshed_in_place(self, calendar_auth, credentials, monkeypatch):
+        def refresh(refresh_token):
+            return GoogleCredentials(
+                access_token='fresh',
+                token_type='Bearer',
+                refresh_token=refresh_token,
+                expiry_date=int((time.time() + 3600) * 1000),
+            )
+
+        monkeypatch.setattr(calendar_auth, 'refresh_access_token', refresh)
+        client = GoogleCalendarClient(calendar_auth, credentials)
+        service = client._get_service()
+
+        credentials.expiry_date = int((time.time() - 60) * 1000)
+
+        assert client._get_service() is service
+        assert client.credentials.access_token == 'fresh'
+        assert client._creds.token == 'fresh'
+
+    def test_set_credentials_same_grant(self, calendar_auth, credentials):
+        client = GoogleCalendarClient(calendar_auth, credentials)
+        service = client._get_service()
+
+        client.set_credentials(GoogleCredentials(
+            access_token='rotated',
+            token_type='Bearer',
+            refresh_token='refresh',
+            expiry_date=int((time.time() + 3600) * 1000),
+        ))
+
+        assert client._get_service() is service
+        assert client._creds.token == 'rotated'
+
+    def test_set_credentials_other_grant(self, calendar_auth, credentials):
+        client = GoogleCalendarClient(calendar_auth, credentials)
+        service = client._get_service()
+
+        client.set_credentials(GoogleCredentials(
+            access_token='other',
+            token_type='Bearer',
+            refresh_token='other-refresh',
+            expiry_date=int((time.time() + 3600) * 1000),
+        ))
+
+        assert client._get_service() is not service
+        assert client._creds.refresh_token == 'other-refresh'
+
+
+class TestCalendarEvent:
+    def test_to_dict_round_trip(self):
+        """Unset optional fields are left out of the API payload"""
+        data = {**_event('Checkride'), 'location': 'KPAO'}
+        event = CalendarEvent.from_dict(data)
+
+        assert event.to_dict() == data
+        assert not hasattr(event, '__dict__')
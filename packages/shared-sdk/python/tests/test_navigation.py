@@ -0,0 +1,93 @@
+"""
+Tests for navigation utilities
+"""
+
+import random
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from aviation.navigation import (
+    destination,
+    haversine_distance,
+    haversine_distance_batch,
+    initial_bearing,
+    normalize_bearing,
+    normalize_longitude,
+    wind_correction_angle,
+)
+
+
+class TestScalarFunctions:
+    """Results and errors are the same with or without the Numba kernels"""
+
+    def test_values(self):
+        """Known answers, for int and float arguments alike"""
+        assert haversine_distance(37.6213, -122.3790, 40.6413, -73.7781) == pytest.approx(2241.9, abs=0.1)
+        assert haversine_distance(0, 0, 0, 1, 'KM') == pytest.approx(111.19, abs=0.01)
+        assert initial_bearing(0, 0, 0, 1) == pytest.approx(90.0)
+        assert destination(0, 0, 60, 0) == pytest.approx((1.0, 0.0), abs=1e-3)
+
+    def test_other_number_types(self):
+        """Arguments math accepts, such as Decimal, still work"""
+        assert haversine_distance(Decimal(0), 0, 0, 1) == haversine_distance(0.0, 0.0, 0.0, 1.0)
+
+    def test_math_errors(self):
+        """Impossible wind triangles raise as math does"""
+        with pytest.raises(ValueError):
+            wind_correction_angle(100, 0, 90, 200)
+        with pytest.raises(ZeroDivisionError):
+            wind_correction_angle(0, 0, 90, 20)
+        with pytest.raises(OverflowError):
+            haversine_distance(10 ** 400, 0, 0, 1)
+
+    def test_import_does_not_load_numba(self):
+        """The kernels (and Numba) are only imported by the first call"""
+        code = (
+            "import sys, aviation.navigation as nav; "
+            "print('numba' in sys.modules, nav._nav_kernels.cache_info().currsize)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.split() == ["False", "0"]
+
+    def test_normalize(self):
+        """Angles wrap into range from either side, however far out"""
+        assert [normalize_bearing(b) for b in (-90, 360, 725.5, -1080)] == [270, 0, 5.5, 0]
+        assert [normalize_longitude(lon) for lon in (190, -190, 180, -540.5, 900)] == [-170, 170, -180, 179.5, -180]
+
+
+class TestHaversineDistanceBatch:
+    """haversine_distance_batch matches haversine_distance leg by leg"""
+
+    def test_route_legs(self):
+        """Each leg equals the scalar distance, in every unit"""
+        pytest.importorskip("numpy")
+        rng = random.Random(7)
+        lats = [rng.uniform(-89, 89) for _ in range(50)]
+        lons = [rng.uniform(-180, 180) for _ in range(50)]
+
+        for unit in ('NM', 'KM', 'MI', 'METERS'):
+            legs = haversine_distance_batch(lats[:-1], lons[:-1], lats[1:], lons[1:], unit)
+            expected = [
+                haversine_distance(lats[i], lons[i], lats[i + 1], lons[i + 1], unit)
+                for i in range(49)
+            ]
+            assert legs.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_broadcasts_one_point(self):
+        """A single point is measured against every point in the other arrays"""
+        pytest.importorskip("numpy")
+        distances = haversine_distance_batch(37.6213, -122.3790, [40.6413, 37.6213], [-73.7781, -122.3790])
+
+        assert distances.shape == (2,)
+        assert distances[0] == pytest.approx(haversine_distance(37.6213, -122.3790, 40.6413, -73.7781))
+        assert distances[1] == 0.0
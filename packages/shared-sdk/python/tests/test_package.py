@@ -0,0 +1,84 @@
+"""
+Tests for the aviation package entry point
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestLazySubpackages:
+    """Sub-packages are only imported when first accessed"""
+
+    def test_import_does_not_load_subpackages(self):
+        """Importing aviation alone does not execute weather or integrations"""
+        code = (
+            "import sys, importlib.util, aviation; "
+            "print(sorted(m for m in ('aviation.weather', 'aviation.integrations') "
+            "if m in sys.modules and not isinstance(sys.modules[m], importlib.util._LazyModule)), "
+            "'aviation.weather.metar' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[] False"
+
+    def test_attribute_access_imports_subpackage(self):
+        """Accessing a sub-package attribute imports it"""
+        import aviation
+
+        assert aviation.weather.__name__ == "aviation.weather"
+        assert "integrations" in dir(aviation)
+
+    def test_weather_is_none_without_its_dependencies(self):
+        """weather degrades to None, and star-imports still work, when httpx is missing"""
+        code = (
+            "import sys; sys.modules['httpx'] = None; "
+            "import aviation; from aviation import *; "
+            "print(aviation.weather, weather)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "None None"
+
+    def test_from_import_of_lazy_subpackage(self):
+        """from-imports out of a lazy sub-package load it transparently"""
+        from aviation.weather import metar
+
+        assert metar.__name__ == "aviation.weather.metar"
+
+    def test_airport_exports_are_lazy(self):
+        """Airport re-exports resolve from aviation.airports on first use"""
+        code = (
+            "import sys, aviation; "
+            "loaded = 'aviation.airports' in sys.modules; "
+            "from aviation import Airport; "
+            "print(loaded, Airport.__module__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False aviation.airports"
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ can be imported from the package"""
+        import aviation
+
+        for name in aviation.__all__:
+            assert getattr(aviation, name) is not None, name
@@ -14,6 +14,7 @@ const commands = {
   set: 'Set a secret value',
   delete: 'Delete a secret',
   services: 'List all services with secrets',
+  export: 'Print all secrets for a service as one line of JSON',
 };
 
 function showUsage() {
@@ -29,10 +30,15 @@ function showUsage() {
   console.log('  npm run keystore get foreflight-dashboard SECRET_KEY');
   console.log('  npm run keystore set foreflight-dashboard API_KEY "your-key-here"');
   console.log('  npm run keystore delete foreflight-dashboard OLD_KEY');
+  console.log('  npm run keystore export foreflight-dashboard');
+  console.log('\nPass --json to list or get for machine-readable output.');
 }
 
 async function main() {
-  const args = process.argv.slice(2);
+  const argv = process.argv.slice(2);
+  // --json: print a single line of JSON on stdout for scripted callers
+  const json = argv.includes('--json');
+  const args = argv.filter(arg => arg !== '--json');
   
   if (args.length === 0 || args[0] === 'help' || args[0] === '--help') {
     showUsage();
@@ -81,6 +87,11 @@ async function main() {
       const service = args[1];
       const keys = keystore.listKeys(service);
       
+      if (json) {
+        console.log(JSON.stringify({ keys: keys.sort() }));
+        break;
+      }
+      
       console.log(`\n🔑 Secrets for service: ${service}\n`);
       if (keys.length === 0) {
         console.log('   No secrets found for this service.');
@@ -103,6 +114,11 @@ async function main() {
       const key = args[2];
       const value = keystore.getSecret(service, key);
       
+      if (json) {
+        console.log(JSON.stringify({ value: value === undefined ? null : value }));
+        process.exit(value === undefined ? 1 : 0);
+      }
+      
       if (value === undefined) {
         console.log(`❌ Secret not found: ${service}:${key}`);
         process.exit(1);
@@ -149,6 +165,26 @@ async function main() {
       break;
     }
     
+    case 'export': {
+      if (args.length < 2) {
+        console.error('❌ Error: Service name required');
+        console.log('Usage: npm run keystore export <service>');
+        process.exit(1);
+      }
+      
+      // Single-line JSON so callers can batch-load a service's secrets
+      const service = args[1];
+      const values: Record<string, string> = {};
+      for (const key of keystore.listKeys(service)) {
+        const value = keystore.getSecret(service, key);
+        if (value !== undefined) {
+          values[key] = value;
+        }
+      }
+      console.log(JSON.stringify(values));
+      break;
+    }
+    
     default:
       console.error(`❌ Unknown command: ${command}`);
       showUsage();
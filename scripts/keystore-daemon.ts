@@ -0,0 +1,140 @@
+#!/usr/bin/env ts-node
+/**
+ * Keystore Daemon
+ *
+ * Keeps the decrypted keystore in memory and answers secret lookups over a
+ * Unix domain socket, so clients avoid spawning `npm run keystore` per key.
+ *
+ * Protocol: one JSON request per line, one JSON response per line. Every
+ * request carries "store", the real path of the keystore file the client
+ * wants; requests for any other store are refused.
+ *   {"op": "get", "store": "...", "service": "...", "key": "..."}  -> {"ok": true, "value": "..." | null}
+ *   {"op": "export", "store": "...", "service": "..."}             -> {"ok": true, "values": {...}}
+ *
+ * The socket is created mode 0600 in a per-user directory ($XDG_RUNTIME_DIR,
+ * else $XDG_CACHE_HOME/aviation-keystore), never in a shared one like /tmp.
+ *
+ * Usage: npm run keystore:daemon [socket-path]
+ */
+
+import * as fs from 'fs';
+import * as net from 'net';
+import * as os from 'os';
+import * as path from 'path';
+import { SecureKeyStore } from '../packages/keystore/src';
+
+function defaultSocketPath(): string {
+  if (process.env.AVIATION_KEYSTORE_SOCKET) {
+    return process.env.AVIATION_KEYSTORE_SOCKET;
+  }
+  if (process.env.XDG_RUNTIME_DIR) {
+    return path.join(process.env.XDG_RUNTIME_DIR, 'aviation-keystore.sock');
+  }
+  // Same private directory the Python client keeps its disk cache in
+  const cacheHome = process.env.XDG_CACHE_HOME || path.join(os.homedir(), '.cache');
+  const dir = path.join(cacheHome, 'aviation-keystore');
+  fs.mkdirSync(dir, { recursive: true, mode: 0o700 });
+  return path.join(dir, 'daemon.sock');
+}
+
+function fail(message: string): never {
+  console.error(`❌ ${message}`);
+  process.exit(1);
+}
+
+const workspaceRoot = fs.realpathSync(path.resolve(__dirname, '..'));
+const keystorePath = path.join(workspaceRoot, '.keystore');
+const socketPath = process.argv[2] || defaultSocketPath();
+
+// Refuse to serve from a directory someone else owns or can write to
+const socketDir = fs.statSync(path.dirname(socketPath));
+if (socketDir.uid !== process.getuid!() || (socketDir.mode & 0o022) !== 0) {
+  fail(`${path.dirname(socketPath)} must be owned by you and not group/world-writable`);
+}
+
+let keystore: SecureKeyStore | null = null;
+let loadedMtime = -1;
+
+// Reload whenever the store file changes (e.g. after `npm run keystore set`)
+function currentKeystore(): SecureKeyStore {
+  const mtime = fs.existsSync(keystorePath) ? fs.statSync(keystorePath).mtimeMs : 0;
+  if (keystore === null || mtime !== loadedMtime) {
+    keystore = new SecureKeyStore({ storePath: keystorePath });
+    loadedMtime = mtime;
+  }
+  return keystore;
+}
+
+function handle(request: any): object {
+  if (request?.store !== keystorePath) {
+    return { ok: false, error: `This daemon serves ${keystorePath} only` };
+  }
+  const store = currentKeystore();
+  switch (request?.op) {
+    case 'get': {
+      const value = store.getSecret(String(request.service), String(request.key));
+      return { ok: true, value: value === undefined ? null : value };
+    }
+    case 'export': {
+      const service = String(request.service);
+      const values: Record<string, string> = {};
+      for (const key of store.listKeys(service)) {
+        const value = store.getSecret(service, key);
+        if (value !== undefined) {
+          values[key] = value;
+        }
+      }
+      return { ok: true, values };
+    }
+    default:
+      return { ok: false, error: `Unknown op: ${request?.op}` };
+  }
+}
+
+const server = net.createServer(socket => {
+  let buffer = '';
+  socket.setEncoding('utf8');
+  socket.on('data', chunk => {
+    buffer += chunk;
+    let newline: number;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline);
+      buffer = buffer.slice(newline + 1);
+      let response: object;
+      try {
+        response = handle(JSON.parse(line));
+      } catch (error: any) {
+        response = { ok: false, error: error.message };
+      }
+      socket.write(JSON.stringify(response) + '\n');
+    }
+  });
+  socket.on('error', () => socket.destroy());
+});
+
+// Only clear away a stale socket of our own, never some other file
+const existing = fs.lstatSync(socketPath, { throwIfNoEntry: false });
+if (existing) {
+  if (!existing.isSocket() || existing.uid !== process.getuid!()) {
+    fail(`${socketPath} exists and is not a socket of yours; not replacing it`);
+  }
+  fs.unlinkSync(socketPath);
+}
+
+// Create the socket 0600 from the start, not chmod'ed after clients could connect
+const previousUmask = process.umask(0o177);
+server.listen(socketPath, () => {
+  process.umask(previousUmask);
+  fs.chmodSync(socketPath, 0o600);
+  console.log(`🔐 Keystore daemon listening on ${socketPath}`);
+});
+
+for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+  process.on(signal, () => {
+    server.close();
+    if (fs.existsSync(socketPath)) {
+      fs.unlinkSync(socketPath);
+    }
+    process.exit(0);
+  });
+}